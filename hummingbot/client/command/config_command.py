@@ -67,7 +67,8 @@ client_configs_to_display = ["autofill_import",
                              "create_command_timeout",
                              "other_commands_timeout",
                              "tables_format",
-                             "tick_size"]
+                             "tick_size",
+                             "clock_mode"]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
                              "output_pane",
@@ -63,6 +63,7 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
+        self._flush_markets_recorder()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(self.init_time * 1e3),
@@ -89,6 +90,14 @@ class ExportCommand:
             self.placeholder_mode = False
             self.app.hide_input = False
 
+    def _flush_markets_recorder(self,  # type: HummingbotApplication
+                                ):
+        """
+        Commits the fills and orders the markets recorder still has queued, so that queries on the database see them.
+        """
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush()
+
     def _get_trades_from_session(self,  # type: HummingbotApplication
                                  start_timestamp: int,
                                  session: Session,
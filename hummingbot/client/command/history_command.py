@@ -3,11 +3,11 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, TradeStats
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -40,30 +40,55 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
+        if days <= 0 and self.pnl_tracker is not None:
+            # The running trade statistics already cover every trade since the client started
+            if self.pnl_tracker.num_trades == 0:
                 self.notify("\n  No past trades to report.")
                 return
             if verbose:
                 self.list_trades(start_time)
             if self.strategy_name != "celo_arb":
-                safe_ensure_future(self.history_report(start_time, trades, precision))
+                safe_ensure_future(self.history_report(start_time, [], precision,
+                                                       trade_stats=self.pnl_tracker.trade_stats))
+            return
+        self._flush_markets_recorder()
+        with self.trade_fill_db.get_new_session() as session:
+            trade_columns: pd.DataFrame = PerformanceMetrics.load_trade_columns(
+                session,
+                int(start_time * 1e3),
+                config_file_path=self.strategy_file_name)
+        if len(trade_columns) == 0:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        if self.strategy_name != "celo_arb":
+            safe_ensure_future(self.history_report(start_time, [], precision, trade_columns=trade_columns))
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
-                             display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+                             display_report: bool = True,
+                             trade_stats: Optional[Dict[Tuple[str, str], TradeStats]] = None,
+                             trade_columns: Optional[pd.DataFrame] = None) -> Decimal:
+        """
+        Reports the performance of each market, either from the given trades, from the running statistics of the
+        trades of each market when trade_stats is given, or from the trade columns (as loaded by
+        PerformanceMetrics.load_trade_columns) when trade_columns is given.
+        """
+        if trade_stats is not None:
+            market_info: Set[Tuple[str, str]] = set(key for key, stats in trade_stats.items() if stats.num_trades > 0)
+        elif trade_columns is not None:
+            trade_columns_by_market: Dict[Tuple[str, str], pd.DataFrame] = dict(
+                tuple(trade_columns.groupby(["market", "symbol"], sort=False)))
+            market_info: Set[Tuple[str, str]] = set(trade_columns_by_market.keys())
+        else:
+            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -72,7 +97,15 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            if trade_stats is not None:
+                perf = await PerformanceMetrics.from_trade_stats(symbol, trade_stats[(market, symbol)], cur_balances)
+            elif trade_columns is not None:
+                perf = await PerformanceMetrics.from_trade_columns(symbol,
+                                                                   trade_columns_by_market[(market, symbol)],
+                                                                   cur_balances)
+            else:
+                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -192,12 +225,17 @@ class HistoryCommand:
 
         start_time = self.init_time
 
+        if self.pnl_tracker is not None:
+            return await self.history_report(start_time, [], display_report=False,
+                                             trade_stats=self.pnl_tracker.trade_stats)
+
+        self._flush_markets_recorder()
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
+            trade_columns: pd.DataFrame = PerformanceMetrics.load_trade_columns(
+                session,
                 int(start_time * 1e3),
-                session=session,
                 config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        avg_return = await self.history_report(start_time, [], display_report=False, trade_columns=trade_columns)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -208,6 +246,7 @@ class HistoryCommand:
 
         lines = []
 
+        self._flush_markets_recorder()
         with self.trade_fill_db.get_new_session() as session:
             queried_trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
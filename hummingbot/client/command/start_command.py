@@ -9,12 +9,15 @@ import pandas as pd
 import hummingbot.client.settings as settings
 from hummingbot import init_logging
 from hummingbot.client.command.gateway_api_manager import GatewayChainApiManager
+from hummingbot.client.config.client_config_map import ClockModeEnum
 from hummingbot.client.config.config_helpers import get_strategy_starter_file
 from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.connector.connector_status import get_connector_status, warning_messages
+from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import OracleRateUnavailable
@@ -44,6 +47,14 @@ class StartCommand(GatewayChainApiManager):
             else:
                 return func(*args, **kwargs)
 
+    def _add_clock_tick_triggers(self,  # type: HummingbotApplication
+                                 clock: Clock):
+        for market in self.markets.values():
+            clock.add_tick_trigger(market, MarketEvent.OrderFilled)
+            if isinstance(market, ExchangeBase):
+                for order_book in market.order_books.values():
+                    clock.add_tick_trigger(order_book, OrderBookEvent.TopOfBookChanged)
+
     def _strategy_uses_gateway_connector(self, required_exchanges: Set[str]) -> bool:
         exchange_settings: List[settings.ConnectorSetting] = [
             settings.AllConnectorSettings.get_connector_settings().get(e, None)
@@ -208,8 +219,14 @@ class StartCommand(GatewayChainApiManager):
         try:
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
-            self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            clock_mode = (ClockMode.EVENT_DRIVEN
+                          if self.client_config_map.clock_mode == ClockModeEnum.event_driven
+                          else ClockMode.REALTIME)
+            self.logger().info(f"Creating the {clock_mode.name.lower()} clock with tick size: {tick_size}")
+            self.clock = Clock(clock_mode, tick_size=tick_size)
+            if clock_mode is ClockMode.EVENT_DRIVEN:
+                # The order books are created while the markets get ready, the clock ticks every tick size until then
+                safe_ensure_future(self.wait_till_ready(self._add_clock_tick_triggers, self.clock), loop=self.ev_loop)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
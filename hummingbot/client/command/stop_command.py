@@ -53,12 +53,19 @@ class StopCommand:
         if self.markets_recorder is not None:
             self.markets_recorder.stop()
 
+        if self.pnl_tracker is not None:
+            self.pnl_tracker.stop()
+
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
+        if self.clock is not None:
+            self.clock.remove_tick_triggers()
+
         self.strategy_task = None
         self.strategy = None
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.pnl_tracker = None
         self.market_trading_pairs_map.clear()
@@ -233,6 +233,11 @@ class AutofillImportEnum(str, ClientConfigEnum):
     disabled = "disabled"
 
 
+class ClockModeEnum(str, ClientConfigEnum):
+    realtime = "realtime"
+    event_driven = "event_driven"
+
+
 class TelegramMode(BaseClientModel, ABC):
     @abstractmethod
     def get_notifiers(self, hb: "HummingbotApplication") -> List[TelegramNotifier]:
@@ -869,6 +874,16 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    clock_mode: ClockModeEnum = Field(
+        default=ClockModeEnum.realtime,
+        description="In realtime mode the clock ticks every tick size. In event_driven mode it also ticks as soon as"
+                    "\nan order book top changes or an order is filled, and at most every tick size otherwise.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"What clock mode do you want to use? ({'/'.join(list(ClockModeEnum))})"
+            ),
+        ),
+    )
 
     class Config:
         title = "client_config_map"
@@ -891,6 +906,12 @@ class ClientConfigMap(BaseClientModel):
             raise ValueError(f"The value must be one of {', '.join(list(AutofillImportEnum))}.")
         return v
 
+    @validator("clock_mode", pre=True)
+    def validate_clock_mode(cls, v: Union[str, ClockModeEnum]):
+        if isinstance(v, str) and v not in ClockModeEnum.__members__:
+            raise ValueError(f"The value must be one of {', '.join(list(ClockModeEnum))}.")
+        return v
+
     @validator("telegram_mode", pre=True)
     def validate_telegram_mode(cls, v: Union[(str, Dict) + tuple(TELEGRAM_MODES.values())]):
         if isinstance(v, tuple(TELEGRAM_MODES.values()) + (Dict,)):
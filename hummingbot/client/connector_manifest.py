@@ -0,0 +1,215 @@
+"""
+Connector metadata manifest.
+
+The metadata of the connectors (type, example pair, fees, domains...) is declared in the `*_utils` module of each
+connector. Importing all of them pulls in a large part of the connector tree, so the metadata is written once to a
+JSON manifest in the data directory, and read from it afterwards without importing any connector module. The manifest
+is rebuilt when its format version changes or when any module of a connector package changes (the utils modules
+often take their fees and domains from the constants modules), and can be regenerated with:
+
+    python -m hummingbot.client.connector_manifest
+
+The connector configuration keys are not serializable, the manifest only tells which module declares them, so they
+are imported when they are first needed.
+"""
+import hashlib
+import importlib
+import json
+import logging
+import os
+from decimal import Decimal
+from os import DirEntry, scandir
+from os.path import exists, join
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
+
+from hummingbot import data_path, root_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+
+CONNECTOR_MANIFEST_VERSION = 1
+CONNECTOR_MANIFEST_FILE_NAME = "connector_manifest.json"
+
+CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES = ["test_support", "utilities"]
+CONNECTOR_EXCEPTIONS = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+
+
+class ConnectorUtilsModule(NamedTuple):
+    type_name: str
+    connector_name: str
+    module_path: str
+    package_path: str
+
+
+def connector_manifest_path() -> str:
+    return join(data_path(), CONNECTOR_MANIFEST_FILE_NAME)
+
+
+def iter_connector_utils_modules() -> Iterator[ConnectorUtilsModule]:
+    """
+    Iterates over the utils modules of the connectors, except the gateway ones, without importing them.
+    """
+    connector_path: str = str(root_path() / "hummingbot" / "connector")
+    type_dirs: List[DirEntry] = sorted(
+        (f for f in scandir(connector_path)
+         if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES and f.name != "gateway"),
+        key=lambda f: f.name)
+    for type_dir in type_dirs:
+        connector_dirs: List[DirEntry] = sorted(
+            (f for f in scandir(type_dir.path) if f.is_dir() and exists(join(f.path, "__init__.py"))),
+            key=lambda f: f.name)
+        for connector_dir in connector_dirs:
+            if connector_dir.name.startswith("_") or connector_dir.name in CONNECTOR_EXCEPTIONS:
+                continue
+            yield ConnectorUtilsModule(
+                type_name=type_dir.name,
+                connector_name=connector_dir.name,
+                module_path=f"hummingbot.connector.{type_dir.name}.{connector_dir.name}.{connector_dir.name}_utils",
+                package_path=connector_dir.path,
+            )
+
+
+def connector_utils_fingerprint() -> str:
+    """
+    Hash of the contents of the modules of all the connector packages, to detect outdated manifests.
+    """
+    digest = hashlib.sha256()
+    for utils_module in iter_connector_utils_modules():
+        digest.update(utils_module.module_path.encode("utf8"))
+        module_file_names: List[str] = sorted(
+            f.name for f in scandir(utils_module.package_path) if f.is_file() and f.name.endswith(".py"))
+        for module_file_name in module_file_names:
+            digest.update(module_file_name.encode("utf8"))
+            with open(join(utils_module.package_path, module_file_name), "rb") as file:
+                digest.update(file.read())
+    return digest.hexdigest()
+
+
+def trade_fee_schema_to_json(trade_fee_schema: Optional[Union[TradeFeeSchema, List[float]]]) -> Any:
+    if not isinstance(trade_fee_schema, TradeFeeSchema):
+        # Legacy [maker percent fee, taker percent fee] lists are kept as they are
+        return [str(fee) for fee in trade_fee_schema] if trade_fee_schema is not None else None
+    return {
+        "percent_fee_token": trade_fee_schema.percent_fee_token,
+        "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+        "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+        "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+        "maker_fixed_fees": [token_amount.to_json() for token_amount in trade_fee_schema.maker_fixed_fees],
+        "taker_fixed_fees": [token_amount.to_json() for token_amount in trade_fee_schema.taker_fixed_fees],
+    }
+
+
+def trade_fee_schema_from_json(data: Any) -> Optional[Union[TradeFeeSchema, List[float]]]:
+    if not isinstance(data, dict):
+        return data
+    return TradeFeeSchema(
+        percent_fee_token=data["percent_fee_token"],
+        maker_percent_fee_decimal=Decimal(data["maker_percent_fee_decimal"]),
+        taker_percent_fee_decimal=Decimal(data["taker_percent_fee_decimal"]),
+        buy_percent_fee_deducted_from_returns=data["buy_percent_fee_deducted_from_returns"],
+        maker_fixed_fees=[TokenAmount.from_json(token_amount) for token_amount in data["maker_fixed_fees"]],
+        taker_fixed_fees=[TokenAmount.from_json(token_amount) for token_amount in data["taker_fixed_fees"]],
+    )
+
+
+def load_connector_config_keys(config_keys_spec: Dict[str, Optional[str]]) -> Any:
+    """
+    Imports the configuration keys of a connector, or of one of its other domains, described in the manifest.
+    """
+    util_module = importlib.import_module(config_keys_spec["module"])
+    domain: Optional[str] = config_keys_spec["domain"]
+    if domain is None:
+        return getattr(util_module, "KEYS", None)
+    return getattr(util_module, "OTHER_DOMAINS_KEYS")[domain]
+
+
+def build_connector_manifest() -> Dict[str, Any]:
+    """
+    Builds the manifest by importing the utils module of every connector.
+    """
+    connectors: List[Dict[str, Any]] = []
+    for utils_module in iter_connector_utils_modules():
+        try:
+            util_module = importlib.import_module(utils_module.module_path)
+        except ModuleNotFoundError:
+            continue
+        connectors.append({
+            "name": utils_module.connector_name,
+            "type": utils_module.type_name,
+            "centralised": getattr(util_module, "CENTRALIZED", True),
+            "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+            "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            "trade_fee_schema": trade_fee_schema_to_json(getattr(util_module, "DEFAULT_FEES", None)),
+            "config_keys": ({"module": utils_module.module_path, "domain": None}
+                            if getattr(util_module, "KEYS", None) is not None
+                            else None),
+            "is_sub_domain": False,
+            "parent_name": None,
+            "domain_parameter": None,
+            "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+        })
+        for domain in getattr(util_module, "OTHER_DOMAINS", []):
+            domain_trade_fee_schema = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+            connectors.append({
+                "name": domain,
+                "type": utils_module.type_name,
+                "centralised": getattr(util_module, "CENTRALIZED", True),
+                "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                "trade_fee_schema": trade_fee_schema_to_json(domain_trade_fee_schema),
+                "config_keys": ({"module": utils_module.module_path, "domain": domain}
+                                if getattr(util_module, "OTHER_DOMAINS_KEYS")[domain] is not None
+                                else None),
+                "is_sub_domain": True,
+                "parent_name": utils_module.connector_name,
+                "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            })
+    return {
+        "version": CONNECTOR_MANIFEST_VERSION,
+        "fingerprint": connector_utils_fingerprint(),
+        "connectors": connectors,
+    }
+
+
+def load_connector_manifest(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Reads the manifest, if it exists and is up to date.
+    """
+    path = path or connector_manifest_path()
+    try:
+        with open(path) as file:
+            manifest: Dict[str, Any] = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(manifest, dict)
+            or manifest.get("version") != CONNECTOR_MANIFEST_VERSION
+            or manifest.get("fingerprint") != connector_utils_fingerprint()):
+        return None
+    return manifest
+
+
+def save_connector_manifest(manifest: Dict[str, Any], path: Optional[str] = None):
+    path = path or connector_manifest_path()
+    temporary_path: str = f"{path}.tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(manifest, file, indent=1)
+    os.replace(temporary_path, path)
+
+
+def get_connector_manifest(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Returns the manifest from its file, or builds and saves it when it is missing or outdated.
+    """
+    manifest: Optional[Dict[str, Any]] = load_connector_manifest(path)
+    if manifest is None:
+        manifest = build_connector_manifest()
+        try:
+            save_connector_manifest(manifest, path)
+        except OSError:
+            logging.getLogger(__name__).warning("Could not save the connector manifest.", exc_info=True)
+    return manifest
+
+
+if __name__ == "__main__":
+    generated_manifest: Dict[str, Any] = build_connector_manifest()
+    save_connector_manifest(generated_manifest)
+    print(f"Wrote the metadata of {len(generated_manifest['connectors'])} connectors to {connector_manifest_path()}.")
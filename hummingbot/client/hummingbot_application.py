@@ -20,6 +20,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.gateway_ssl_config_map import SSLConfigMap
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
+from hummingbot.client.performance import PnLTracker
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
@@ -103,6 +104,7 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.pnl_tracker: Optional[PnLTracker] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
@@ -304,9 +306,18 @@ class HummingbotApplication(*commands):
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            write_behind=True,
         )
         self.markets_recorder.start()
 
+        self.pnl_tracker = PnLTracker()
+        with self.trade_fill_db.get_new_session() as session:
+            self.pnl_tracker.add_trade_fills(self._get_trades_from_session(
+                int(self.init_time * 1e3),
+                session=session,
+                config_file_path=self.strategy_file_name))
+        self.pnl_tracker.start(list(self.markets.values()))
+
     def _initialize_notifiers(self):
         self.notifiers.extend(
             [
@@ -1,12 +1,22 @@
+import asyncio
+import json
 import logging
+import threading
 from collections import defaultdict
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import BigInteger, Text, type_coerce
+from sqlalchemy.orm import Session
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
-from hummingbot.core.data_type.trade_fee import TokenAmount
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
@@ -15,9 +25,211 @@ s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
 
+class _AggregatedPositionOrder:
+    # Fills of one order aggregated the same way as PerformanceMetrics.aggregate_orders does
+    __slots__ = ("price_sum", "fills", "amount", "position_key", "position_index")
+
+    def __init__(self, position_key: Optional[Tuple[str, str]]):
+        self.price_sum: Decimal = s_decimal_0
+        self.fills: int = 0
+        self.amount: Decimal = s_decimal_0
+        self.position_key: Optional[Tuple[str, str]] = position_key
+        self.position_index: int = -1
+
+    @property
+    def price(self) -> Decimal:
+        return self.price_sum / self.fills
+
+
+class TradeStats:
+    """
+    Running trade statistics of one market and trading pair, updated in constant time for each fill.
+    Volumes follow the PerformanceMetrics sign convention (bought base and sold quote are positive), and the realized
+    derivatives PnL pairs open and close position orders the same way PerformanceMetrics._calculate_trade_pnl does.
+    """
+    _POSITION_COUNTERPARTS: Dict[Tuple[str, str], Tuple[str, str]] = {
+        (TradeType.BUY.name, PositionAction.OPEN.value): (TradeType.SELL.name, PositionAction.CLOSE.value),
+        (TradeType.SELL.name, PositionAction.CLOSE.value): (TradeType.BUY.name, PositionAction.OPEN.value),
+        (TradeType.SELL.name, PositionAction.OPEN.value): (TradeType.BUY.name, PositionAction.CLOSE.value),
+        (TradeType.BUY.name, PositionAction.CLOSE.value): (TradeType.SELL.name, PositionAction.OPEN.value),
+    }
+
+    def __init__(self):
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.start_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self.derivative_pnl: Decimal = s_decimal_0
+
+        self._nil_position_buys: int = 0
+        self._nil_position_sells: int = 0
+        self._orders: Dict[Tuple[str, str], _AggregatedPositionOrder] = {}
+        self._position_orders: Dict[Tuple[str, str], List[_AggregatedPositionOrder]] = {
+            key: [] for key in self._POSITION_COUNTERPARTS
+        }
+        self._position_pair_pnls: Dict[Tuple[Tuple[str, str], int], Decimal] = {}
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def is_derivative(self) -> bool:
+        return ((self.num_buys > 0 and self._nil_position_buys == 0)
+                or (self.num_sells > 0 and self._nil_position_sells == 0))
+
+    def add_trade(self,
+                  trade_type: str,
+                  price: Decimal,
+                  amount: Decimal,
+                  order_id: str,
+                  position: Optional[str],
+                  trade_fee: Union[Dict[str, Any], TradeFeeBase],
+                  quote: str):
+        trade_type = trade_type.upper()
+        if trade_type == TradeType.BUY.name:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote -= amount * price
+            self._nil_position_buys += 1 if position == PositionAction.NIL.value else 0
+        elif trade_type == TradeType.SELL.name:
+            self.num_sells += 1
+            self.s_vol_base -= amount
+            self.s_vol_quote += amount * price
+            self._nil_position_sells += 1 if position == PositionAction.NIL.value else 0
+        else:
+            return
+
+        if self.start_price is None:
+            self.start_price = price
+        self.last_price = price
+        self._add_fees(price, amount, trade_fee, quote)
+        self._add_position_fill(trade_type, price, amount, order_id, position)
+
+    def add_trade_fill(self, trade: TradeFill):
+        self.add_trade(trade_type=trade.trade_type,
+                       price=Decimal(str(trade.price)),
+                       amount=Decimal(str(trade.amount)),
+                       order_id=trade.order_id,
+                       position=trade.position,
+                       trade_fee=trade.trade_fee,
+                       quote=trade.quote_asset)
+
+    def _add_fees(self, price: Decimal, amount: Decimal, trade_fee: Union[Dict[str, Any], TradeFeeBase], quote: str):
+        if isinstance(trade_fee, dict):
+            fee_percent = Decimal(str(trade_fee["percent"])) if trade_fee.get("percent") is not None else s_decimal_0
+            flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
+                         for flat_fee in trade_fee.get("flat_fees", [])]
+        else:
+            fee_percent = Decimal(trade_fee.percent) if trade_fee.percent is not None else s_decimal_0
+            flat_fees = trade_fee.flat_fees
+        if fee_percent > 0:
+            self.fees[quote] += price * amount * fee_percent
+        for flat_fee in flat_fees:
+            self.fees[flat_fee.token] += flat_fee.amount
+
+    def _add_position_fill(self, trade_type: str, price: Decimal, amount: Decimal, order_id: str,
+                           position: Optional[str]):
+        order: Optional[_AggregatedPositionOrder] = self._orders.get((trade_type, order_id))
+        if order is None:
+            position_key: Tuple[str, str] = (trade_type, position)
+            order = _AggregatedPositionOrder(position_key if position_key in self._POSITION_COUNTERPARTS else None)
+            if order.position_key is not None:
+                position_orders: List[_AggregatedPositionOrder] = self._position_orders[order.position_key]
+                order.position_index = len(position_orders)
+                position_orders.append(order)
+            self._orders[(trade_type, order_id)] = order
+        order.price_sum += price
+        order.fills += 1
+        order.amount += amount
+
+        if order.position_key is not None:
+            counterparts: List[_AggregatedPositionOrder] = self._position_orders[
+                self._POSITION_COUNTERPARTS[order.position_key]]
+            if order.position_index < len(counterparts):
+                self._update_position_pair_pnl(order, counterparts[order.position_index])
+
+    def _update_position_pair_pnl(self, order: _AggregatedPositionOrder, counterpart: _AggregatedPositionOrder):
+        if order.position_key[1] == PositionAction.OPEN.value:
+            open_order, close_order = order, counterpart
+        else:
+            open_order, close_order = counterpart, order
+        if open_order.position_key[0] == TradeType.BUY.name:
+            pnl = (close_order.price - open_order.price) * close_order.amount
+        else:
+            pnl = (open_order.price - close_order.price) * close_order.amount
+        pair_key: Tuple[Tuple[str, str], int] = (open_order.position_key, open_order.position_index)
+        self.derivative_pnl += pnl - self._position_pair_pnls.get(pair_key, s_decimal_0)
+        self._position_pair_pnls[pair_key] = pnl
+
+
+class PnLTracker:
+    """
+    Keeps TradeStats for every market and trading pair, fed by the OrderFilled events of the markets once started.
+    It is backfilled from the trades database when created, so readers (the history command, the kill switch and the
+    trade monitor) don't need to reload and reprocess every trade each time they need the performance.
+    """
+
+    def __init__(self):
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._trade_stats: Dict[Tuple[str, str], TradeStats] = {}
+        self._markets: List[Any] = []
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def trade_stats(self) -> Dict[Tuple[str, str], TradeStats]:
+        return self._trade_stats
+
+    @property
+    def num_trades(self) -> int:
+        return sum(stats.num_trades for stats in self._trade_stats.values())
+
+    def start(self, markets: List[Any]):
+        self._markets = markets
+        for market in self._markets:
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+        self._markets = []
+
+    def add_trade_fills(self, trades: List[TradeFill]):
+        for trade in trades:
+            self._stats_for(trade.market, trade.symbol).add_trade_fill(trade)
+
+    def _stats_for(self, market: str, trading_pair: str) -> TradeStats:
+        stats: Optional[TradeStats] = self._trade_stats.get((market, trading_pair))
+        if stats is None:
+            stats = TradeStats()
+            self._trade_stats[(market, trading_pair)] = stats
+        return stats
+
+    def _did_fill_order(self, event_tag: int, market: Any, evt: OrderFilledEvent):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
+            return
+
+        _, quote = split_hb_trading_pair(evt.trading_pair)
+        self._stats_for(market.display_name, evt.trading_pair).add_trade(
+            trade_type=evt.trade_type.name,
+            price=Decimal(str(evt.price)),
+            amount=Decimal(str(evt.amount)),
+            order_id=evt.order_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+            trade_fee=evt.trade_fee,
+            quote=quote)
+
+
 @dataclass
 class PerformanceMetrics:
     _logger = None
+    TRADE_COLUMNS = ["market", "symbol", "trade_type", "price", "amount", "order_id", "position", "trade_fee"]
 
     num_buys: int = 0
     num_sells: int = 0
@@ -71,6 +283,68 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def from_trade_columns(cls,
+                                 trading_pair: str,
+                                 trades: pd.DataFrame,
+                                 current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_trade_columns(trading_pair, trades, current_balances)
+        return performance
+
+    @classmethod
+    async def from_trade_stats(cls,
+                               trading_pair: str,
+                               trade_stats: TradeStats,
+                               current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_trade_stats(trading_pair, trade_stats, current_balances)
+        return performance
+
+    @staticmethod
+    def load_trade_columns(session: Session,
+                           start_timestamp: Optional[int] = None,
+                           config_file_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        Loads the trade fills needed for the performance metrics with a single query, as columns.
+        Prices and amounts are read as the raw scaled integers stored in the database and converted to floats in bulk,
+        and the trade fees are kept as their JSON text, to skip the per row conversions of the ORM.
+        :param session: the trades database session
+        :param start_timestamp: the minimum timestamp (in milliseconds) of the trades to load
+        :param config_file_path: if given, only trades of config files matching it are loaded
+        :return: a DataFrame with one row per trade fill in ascending timestamp order
+        """
+        filters = []
+        if start_timestamp is not None:
+            filters.append(TradeFill.timestamp >= start_timestamp)
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        query = (session
+                 .query(TradeFill.market,
+                        TradeFill.symbol,
+                        TradeFill.trade_type,
+                        type_coerce(TradeFill.price, BigInteger).label("price"),
+                        type_coerce(TradeFill.amount, BigInteger).label("amount"),
+                        TradeFill.order_id,
+                        TradeFill.position,
+                        type_coerce(TradeFill.trade_fee, Text).label("trade_fee"))
+                 .filter(*filters)
+                 .order_by(TradeFill.timestamp.asc()))
+        trades = pd.DataFrame(query.all(), columns=PerformanceMetrics.TRADE_COLUMNS)
+        trades["price"] = trades["price"].to_numpy(dtype=np.float64) / TradeFill.price.type.multiplier_int
+        trades["amount"] = trades["amount"].to_numpy(dtype=np.float64) / TradeFill.amount.type.multiplier_int
+        return trades
+
+    @staticmethod
+    def trade_columns_from_trades(trades: List[TradeFill]) -> pd.DataFrame:
+        """
+        Builds the trade columns of load_trade_columns from TradeFill objects
+        """
+        trades = pd.DataFrame([(t.market, t.symbol, t.trade_type, float(t.price), float(t.amount), t.order_id,
+                                t.position, json.dumps(t.trade_fee)) for t in trades],
+                              columns=PerformanceMetrics.TRADE_COLUMNS)
+        return trades
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -194,6 +468,11 @@ class PerformanceMetrics:
                 self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
                 self.s_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price))
 
+        self._calculate_volume_totals()
+
+        return buys, sells
+
+    def _calculate_volume_totals(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -204,8 +483,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     async def _calculate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
             fee_percent = None
@@ -230,6 +507,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -277,22 +557,164 @@ class PerformanceMetrics:
         :param current_balances: current user account balance
         """
 
-        base, quote = split_hb_trading_pair(trading_pair)
+        _, quote = split_hb_trading_pair(trading_pair)
         buys, sells = self._preprocess_trades_and_group_by_type(trades)
 
         self.num_buys = len(buys)
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  Decimal(str(trades[0].price)),
+                                                  Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_trade_stats(self,
+                                                   trading_pair: str,
+                                                   trade_stats: TradeStats,
+                                                   current_balances: Dict[str, Decimal]):
+        """
+        Calculates the same metrics as _initialize_metrics, from the running statistics of the trades
+        :param trading_pair: the trading market to get performance metrics
+        :param trade_stats: the running statistics of the trades of the market
+        :param current_balances: current user account balance
+        """
+        _, quote = split_hb_trading_pair(trading_pair)
+        self.num_buys = trade_stats.num_buys
+        self.num_sells = trade_stats.num_sells
+        self.num_trades = trade_stats.num_trades
+        self.b_vol_base = trade_stats.b_vol_base
+        self.b_vol_quote = trade_stats.b_vol_quote
+        self.s_vol_base = trade_stats.s_vol_base
+        self.s_vol_quote = trade_stats.s_vol_quote
+        self._calculate_volume_totals()
+
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  trade_stats.start_price,
+                                                  trade_stats.last_price)
+        self.trade_pnl = trade_stats.derivative_pnl if trade_stats.is_derivative else self.cur_value - self.hold_value
+
+        self.fees.update(trade_stats.fees)
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_trade_columns(self,
+                                                     trading_pair: str,
+                                                     trades: pd.DataFrame,
+                                                     current_balances: Dict[str, Decimal]):
+        """
+        Calculates the same metrics as _initialize_metrics with array operations over the trade columns, as loaded by
+        load_trade_columns. Sums are calculated in floating point and converted to Decimal at the end.
+        :param trading_pair: the trading market to get performance metrics
+        :param trades: the trade columns of the market
+        :param current_balances: current user account balance
+        """
+        _, quote = split_hb_trading_pair(trading_pair)
+        trade_types: np.ndarray = trades["trade_type"].str.upper().to_numpy()
+        prices: np.ndarray = trades["price"].to_numpy(dtype=np.float64)
+        amounts: np.ndarray = trades["amount"].to_numpy(dtype=np.float64)
+        notionals: np.ndarray = prices * amounts
+        is_buy: np.ndarray = trade_types == TradeType.BUY.name
+        is_sell: np.ndarray = trade_types == TradeType.SELL.name
+
+        self.num_buys = int(is_buy.sum())
+        self.num_sells = int(is_sell.sum())
+        self.num_trades = self.num_buys + self.num_sells
+        self.b_vol_base = self._to_decimal(amounts[is_buy].sum())
+        self.b_vol_quote = self._to_decimal(-notionals[is_buy].sum())
+        self.s_vol_base = self._to_decimal(-amounts[is_sell].sum())
+        self.s_vol_quote = self._to_decimal(notionals[is_sell].sum())
+        self._calculate_volume_totals()
+
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  self._to_decimal(prices[0]),
+                                                  self._to_decimal(prices[-1]))
+        self.trade_pnl = self.cur_value - self.hold_value
+        positions: np.ndarray = trades["position"].to_numpy()
+        if ((self.num_buys > 0 and not (positions[is_buy] == PositionAction.NIL.value).any())
+                or (self.num_sells > 0 and not (positions[is_sell] == PositionAction.NIL.value).any())):
+            self.trade_pnl = self._to_decimal(self._derivative_pnl_from_trade_columns(trades, trade_types))
+
+        self._calculate_fees_from_trade_columns(quote, trades["trade_fee"], notionals)
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    @staticmethod
+    def _derivative_pnl_from_trade_columns(trades: pd.DataFrame, trade_types: np.ndarray) -> float:
+        # Same pairing as _calculate_trade_pnl: fills aggregated by order (average price, total amount, first position)
+        # then the n-th open position order of a side is matched with the n-th close position order of the other side.
+        orders = (trades
+                  .assign(trade_type=trade_types)
+                  .groupby(["trade_type", "order_id"], sort=False)
+                  .agg(price=("price", "mean"), amount=("amount", "sum"), position=("position", "first"))
+                  .reset_index())
+
+        def position_orders(trade_type: TradeType, position: PositionAction) -> pd.DataFrame:
+            return orders[(orders["trade_type"] == trade_type.name) & (orders["position"] == position.value)]
+
+        pnl = 0.0
+        for open_side, close_side, direction in ((TradeType.BUY, TradeType.SELL, 1.0),
+                                                 (TradeType.SELL, TradeType.BUY, -1.0)):
+            open_orders = position_orders(open_side, PositionAction.OPEN)
+            close_orders = position_orders(close_side, PositionAction.CLOSE)
+            pairs = min(len(open_orders), len(close_orders))
+            open_prices = open_orders["price"].to_numpy()[:pairs]
+            close_prices = close_orders["price"].to_numpy()[:pairs]
+            close_amounts = close_orders["amount"].to_numpy()[:pairs]
+            pnl += float((direction * (close_prices - open_prices) * close_amounts).sum())
+        return pnl
+
+    def _calculate_fees_from_trade_columns(self, quote: str, trade_fees: pd.Series, notionals: np.ndarray):
+        # Each distinct fee JSON is parsed once; its flat fees are added as many times as it appears.
+        # Some database drivers return the JSON column as dicts, which are serialized to be hashable.
+        trade_fee_jsons: pd.Series = trade_fees.map(
+            lambda trade_fee: json.dumps(trade_fee, sort_keys=True) if isinstance(trade_fee, dict) else trade_fee)
+        fee_codes, unique_fees = pd.factorize(trade_fee_jsons)
+        fee_counts: np.ndarray = np.bincount(fee_codes[fee_codes >= 0], minlength=len(unique_fees))
+        fee_percents: np.ndarray = np.zeros(len(unique_fees), dtype=np.float64)
+        for index, trade_fee_json in enumerate(unique_fees):
+            trade_fee: Dict[str, Any] = json.loads(trade_fee_json)
+            if trade_fee.get("percent") is not None:
+                fee_percents[index] = float(trade_fee["percent"])
+            for flat_fee in trade_fee.get("flat_fees", []):
+                self.fees[flat_fee["token"]] += Decimal(flat_fee["amount"]) * int(fee_counts[index])
+
+        percents: np.ndarray = np.where(fee_codes >= 0, fee_percents[fee_codes], 0.0)
+        percent_fees: float = float(notionals[percents > 0].dot(percents[percents > 0]))
+        if percent_fees > 0:
+            self.fees[quote] += self._to_decimal(percent_fees)
+
+    @staticmethod
+    def _to_decimal(value: float) -> Decimal:
+        return Decimal(repr(float(value)))
+
+    async def _calculate_balances_and_values(self,
+                                             trading_pair: str,
+                                             current_balances: Dict[str, Decimal],
+                                             start_price: Decimal,
+                                             last_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -300,9 +722,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
@@ -2,13 +2,17 @@ import importlib
 import json
 from decimal import Decimal
 from enum import Enum
-from os import DirEntry, scandir
 from os.path import exists, join, realpath
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union
 
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
+from hummingbot.client.connector_manifest import (
+    get_connector_manifest,
+    load_connector_config_keys,
+    trade_fee_schema_from_json,
+)
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
@@ -57,8 +61,6 @@ PAPER_TRADE_EXCHANGES = [  # todo: fix after global config map refactor
     "mock_paper_exchange",
 ]
 
-CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES = ["test_support", "utilities"]
-
 
 class ConnectorType(Enum):
     """
@@ -250,16 +252,17 @@ class ConnectorSetting(NamedTuple):
 
         trading_pairs = trading_pairs or []
         connector_class = getattr(importlib.import_module(self.module_path()), self.class_name())
+        config_keys = AllConnectorSettings.resolve_config_keys(self)
         kwargs = {}
-        if isinstance(self.config_keys, Dict):
-            kwargs = {key: (config.value or "") for key, config in self.config_keys.items()}  # legacy
-        elif self.config_keys is not None:
+        if isinstance(config_keys, Dict):
+            kwargs = {key: (config.value or "") for key, config in config_keys.items()}  # legacy
+        elif config_keys is not None:
             kwargs = {
                 traverse_item.attr: traverse_item.value.get_secret_value()
                 if isinstance(traverse_item.value, SecretStr)
                 else traverse_item.value or ""
                 for traverse_item
-                in ClientConfigAdapter(self.config_keys).traverse()
+                in ClientConfigAdapter(config_keys).traverse()
                 if traverse_item.attr != "connector"
             }
         kwargs = self.conn_init_parameters(kwargs)
@@ -273,73 +276,40 @@ class ConnectorSetting(NamedTuple):
 
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
+    # Connector name -> manifest description of the configuration keys not imported yet
+    _lazy_config_keys: Dict[str, Dict[str, Optional[str]]] = {}
 
     @classmethod
     def create_connector_settings(cls):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Read the connector metadata manifest to create a dictionary of exchange names to ConnectorSetting, without
+        importing the connector modules. The configuration keys of the connectors are imported when first requested.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        cls._lazy_config_keys = {}
+
+        for entry in get_connector_manifest()["connectors"]:
+            name: str = entry["name"]
+            if not entry["is_sub_domain"] and name in cls.all_connector_settings:
+                raise Exception(f"Multiple connectors with the same {name} name.")
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                name, trade_fee_schema_from_json(entry["trade_fee_schema"])
+            )
+            cls.all_connector_settings[name] = ConnectorSetting(
+                name=name,
+                type=ConnectorType[entry["type"].capitalize()],
+                centralised=entry["centralised"],
+                example_pair=entry["example_pair"],
+                use_ethereum_wallet=entry["use_ethereum_wallet"],
+                trade_fee_schema=trade_fee_schema,
+                config_keys=None,
+                is_sub_domain=entry["is_sub_domain"],
+                parent_name=entry["parent_name"],
+                domain_parameter=entry["domain_parameter"],
+                use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+            )
+            if entry["config_keys"] is not None:
+                cls._lazy_config_keys[name] = entry["config_keys"]
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -383,6 +353,8 @@ class AllConnectorSettings:
                     use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
+                if e in cls._lazy_config_keys:
+                    cls._lazy_config_keys[f"{e}_paper_trade"] = cls._lazy_config_keys[e]
 
     @classmethod
     def get_connector_settings(cls) -> Dict[str, ConnectorSetting]:
@@ -392,12 +364,25 @@ class AllConnectorSettings:
 
     @classmethod
     def get_connector_config_keys(cls, connector: str) -> Optional["BaseConnectorConfigMap"]:
-        return cls.get_connector_settings()[connector].config_keys
+        connector_settings = cls.get_connector_settings()[connector]
+        if connector_settings.config_keys is None and connector in cls._lazy_config_keys:
+            config_keys = load_connector_config_keys(cls._lazy_config_keys.pop(connector))
+            connector_settings = connector_settings._replace(config_keys=config_keys)
+            cls.all_connector_settings[connector] = connector_settings
+        return connector_settings.config_keys
+
+    @classmethod
+    def resolve_config_keys(cls, connector_setting: "ConnectorSetting") -> Optional["BaseConnectorConfigMap"]:
+        """
+        Returns the configuration keys of the connector setting, importing them if they have not been yet.
+        """
+        if connector_setting.config_keys is None and connector_setting.name in cls._lazy_config_keys:
+            return cls.get_connector_config_keys(connector_setting.name)
+        return connector_setting.config_keys
 
     @classmethod
     def reset_connector_config_keys(cls, connector: str):
-        current_settings = cls.get_connector_settings()[connector]
-        current_keys = current_settings.config_keys
+        current_keys = cls.get_connector_config_keys(connector)
         new_keys = (
             current_keys if current_keys is None else current_keys.__class__.construct()
         )
@@ -406,6 +391,7 @@ class AllConnectorSettings:
     @classmethod
     def update_connector_config_keys(cls, new_config_keys: "BaseConnectorConfigMap"):
         current_settings = cls.get_connector_settings()[new_config_keys.connector]
+        cls._lazy_config_keys.pop(new_config_keys.connector, None)
         new_keys_settings_dict = current_settings._asdict()
         new_keys_settings_dict.update({"config_keys": new_config_keys})
         cls.get_connector_settings()[new_config_keys.connector] = ConnectorSetting(
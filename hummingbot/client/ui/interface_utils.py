@@ -61,7 +61,27 @@ async def start_trade_monitor(trade_monitor):
     while True:
         try:
             if hb.strategy_task is not None and not hb.strategy_task.done():
-                if all(market.ready for market in hb.markets.values()):
+                if all(market.ready for market in hb.markets.values()) and hb.pnl_tracker is not None:
+                    trade_stats = {key: stats for key, stats in hb.pnl_tracker.trade_stats.items()
+                                   if stats.num_trades > 0}
+                    if len(trade_stats) > 0:
+                        for (market, symbol), stats in trade_stats.items():
+                            cur_balances = await hb.get_current_balances(market)
+                            perf = await PerformanceMetrics.from_trade_stats(symbol, stats, cur_balances)
+                            return_pcts.append(perf.return_pct)
+                            pnls.append(perf.total_pnl)
+                        avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+                        quote_assets = set(symbol.split("-")[1] for _, symbol in trade_stats)
+                        if len(quote_assets) == 1:
+                            total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
+                        else:
+                            total_pnls = "N/A"
+                        num_trades = sum(stats.num_trades for stats in trade_stats.values())
+                        trade_monitor.log(f"Trades: {num_trades}, Total P&L: {total_pnls}, "
+                                          f"Return %: {avg_return:.2%}")
+                        return_pcts.clear()
+                        pnls.clear()
+                elif all(market.ready for market in hb.markets.values()):
                     with hb.trade_fill_db.get_new_session() as session:
                         trades: List[TradeFill] = hb._get_trades_from_session(
                             int(hb.init_time * 1e3),
@@ -2,7 +2,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Iterator, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -26,6 +26,55 @@ from hummingbot.logger.logger import HummingbotLogger
 cot_logger = None
 
 
+class OrdersView(Mapping[str, InFlightOrder]):
+    """
+    Read-only view merging order dictionaries without copying them. When an order id is in several of them, the order
+    of the first one is returned.
+
+    The view reflects the changes of the underlying dictionaries, so it should be copied before iterating over it in
+    code that awaits while iterating. It can't be modified: changes must go through ClientOrderTracker.
+
+    Lookups cost one dictionary lookup per merged dictionary. len() of a view merging several dictionaries iterates
+    over all their orders to skip the repeated ids, so callers needing it often should take a copy.
+    """
+
+    def __init__(self, *orders: Mapping[str, InFlightOrder]):
+        self._orders = orders
+
+    def __getitem__(self, client_order_id: str) -> InFlightOrder:
+        for orders in self._orders:
+            try:
+                return orders[client_order_id]
+            except KeyError:
+                pass
+        raise KeyError(client_order_id)
+
+    def __contains__(self, client_order_id: object) -> bool:
+        return any(client_order_id in orders for orders in self._orders)
+
+    def __iter__(self) -> Iterator[str]:
+        if len(self._orders) == 1:
+            yield from self._orders[0]
+            return
+        seen_ids = set()
+        for orders in self._orders:
+            for client_order_id in orders:
+                if client_order_id not in seen_ids:
+                    seen_ids.add(client_order_id)
+                    yield client_order_id
+
+    def __len__(self) -> int:
+        if len(self._orders) == 1:
+            return len(self._orders[0])
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"OrdersView({dict(self.items())})"
+
+    def copy(self) -> Dict[str, InFlightOrder]:
+        return dict(self.items())
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -54,6 +103,16 @@ class ClientOrderTracker:
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
         self._lost_orders: Dict[str, InFlightOrder] = {}
+        # Index of the active and cached orders by exchange order id. Entries are validated on lookup, since the
+        # exchange order id can be assigned to an order outside of the tracker and cached orders expire silently
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+
+        self._cached_orders_view: OrdersView = OrdersView(self._cached_orders)
+        self._lost_orders_view: OrdersView = OrdersView(self._lost_orders)
+        self._all_orders_view: OrdersView = OrdersView(self._in_flight_orders, self._cached_orders)
+        self._all_fillable_orders_view: OrdersView = OrdersView(
+            self._in_flight_orders, self._cached_orders, self._lost_orders)
+        self._all_updatable_orders_view: OrdersView = OrdersView(self._in_flight_orders, self._lost_orders)
 
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
@@ -67,32 +126,33 @@ class ClientOrderTracker:
         return self._in_flight_orders
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns orders that are no longer actively tracked.
+        Returns a read-only view of the orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return self._cached_orders_view
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns both active and cached order.
+        Returns a read-only view of both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return self._all_orders_view
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
+        Returns a read-only view of all orders that could still be impacted by trades: active orders, cached orders and
+        lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return self._all_fillable_orders_view
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could receive status updates
+        Returns a read-only view of all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return self._all_updatable_orders_view
 
     @property
     def current_timestamp(self) -> int:
@@ -102,14 +162,16 @@ class ClientOrderTracker:
         return self._connector.current_timestamp
 
     @property
-    def lost_orders(self) -> Dict[str, InFlightOrder]:
+    def lost_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
+        Returns a read-only view of all orders marked as failed after not being found more times than the configured
+        limit
         """
-        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+        return self._lost_orders_view
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_exchange_order_id(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -137,12 +199,21 @@ class ClientOrderTracker:
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if client_order_id is not None:
+            found_order = self._in_flight_orders.get(client_order_id) or self._cached_orders.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._orders_by_exchange_order_id.get(exchange_order_id)
+            if (found_order is None
+                    or found_order.exchange_order_id != exchange_order_id
+                    or not self._is_active_or_cached(found_order)):
+                found_order = next(
+                    (order for order in self._iter_active_and_cached_orders()
+                     if order.exchange_order_id == exchange_order_id),
+                    None)
+                if found_order is not None:
+                    self._index_exchange_order_id(found_order)
+                else:
+                    self._orders_by_exchange_order_id.pop(exchange_order_id, None)
 
         return found_order
 
@@ -219,6 +290,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._index_exchange_order_id(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
 
@@ -229,6 +301,27 @@ class ClientOrderTracker:
         else:
             self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _is_active_or_cached(self, order: InFlightOrder) -> bool:
+        client_order_id: str = order.client_order_id
+        return (self._in_flight_orders.get(client_order_id) is order
+                or self._cached_orders.get(client_order_id) is order)
+
+    def _iter_active_and_cached_orders(self) -> Iterator[InFlightOrder]:
+        yield from self._in_flight_orders.values()
+        yield from self._cached_orders.values()
+
+    def _index_exchange_order_id(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            return
+        self._orders_by_exchange_order_id[order.exchange_order_id] = order
+        # Drops the entries of expired cached orders and lost orders, once they could outnumber the valid ones
+        if len(self._orders_by_exchange_order_id) > 2 * (len(self._in_flight_orders) + self.MAX_CACHE_SIZE):
+            self._orders_by_exchange_order_id = {
+                exchange_order_id: indexed_order
+                for exchange_order_id, indexed_order in self._orders_by_exchange_order_id.items()
+                if indexed_order.exchange_order_id == exchange_order_id and self._is_active_or_cached(indexed_order)
+            }
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -2,6 +2,7 @@ import hashlib
 import hmac
 import json
 from collections import OrderedDict
+from copy import copy
 from typing import Any, Dict
 from urllib.parse import urlencode
 
@@ -11,6 +12,8 @@ from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RES
 
 
 class BinanceAuth(AuthBase):
+    copy_on_write = True
+
     def __init__(self, api_key: str, secret_key: str, time_provider: TimeSynchronizer):
         self.api_key = api_key
         self.secret_key = secret_key
@@ -22,6 +25,7 @@ class BinanceAuth(AuthBase):
         the required parameter in the request header.
         :param request: the request to be configured for authenticated interaction
         """
+        request = copy(request)
         if request.method == RESTMethod.POST:
             request.data = self.add_auth_to_params(params=json.loads(request.data))
         else:
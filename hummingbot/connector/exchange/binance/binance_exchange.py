@@ -16,6 +16,8 @@ from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -128,6 +130,11 @@ class BinanceExchange(ExchangePyBase):
                                         and "Timestamp for this request" in error_description)
         return is_time_synchronizer_related
 
+    def _create_throttler(self, limits_share_percentage: Decimal) -> AsyncThrottlerBase:
+        return SlidingWindowThrottler(rate_limits=self.rate_limits_rules,
+                                      limits_share_percentage=limits_share_percentage,
+                                      priority_capacity_shares=self.PRIORITY_CAPACITY_SHARES)
+
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         return web_utils.build_api_factory(
             throttler=self._throttler,
@@ -470,6 +477,82 @@ class BinanceExchange(ExchangePyBase):
 
         return trade_updates
 
+    async def _all_trade_updates_for_trading_pair(
+            self,
+            trading_pair: str,
+            orders: List[InFlightOrder]) -> Optional[Tuple[List[TradeUpdate], List[InFlightOrder]]]:
+        orders_by_exchange_id = {order.exchange_order_id: order
+                                 for order in orders
+                                 if order.exchange_order_id is not None}
+        # Orders still waiting for their creation response can't be matched with the trades, they are polled one by one
+        orders_without_exchange_id = [order for order in orders if order.exchange_order_id is None]
+        start_time = min(order.creation_timestamp for order in orders)
+        # A single order is cheaper to query by its id, and Binance only returns 24 hours of trades from startTime
+        if len(orders_by_exchange_id) < 2 or self.current_timestamp - start_time >= CONSTANTS.ONE_DAY:
+            return None
+
+        trades = await self._api_get(
+            path_url=CONSTANTS.MY_TRADES_PATH_URL,
+            params={
+                "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+                "startTime": int(start_time * 1e3),
+                "limit": CONSTANTS.MAX_TRADES_PER_REQUEST,
+            },
+            is_auth_required=True,
+            limit_id=CONSTANTS.MY_TRADES_PATH_URL)
+        if len(trades) >= CONSTANTS.MAX_TRADES_PER_REQUEST:
+            # There could be more trades for the orders than the ones returned
+            return None
+
+        trade_updates = []
+        for trade in trades:
+            order = orders_by_exchange_id.get(str(trade["orderId"]))
+            if order is None:
+                continue
+            fee = TradeFeeBase.new_spot_fee(
+                fee_schema=self.trade_fee_schema(),
+                trade_type=order.trade_type,
+                percent_token=trade["commissionAsset"],
+                flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
+            )
+            trade_updates.append(TradeUpdate(
+                trade_id=str(trade["id"]),
+                client_order_id=order.client_order_id,
+                exchange_order_id=order.exchange_order_id,
+                trading_pair=order.trading_pair,
+                fee=fee,
+                fill_base_amount=Decimal(trade["qty"]),
+                fill_quote_amount=Decimal(trade["quoteQty"]),
+                fill_price=Decimal(trade["price"]),
+                fill_timestamp=trade["time"] * 1e-3,
+            ))
+        return trade_updates, orders_without_exchange_id
+
+    async def _request_order_updates_for_trading_pair(self,
+                                                      trading_pair: str,
+                                                      orders: List[InFlightOrder]) -> Optional[List[OrderUpdate]]:
+        # A single order is cheaper to query by its id
+        if len(orders) < 2:
+            return None
+
+        open_orders = await self._api_get(
+            path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+            params={"symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)},
+            is_auth_required=True)
+
+        client_order_ids = {order.client_order_id for order in orders}
+        return [
+            OrderUpdate(
+                client_order_id=order_data["clientOrderId"],
+                exchange_order_id=str(order_data["orderId"]),
+                trading_pair=trading_pair,
+                update_timestamp=order_data["updateTime"] * 1e-3,
+                new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+            )
+            for order_data in open_orders
+            if order_data["clientOrderId"] in client_order_ids
+        ]
+
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
         updated_order_data = await self._api_get(
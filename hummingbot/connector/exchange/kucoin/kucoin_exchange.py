@@ -464,9 +464,34 @@ class KucoinExchange(ExchangePyBase):
             is_auth_required=True,
             limit_id=CONSTANTS.GET_ORDER_LIMIT_ID)
 
-        ordered_canceled = updated_order_data["data"]["cancelExist"]
-        is_active = updated_order_data["data"]["isActive"]
-        op_type = updated_order_data["data"]["opType"]
+        return self._order_update_from_order_data(tracked_order, updated_order_data["data"])
+
+    async def _request_order_updates_for_trading_pair(self,
+                                                      trading_pair: str,
+                                                      orders: List[InFlightOrder]) -> Optional[List[OrderUpdate]]:
+        # A single order is cheaper to query by its id
+        if len(orders) < 2:
+            return None
+
+        active_orders_response = await self._api_get(
+            path_url=CONSTANTS.ORDERS_PATH_URL,
+            params={
+                "status": "active",
+                "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+                "pageSize": CONSTANTS.MAX_ORDERS_PAGE_SIZE,
+            },
+            is_auth_required=True,
+            limit_id=CONSTANTS.ORDERS_PATH_URL)
+
+        orders_by_client_id = {order.client_order_id: order for order in orders}
+        return [self._order_update_from_order_data(orders_by_client_id[order_data["clientOid"]], order_data)
+                for order_data in active_orders_response["data"]["items"]
+                if order_data["clientOid"] in orders_by_client_id]
+
+    def _order_update_from_order_data(self, tracked_order: InFlightOrder, order_data: Dict[str, Any]) -> OrderUpdate:
+        ordered_canceled = order_data["cancelExist"]
+        is_active = order_data["isActive"]
+        op_type = order_data["opType"]
 
         new_state = tracked_order.current_state
         if ordered_canceled or op_type == "CANCEL":
@@ -476,7 +501,7 @@ class KucoinExchange(ExchangePyBase):
 
         order_update = OrderUpdate(
             client_order_id=tracked_order.client_order_id,
-            exchange_order_id=updated_order_data["data"]["id"],
+            exchange_order_id=order_data["id"],
             trading_pair=tracked_order.trading_pair,
             update_timestamp=self.current_timestamp,
             new_state=new_state,
@@ -3,6 +3,7 @@ from typing import List
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.data_type.market_data_replay import MarketDataReplayOrderBookTracker
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 
@@ -22,3 +23,19 @@ def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfi
                               tracker,
                               get_connector_class(exchange_name),
                               exchange_name=exchange_name)
+
+
+def create_backtest_paper_trade_market(exchange_name: str,
+                                       client_config_map: ClientConfigAdapter,
+                                       trading_pairs: List[str],
+                                       data_files: List[str]) -> PaperTradeExchange:
+    """
+    Creates a paper trade market whose order books are replayed from recorded market data files. A
+    `MarketDataReplayIterator` over the market order book tracker has to be added to the backtest clock before the
+    market to drive the replay.
+    """
+    tracker = MarketDataReplayOrderBookTracker(data_files=data_files, trading_pairs=trading_pairs)
+    return PaperTradeExchange(client_config_map,
+                              tracker,
+                              get_connector_class(exchange_name),
+                              exchange_name=exchange_name)
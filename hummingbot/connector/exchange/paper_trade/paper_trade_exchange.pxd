@@ -40,6 +40,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
         str _exchange_name
+        object _queue_position_tracker
+        set _crossed_check_trading_pairs
+        dict _top_of_book_listeners
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
@@ -75,7 +78,14 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef c_process_crossed_limit_orders_for_trading_pairs(self, set trading_pairs)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef c_match_trade_to_queue_positions(self,
+                                          object order_book_trade_event,
+                                          LimitOrders *limit_orders_map_ptr,
+                                          LimitOrdersIterator *map_it_ptr)
+    cdef c_track_queue_position(self, str order_id, str trading_pair, bint is_buy, object price, object amount)
+    cdef c_request_crossed_check(self, str trading_pair)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
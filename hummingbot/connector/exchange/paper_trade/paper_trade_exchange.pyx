@@ -14,6 +14,7 @@ from libcpp.vector cimport vector
 
 from hummingbot.connector.budget_checker import BudgetChecker
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
+from hummingbot.connector.exchange.paper_trade.queue_position_tracker import QueuePositionTracker
 from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock cimport Clock
@@ -124,6 +125,19 @@ cdef class OrderBookTradeListener(EventListener):
         except Exception as e:
             self.logger().error("Error call trade listener.", exc_info=True)
 
+cdef class OrderBookTopOfBookListener(EventListener):
+    cdef:
+        set _trading_pairs_to_check
+        str _trading_pair
+
+    def __init__(self, trading_pairs_to_check: set, trading_pair: str):
+        super().__init__()
+        self._trading_pairs_to_check = trading_pairs_to_check
+        self._trading_pair = trading_pair
+
+    cdef c_call(self, object event_object):
+        self._trading_pairs_to_check.add(self._trading_pair)
+
 cdef class OrderBookMarketOrderFillListener(EventListener):
     cdef:
         ExchangeBase _market
@@ -157,7 +171,15 @@ cdef class PaperTradeExchange(ExchangeBase):
         order_book_tracker: OrderBookTracker,
         target_market: Callable,
         exchange_name: str,
+        queue_position_fills: bool = False,
     ):
+        """
+        :param queue_position_fills: when True, limit orders resting at the price of a trade are only filled once the
+            trades at their price have matched the amount displayed ahead of them when they were placed and their own
+            amount, instead of never being filled by trades at their price. Crossed limit orders are then only
+            looked for on the trading pairs whose top of book changed or that got new orders, instead of on every
+            trading pair at every tick.
+        """
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._set_order_book_tracker(order_book_tracker)
         self._budget_checker = BudgetChecker(exchange=self)
@@ -173,6 +195,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        self._queue_position_tracker = QueuePositionTracker() if queue_position_fills else None
+        self._crossed_check_trading_pairs = set()
+        self._top_of_book_listeners = {}
 
         # Trade volume metrics should never be gather for paper trade connector
         self._trade_volume_metric_collector = DummyMetricsCollector()
@@ -200,6 +225,14 @@ cdef class PaperTradeExchange(ExchangeBase):
         return self._target_market.split_trading_pair(trading_pair)
 
     #  <editor-fold desc="Property">
+    @property
+    def queue_position_fills(self) -> bool:
+        return self._queue_position_tracker is not None
+
+    @property
+    def queue_position_tracker(self) -> Optional[QueuePositionTracker]:
+        return self._queue_position_tracker
+
     @property
     def trading_pair(self) -> Dict[str, TradingPair]:
         return self._trading_pairs
@@ -368,6 +401,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 int(self._current_timestamp * 1e6),
                 0
             ))
+            if self._queue_position_tracker is not None:
+                self.c_track_queue_position(order_id, trading_pair_str, True, quantized_price, quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -426,6 +461,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 int(self._current_timestamp * 1e6),
                 0
             ))
+            if self._queue_position_tracker is not None:
+                self.c_track_queue_position(order_id, trading_pair_str, False, quantized_price, quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -615,6 +652,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                         self.c_execute_sell(front_order.order_id, front_order.trading_pair, front_order.amount)
                 except Exception as e:
                     self.logger().error("Error executing queued order.", exc_info=True)
+                self.c_request_crossed_check(front_order.trading_pair)
             else:
                 return
 
@@ -625,6 +663,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            if self._queue_position_tracker is not None:
+                self._queue_position_tracker.remove_order(deref(orders_it).getClientOrderID().decode("utf8"))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -821,6 +861,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
                                SingleTradingPairLimitOrdersIterator orders_it):
+        cdef:
+            str trading_pair = deref(orders_it).getTradingPair().decode("utf8")
         try:
             if is_buy:
                 self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
@@ -828,6 +870,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                 self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
+        self.c_request_crossed_check(trading_pair)
 
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
@@ -873,6 +916,14 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             LimitOrders *limit_orders_ptr = address(self._bid_limit_orders)
             LimitOrdersIterator map_it = limit_orders_ptr.begin()
+            set trading_pairs
+
+        if self._queue_position_tracker is not None:
+            # The top of book listeners share the set, so it is copied and cleared rather than replaced
+            trading_pairs = set(self._crossed_check_trading_pairs)
+            self._crossed_check_trading_pairs.clear()
+            self.c_process_crossed_limit_orders_for_trading_pairs(trading_pairs)
+            return
 
         while map_it != limit_orders_ptr.end():
             self.c_process_crossed_limit_orders_for_trading_pair(True, limit_orders_ptr, address(map_it))
@@ -887,6 +938,53 @@ cdef class PaperTradeExchange(ExchangeBase):
             if map_it != limit_orders_ptr.end():
                 inc(map_it)
 
+    cdef c_process_crossed_limit_orders_for_trading_pairs(self, set trading_pairs):
+        cdef:
+            LimitOrders *limit_orders_ptr
+            LimitOrdersIterator map_it
+            string cpp_trading_pair
+
+        for trading_pair in trading_pairs:
+            cpp_trading_pair = trading_pair.encode("utf8")
+            limit_orders_ptr = address(self._bid_limit_orders)
+            map_it = limit_orders_ptr.find(cpp_trading_pair)
+            if map_it != limit_orders_ptr.end():
+                self.c_process_crossed_limit_orders_for_trading_pair(True, limit_orders_ptr, address(map_it))
+            limit_orders_ptr = address(self._ask_limit_orders)
+            map_it = limit_orders_ptr.find(cpp_trading_pair)
+            if map_it != limit_orders_ptr.end():
+                self.c_process_crossed_limit_orders_for_trading_pair(False, limit_orders_ptr, address(map_it))
+
+    cdef c_track_queue_position(self, str order_id, str trading_pair, bint is_buy, object price, object amount):
+        """
+        Starts tracking the queue position of a new limit order, behind the amount displayed at its price, and makes
+        sure crossings of the order book of its trading pair are looked for.
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            object listener
+
+        self._queue_position_tracker.add_order(order_id,
+                                               trading_pair,
+                                               is_buy,
+                                               float(price),
+                                               float(amount),
+                                               order_book.c_get_amount_at_price(is_buy, float(price)))
+        if trading_pair not in self._top_of_book_listeners:
+            listener = OrderBookTopOfBookListener(self._crossed_check_trading_pairs, trading_pair)
+            order_book.c_add_listener(OrderBookEvent.TopOfBookChanged.value, listener)
+            self._top_of_book_listeners[trading_pair] = listener
+        # The order could already be crossed
+        self._crossed_check_trading_pairs.add(trading_pair)
+
+    cdef c_request_crossed_check(self, str trading_pair):
+        """
+        Makes sure crossings of the order book of the trading pair are looked for on the next tick, in queue position
+        mode. Simulated fills change the traded amounts of the composite order book without a top of book event.
+        """
+        if self._queue_position_tracker is not None:
+            self._crossed_check_trading_pairs.add(trading_pair)
+
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
@@ -912,6 +1010,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         if map_it == limit_orders_map_ptr.end():
             return
 
+        if self._queue_position_tracker is not None:
+            self.c_match_trade_to_queue_positions(order_book_trade_event, limit_orders_map_ptr, address(map_it))
+            return
+
         orders_collection_ptr = address(deref(map_it).second)
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
@@ -934,6 +1036,67 @@ cdef class PaperTradeExchange(ExchangeBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+    cdef c_match_trade_to_queue_positions(self,
+                                          object order_book_trade_event,
+                                          LimitOrders *limit_orders_map_ptr,
+                                          LimitOrdersIterator *map_it_ptr):
+        """
+        Trigger limit orders when incoming market orders have crossed the limit order's price, or have matched the
+        amount ahead of the limit orders resting at the trade price and their own amount.
+
+        :param order_book_trade_event: trade event from order book
+        :param limit_orders_map_ptr: pointer to the limit orders map of the side the trade is matched against
+        :param map_it_ptr: limit orders map iterator of the trading pair of the trade
+        """
+        cdef:
+            str trading_pair = order_book_trade_event.trading_pair
+            bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
+            double trade_price = float(order_book_trade_event.price)
+            double order_price
+            OrderBook order_book
+            set filled_order_ids = set()
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            SingleTradingPairLimitOrdersIterator orders_it
+            SingleTradingPairLimitOrdersRIterator orders_rit
+            vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+
+        if self._queue_position_tracker.has_orders_at(trading_pair, is_maker_buy, trade_price):
+            order_book = self.order_books[trading_pair]
+            filled_order_ids.update(self._queue_position_tracker.match_trade(
+                trading_pair,
+                is_maker_buy,
+                trade_price,
+                float(order_book_trade_event.amount),
+                order_book.c_get_amount_at_price(is_maker_buy, trade_price)))
+
+        if is_maker_buy:
+            orders_rit = orders_collection_ptr.rbegin()
+            while orders_rit != orders_collection_ptr.rend():
+                cpp_limit_order_ptr = address(deref(orders_rit))
+                order_price = float(<object>cpp_limit_order_ptr.getPrice())
+                if order_price < trade_price:
+                    break
+                if (order_price > trade_price
+                        or cpp_limit_order_ptr.getClientOrderID().decode("utf8") in filled_order_ids):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                inc(orders_rit)
+        else:
+            orders_it = orders_collection_ptr.begin()
+            while orders_it != orders_collection_ptr.end():
+                cpp_limit_order_ptr = address(deref(orders_it))
+                order_price = float(<object>cpp_limit_order_ptr.getPrice())
+                if order_price > trade_price:
+                    break
+                if (order_price < trade_price
+                        or cpp_limit_order_ptr.getClientOrderID().decode("utf8") in filled_order_ids):
+                    process_order_its.push_back(orders_it)
+                inc(orders_it)
+
+        for orders_it in process_order_its:
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
@@ -0,0 +1,99 @@
+from typing import Dict, List, Tuple
+
+LevelKey = Tuple[str, bool, float]
+
+
+class QueuePosition:
+    """
+    Estimated position of a resting paper limit order in the queue of its price level: the displayed amount ahead of
+    it, and the amount of the order already matched by trades at its price.
+    """
+    __slots__ = ("order_id", "amount", "amount_ahead", "matched_amount")
+
+    def __init__(self, order_id: str, amount: float, amount_ahead: float):
+        self.order_id = order_id
+        self.amount = amount
+        self.amount_ahead = amount_ahead
+        self.matched_amount = 0.0
+
+    @property
+    def is_filled(self) -> bool:
+        return self.matched_amount >= self.amount
+
+    def __repr__(self) -> str:
+        return (f"QueuePosition(order_id='{self.order_id}', amount={self.amount}, amount_ahead={self.amount_ahead}, "
+                f"matched_amount={self.matched_amount})")
+
+
+class QueuePositionTracker:
+    """
+    Estimates the queue position of the resting limit orders of a paper trade exchange.
+
+    An order joins the back of its price level: the amount displayed at its price when it is placed is ahead of it.
+    Trades at the order price consume the amount ahead first, and then match the order. Displayed amounts only move
+    the order forward, since amounts added to the level after the order queue behind it, while amounts removed from
+    the level (cancellations, or trades) are assumed to be ahead of it.
+
+    Orders are kept per price level, so a trade only visits the orders resting at its price.
+    """
+
+    def __init__(self):
+        self._positions: Dict[str, QueuePosition] = {}
+        self._levels: Dict[LevelKey, Dict[str, QueuePosition]] = {}
+        self._order_levels: Dict[str, LevelKey] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._positions
+
+    def get_position(self, order_id: str) -> QueuePosition:
+        return self._positions[order_id]
+
+    def add_order(self, order_id: str, trading_pair: str, is_buy: bool, price: float, amount: float,
+                  displayed_amount: float):
+        level_key: LevelKey = (trading_pair, is_buy, float(price))
+        position = QueuePosition(order_id, float(amount), float(displayed_amount))
+        self._positions[order_id] = position
+        self._order_levels[order_id] = level_key
+        self._levels.setdefault(level_key, {})[order_id] = position
+
+    def remove_order(self, order_id: str):
+        position = self._positions.pop(order_id, None)
+        if position is None:
+            return
+        level_key: LevelKey = self._order_levels.pop(order_id)
+        level_positions: Dict[str, QueuePosition] = self._levels[level_key]
+        del level_positions[order_id]
+        if len(level_positions) == 0:
+            del self._levels[level_key]
+
+    def has_orders_at(self, trading_pair: str, is_buy: bool, price: float) -> bool:
+        return (trading_pair, is_buy, float(price)) in self._levels
+
+    def match_trade(self, trading_pair: str, is_buy: bool, price: float, amount: float,
+                    displayed_amount: float) -> List[str]:
+        """
+        Moves the orders resting at the trade price forward in their queue.
+
+        :param trading_pair: the trading pair of the trade
+        :param is_buy: True to match the trade against buy orders, i.e. when the taker sold
+        :param price: the trade price
+        :param amount: the trade amount
+        :param displayed_amount: the amount currently displayed at the trade price in the order book
+        :return: the ids of the orders the trades at their price have now completely matched
+        """
+        level_positions = self._levels.get((trading_pair, is_buy, float(price)))
+        if level_positions is None:
+            return []
+        filled_order_ids: List[str] = []
+        for position in level_positions.values():
+            remaining_amount: float = float(amount)
+            position.amount_ahead = min(position.amount_ahead, float(displayed_amount))
+            consumed_amount: float = min(position.amount_ahead, remaining_amount)
+            position.amount_ahead -= consumed_amount
+            position.matched_amount += remaining_amount - consumed_amount
+            if position.is_filled:
+                filled_order_ids.append(position.order_id)
+        return filled_order_ids
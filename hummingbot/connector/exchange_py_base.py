@@ -3,7 +3,7 @@ import copy
 import logging
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -14,7 +14,8 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase, request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -44,6 +45,11 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    MAX_CONCURRENT_ORDER_UPDATE_REQUESTS = 10
+    # Share of every rate limit each request priority can use. Connectors can set it to None to let all requests use the
+    # whole limits
+    PRIORITY_CAPACITY_SHARES: Optional[Dict[RequestPriority, float]] = (
+        AsyncThrottlerBase.DEFAULT_PRIORITY_CAPACITY_SHARES)
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -61,9 +67,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
-            rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+        self._throttler: AsyncThrottlerBase = self._create_throttler(client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -75,7 +79,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            throttler=self._throttler))
 
         # init UserStream Data Source and Tracker
         self._userstream_ds = self._create_user_stream_data_source()
@@ -478,15 +483,16 @@ class ExchangePyBase(ExchangeBase, ABC):
             return
 
         try:
-            exchange_order_id, update_timestamp = await self._place_order(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                **kwargs,
-            )
+            with request_priority(RequestPriority.CREATE):
+                exchange_order_id, update_timestamp = await self._place_order(
+                    order_id=order_id,
+                    trading_pair=trading_pair,
+                    amount=amount,
+                    trade_type=trade_type,
+                    order_type=order_type,
+                    price=price,
+                    **kwargs,
+                )
 
             order_update: OrderUpdate = OrderUpdate(
                 client_order_id=order_id,
@@ -520,7 +526,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _execute_order_cancel(self, order: InFlightOrder) -> str:
         try:
-            cancelled = await self._place_cancel(order.client_order_id, order)
+            with request_priority(RequestPriority.CANCEL):
+                cancelled = await self._place_cancel(order.client_order_id, order)
             if cancelled:
                 order_update: OrderUpdate = OrderUpdate(
                     client_order_id=order.client_order_id,
@@ -765,10 +772,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                with request_priority(RequestPriority.USER_QUERY):
+                    await self._update_time_synchronizer()
 
-                # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                    # the following method is implementation-specific
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -807,7 +815,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.USER_QUERY):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -923,51 +932,124 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._in_flight_orders_snapshot_timestamp = self.current_timestamp
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
+        orders_to_poll = []
+        orders_by_trading_pair = self._orders_by_trading_pair(orders)
+        results = await safe_gather(
+            *[self._all_trade_updates_for_trading_pair(trading_pair=trading_pair, orders=pair_orders)
+              for trading_pair, pair_orders in orders_by_trading_pair.items()],
+            return_exceptions=True)
+        for (trading_pair, pair_orders), result in zip(orders_by_trading_pair.items(), results):
+            if isinstance(result, Exception):
+                self.logger().warning(f"Failed to fetch trade updates for {trading_pair}. Error: {result}")
+            elif result is None:
+                orders_to_poll.extend(pair_orders)
+            else:
+                trade_updates, orders_not_covered = result
                 for trade_update in trade_updates:
                     self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}")
+                orders_to_poll.extend(orders_not_covered)
+
+        await self._gather_order_update_requests([self._update_order_fills(order) for order in orders_to_poll])
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}")
 
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
-        for client_order_id, order in orders_to_update.items():
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
-                if client_order_id in self.in_flight_orders:
-                    self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
-                self.logger().debug(
-                    f"Tracked order {client_order_id} does not have an exchange id. "
-                    f"Attempting fetch in next polling interval."
-                )
-                await self._order_tracker.process_order_not_found(client_order_id)
-            except Exception as request_error:
-                self.logger().network(
-                    f"Error fetching status update for the order {order.client_order_id}: {request_error}.",
-                    app_warning_msg=f"Failed to fetch status update for the order {order.client_order_id}.",
-                )
-                await self._order_tracker.process_order_not_found(order.client_order_id)
+        orders_to_poll = await self._update_orders_in_bulk(orders=orders_to_update,
+                                                           tracked_orders=self.in_flight_orders)
+        await self._gather_order_update_requests([self._update_order(client_order_id, order)
+                                                  for client_order_id, order in orders_to_poll.items()])
+
+    async def _update_order(self, client_order_id: str, order: InFlightOrder):
+        try:
+            order_update = await self._request_order_status(tracked_order=order)
+            if client_order_id in self.in_flight_orders:
+                self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self.logger().debug(
+                f"Tracked order {client_order_id} does not have an exchange id. "
+                f"Attempting fetch in next polling interval."
+            )
+            await self._order_tracker.process_order_not_found(client_order_id)
+        except Exception as request_error:
+            self.logger().network(
+                f"Error fetching status update for the order {order.client_order_id}: {request_error}.",
+                app_warning_msg=f"Failed to fetch status update for the order {order.client_order_id}.",
+            )
+            await self._order_tracker.process_order_not_found(order.client_order_id)
 
     async def _update_lost_orders(self):
         orders_to_update = self._order_tracker.lost_orders.copy()
-        for client_order_id, order in orders_to_update.items():
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
-                if client_order_id in self._order_tracker.lost_orders:
-                    self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Error fetching status update for lost order {order.client_order_id}: {request_error}.")
+        orders_to_poll = await self._update_orders_in_bulk(orders=orders_to_update,
+                                                           tracked_orders=self._order_tracker.lost_orders)
+        await self._gather_order_update_requests([self._update_lost_order(client_order_id, order)
+                                                  for client_order_id, order in orders_to_poll.items()])
+
+    async def _update_lost_order(self, client_order_id: str, order: InFlightOrder):
+        try:
+            order_update = await self._request_order_status(tracked_order=order)
+            if client_order_id in self._order_tracker.lost_orders:
+                self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Error fetching status update for lost order {order.client_order_id}: {request_error}.")
+
+    async def _update_orders_in_bulk(self,
+                                     orders: Dict[str, InFlightOrder],
+                                     tracked_orders: Dict[str, InFlightOrder]) -> Dict[str, InFlightOrder]:
+        """
+        Processes the order updates the connector can request for all the orders of a trading pair at once
+        :param orders: the orders to update, by client order id
+        :param tracked_orders: the orders whose updates should still be processed once the requests return
+        :return: the orders not updated, that have to be polled one by one
+        """
+        orders_to_poll = orders.copy()
+        orders_by_trading_pair = self._orders_by_trading_pair(list(orders.values()))
+        results = await safe_gather(
+            *[self._request_order_updates_for_trading_pair(trading_pair=trading_pair, orders=pair_orders)
+              for trading_pair, pair_orders in orders_by_trading_pair.items()],
+            return_exceptions=True)
+        for trading_pair, order_updates in zip(orders_by_trading_pair, results):
+            if isinstance(order_updates, Exception):
+                self.logger().warning(f"Failed to fetch order updates for {trading_pair}, requesting them one by one. "
+                                      f"Error: {order_updates}")
+            elif order_updates is not None:
+                for order_update in order_updates:
+                    if order_update.client_order_id in tracked_orders:
+                        self._order_tracker.process_order_update(order_update)
+                    orders_to_poll.pop(order_update.client_order_id, None)
+        return orders_to_poll
+
+    async def _gather_order_update_requests(self, requests: List[Awaitable]):
+        # The requests wait for capacity in the throttler, the semaphore only avoids queueing a request for every
+        # order at once.
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_UPDATE_REQUESTS)
+
+        async def bounded_request(request: Awaitable):
+            async with semaphore:
+                await request
+
+        await safe_gather(*[bounded_request(request) for request in requests])
+
+    @staticmethod
+    def _orders_by_trading_pair(orders: List[InFlightOrder]) -> Dict[str, List[InFlightOrder]]:
+        orders_by_trading_pair: Dict[str, List[InFlightOrder]] = {}
+        for order in orders:
+            orders_by_trading_pair.setdefault(order.trading_pair, []).append(order)
+        return orders_by_trading_pair
 
     async def _update_order_status(self):
         await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
@@ -978,7 +1060,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         await self._update_lost_orders()
 
     async def _cancel_lost_orders(self):
-        for _, lost_order in self._order_tracker.lost_orders.items():
+        for lost_order in list(self._order_tracker.lost_orders.values()):
             await self._execute_order_cancel(order=lost_order)
 
     # Methods tied to specific API data formats
@@ -1007,6 +1089,44 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _all_trade_updates_for_trading_pair(
+            self,
+            trading_pair: str,
+            orders: List[InFlightOrder]) -> Optional[Tuple[List[TradeUpdate], List[InFlightOrder]]]:
+        """
+        Connectors with an endpoint returning the account trades for a trading pair can override this method to get
+        the fills of all the orders of the pair with a single request.
+        :param trading_pair: the trading pair of the orders
+        :param orders: the orders to get the fills for
+        :return: the fills of the orders, and the orders the request could not cover, whose fills are requested one by
+            one with _all_trade_updates_for_order. None to request the fills of all the orders one by one
+        """
+        return None
+
+    async def _request_order_updates_for_trading_pair(self,
+                                                      trading_pair: str,
+                                                      orders: List[InFlightOrder]) -> Optional[List[OrderUpdate]]:
+        """
+        Connectors with an endpoint returning the open orders for a trading pair can override this method to get the
+        status of the orders of the pair with a single request.
+        :param trading_pair: the trading pair of the orders
+        :param orders: the orders to get the status for
+        :return: the updates of the orders found, the orders without an update are requested one by one with
+            _request_order_status. None to request all of them one by one
+        """
+        return None
+
+    def _create_throttler(self, limits_share_percentage: Decimal) -> AsyncThrottlerBase:
+        """
+        Creates the throttler shared by all the connector requests. Connectors can override it to select a different
+        throttler implementation, like SlidingWindowThrottler.
+        Order cancels and creations get reserved headroom in every rate limit over status polling and market data
+        (see PRIORITY_CAPACITY_SHARES).
+        """
+        return AsyncThrottler(rate_limits=self.rate_limits_rules,
+                              limits_share_percentage=limits_share_percentage,
+                              priority_capacity_shares=self.PRIORITY_CAPACITY_SHARES)
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
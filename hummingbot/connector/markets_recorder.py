@@ -1,16 +1,18 @@
 import asyncio
+import logging
 import os.path
+import queue
 import threading
 import time
+from dataclasses import dataclass, replace
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.trade_journal import TradeJournal
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
@@ -30,6 +32,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
@@ -39,18 +42,66 @@ from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
+PostCommitCallback = Callable[[], None]
+# A write operation may return a callback to run once its transaction is committed
+WriteOperation = Callable[[Session], Optional[PostCommitCallback]]
+
+
+@dataclass
+class MarketsRecorderWriteMetrics:
+    """
+    Statistics of the write-behind queue of a MarketsRecorder.
+    The flush latency is the time between queueing the oldest write of a batch and the commit of that batch.
+    """
+    pending_writes: int = 0
+    flushes: int = 0
+    written_records: int = 0
+    failed_records: int = 0
+    coalesced_market_states: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+
+    def record(self, batch_size: int, failed: int, latency: float):
+        self.flushes += 1
+        self.written_records += batch_size - failed
+        self.failed_records += failed
+        self.last_batch_size = batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.last_flush_latency = latency
+        self.max_flush_latency = max(self.max_flush_latency, latency)
+
 
 class MarketsRecorder:
+    DEFAULT_FLUSH_INTERVAL: float = 0.5
+    WRITER_JOIN_TIMEOUT: float = 10.0
+    _mr_logger: Optional[HummingbotLogger] = None
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = False,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """
+        :param write_behind: when True, the records are queued and committed in batched transactions by a dedicated
+        writer thread instead of blocking the event loop with one transaction per event. Market states are coalesced
+        so only the latest state of each market is saved per batch, and order fills wake the writer thread right away.
+        :param flush_interval: the maximum time (in seconds) a queued record waits before being committed
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -59,6 +110,26 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+
+        self._write_behind: bool = write_behind
+        self._flush_interval: float = flush_interval
+        self._write_queue: "queue.Queue[Tuple[float, WriteOperation]]" = queue.Queue()
+        self._dirty_markets: Dict[str, ConnectorBase] = {}
+        self._pending_market_states: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._pending_market_states_lock: threading.Lock = threading.Lock()
+        self._flush_lock: threading.Lock = threading.Lock()
+        self._flush_requested: threading.Event = threading.Event()
+        self._writer_stopping: bool = False
+        self._writer_thread: Optional[threading.Thread] = None
+        self._market_states_snapshot_handle: Optional[asyncio.TimerHandle] = None
+        self._write_metrics: MarketsRecorderWriteMetrics = MarketsRecorderWriteMetrics()
+        self._write_metrics_lock: threading.Lock = threading.Lock()
+        self._trade_journal: TradeJournal = TradeJournal(
+            file_path=os.path.join(data_path(), "trades_" + config_file_path[:-4] + ".csv"),
+            header=tuple(TradeFill.attribute_names_for_file_export()) + ("age",),
+            # Only the writer thread of the write-behind mode flushes the journal periodically
+            flush_interval=flush_interval if write_behind else TradeJournal.DEFAULT_FLUSH_INTERVAL,
+        )
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -114,15 +185,179 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind(self) -> bool:
+        return self._write_behind
+
+    @property
+    def flush_interval(self) -> float:
+        return self._flush_interval
+
+    @property
+    def trade_journal(self) -> TradeJournal:
+        return self._trade_journal
+
+    @property
+    def write_metrics(self) -> MarketsRecorderWriteMetrics:
+        """
+        A snapshot of the write-behind queue statistics.
+        """
+        with self._write_metrics_lock:
+            return replace(self._write_metrics,
+                           pending_writes=(self._write_queue.qsize()
+                                           + len(self._pending_market_states)
+                                           + len(self._dirty_markets)))
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+        if self._write_behind and self._writer_thread is None:
+            self._writer_stopping = False
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="MarketsRecorderWriter", daemon=True)
+            self._writer_thread.start()
 
     def stop(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._writer_thread is not None:
+            self._snapshot_market_states()
+            self._writer_stopping = True
+            self._flush_requested.set()
+            self._writer_thread.join(self.WRITER_JOIN_TIMEOUT)
+            self._writer_thread = None
+        self.flush()
+        self._trade_journal.close()
+
+    def flush(self):
+        """
+        Commits every queued record and market state from the calling thread. Must be called from the main thread.
+        """
+        if self._write_behind:
+            self._snapshot_market_states()
+            self._flush_write_queue()
+
+    def _write(self, write_operation: WriteOperation, market: Optional[ConnectorBase] = None):
+        """
+        Runs a write operation in a database transaction, together with saving the market states when a market is
+        given, and then runs the post commit callback returned by the operation. In write-behind mode the operation is
+        queued instead and committed later by the writer thread, see _request_flush() to wake it up right away.
+        """
+        if not self._write_behind:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    post_commit_callback: Optional[PostCommitCallback] = write_operation(session)
+                    if market is not None:
+                        self.save_market_states(self._config_file_path, market, session=session)
+            if post_commit_callback is not None:
+                post_commit_callback()
+            return
+
+        self._write_queue.put((time.perf_counter(), write_operation))
+        if market is not None:
+            if market.display_name in self._dirty_markets:
+                with self._write_metrics_lock:
+                    self._write_metrics.coalesced_market_states += 1
+            self._dirty_markets[market.display_name] = market
+        if self._market_states_snapshot_handle is None:
+            self._market_states_snapshot_handle = self._ev_loop.call_later(self._flush_interval,
+                                                                           self._snapshot_market_states)
+
+    def _request_flush(self):
+        """
+        Wakes the writer thread up to commit the queued writes without waiting for the flush interval. Does not wait
+        for the commit.
+        """
+        if self._write_behind:
+            self._snapshot_market_states()
+
+    def _snapshot_market_states(self):
+        # Connector tracking states are only read from the main thread; the writer thread only sees the snapshots.
+        if self._market_states_snapshot_handle is not None:
+            self._market_states_snapshot_handle.cancel()
+            self._market_states_snapshot_handle = None
+        if len(self._dirty_markets) > 0:
+            queued_timestamp: float = time.perf_counter()
+            with self._pending_market_states_lock:
+                for market_name, market in self._dirty_markets.items():
+                    if market_name in self._pending_market_states:
+                        with self._write_metrics_lock:
+                            self._write_metrics.coalesced_market_states += 1
+                        queued_timestamp = min(queued_timestamp, self._pending_market_states[market_name][0])
+                    self._pending_market_states[market_name] = (queued_timestamp, market.tracking_states)
+            self._dirty_markets.clear()
+        self._flush_requested.set()
+
+    def _writer_loop(self):
+        while True:
+            self._flush_requested.wait(self._flush_interval)
+            self._flush_requested.clear()
+            try:
+                self._flush_write_queue()
+            except Exception:
+                self.logger().error("Unexpected error flushing the trades database writes.", exc_info=True)
+            self._trade_journal.flush_if_due()
+            if self._writer_stopping:
+                break
+
+    def _flush_write_queue(self):
+        with self._flush_lock:
+            batch: List[Tuple[float, WriteOperation]] = []
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            with self._pending_market_states_lock:
+                market_states: Dict[str, Tuple[float, Dict[str, Any]]] = self._pending_market_states
+                self._pending_market_states = {}
+            for market_name, (queued_timestamp, saved_state) in market_states.items():
+                batch.append((queued_timestamp, self._market_state_write_operation(market_name, saved_state)))
+            if len(batch) == 0:
+                return
+
+            failed: int = 0
+            post_commit_callbacks: List[PostCommitCallback] = []
+            try:
+                with self._sql_manager.get_new_session() as session:
+                    with session.begin():
+                        for _, write_operation in batch:
+                            post_commit_callback: Optional[PostCommitCallback] = write_operation(session)
+                            if post_commit_callback is not None:
+                                post_commit_callbacks.append(post_commit_callback)
+            except Exception:
+                # Retry one record per transaction, so that a single invalid record does not drop the whole batch.
+                # The callbacks of the failed batch are discarded, only the ones of committed records are run.
+                self.logger().warning("Error committing a batch of trades database writes. Retrying one by one.",
+                                      exc_info=True)
+                post_commit_callbacks = []
+                for _, write_operation in batch:
+                    try:
+                        with self._sql_manager.get_new_session() as session:
+                            with session.begin():
+                                post_commit_callback = write_operation(session)
+                    except Exception:
+                        failed += 1
+                        self.logger().error("Error writing a record to the trades database.", exc_info=True)
+                        continue
+                    if post_commit_callback is not None:
+                        post_commit_callbacks.append(post_commit_callback)
+
+            for post_commit_callback in post_commit_callbacks:
+                try:
+                    post_commit_callback()
+                except Exception:
+                    self.logger().error("Unexpected error after committing a trades database write.", exc_info=True)
+
+            oldest_timestamp: float = min(queued_timestamp for queued_timestamp, _ in batch)
+            with self._write_metrics_lock:
+                self._write_metrics.record(len(batch), failed, time.perf_counter() - oldest_timestamp)
+
+    def _market_state_write_operation(self, market_name: str, saved_state: Dict[str, Any]) -> WriteOperation:
+        def write_operation(session: Session):
+            self._save_market_state(self._config_file_path, market_name, saved_state, session)
+        return write_operation
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -153,17 +388,25 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._save_market_state(config_file_path, market.display_name, market.tracking_states, session)
+
+    def _save_market_state(self, config_file_path: str, market_name: str, saved_state: Dict[str, Any],
+                           session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -196,31 +439,33 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        market_name: str = market.display_name
+
+        def write_operation(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._write(write_operation, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -235,47 +480,52 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        market_name: str = market.display_name
+        trade_fee: Dict[str, Any] = evt.trade_fee.to_json()
+
+        def write_operation(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=self.config_file_path,
+                strategy=self.strategy_name,
+                market=market_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=Decimal(
+                    evt.price) if evt.price == evt.price else Decimal(0),
+                amount=Decimal(evt.amount),
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=trade_fee,
+                exchange_trade_id=evt.exchange_trade_id,
+                position=evt.position if evt.position else PositionAction.NIL.value,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            # The fill is only journaled once it is committed, so a failed or retried commit writes no CSV row
+            csv_row: Tuple[Any, ...] = self._trade_fill_csv_row(trade_fill_record)
+            return lambda: self._trade_journal.write_row(csv_row)
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._write(write_operation, market)
+        self._request_flush()
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -287,47 +537,40 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        market_name: str = market.display_name
 
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        def write_operation(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._write(write_operation)
+        self._request_flush()
 
     def append_to_csv(self, trade: TradeFill):
-        csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
-        csv_path = os.path.join(data_path(), csv_filename)
+        self._trade_journal.write_row(self._trade_fill_csv_row(trade))
 
+    @staticmethod
+    def _trade_fill_csv_row(trade: TradeFill) -> Tuple[Any, ...]:
         field_names = tuple(trade.attribute_names_for_file_export())
         field_data = tuple(getattr(trade, attr) for attr in field_names)
 
         # adding extra field "age"
         # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-        age = pd.Timestamp(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)), unit='s').strftime(
-            '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
-        field_names += ("age",)
+        age = time.strftime(
+            "%H:%M:%S",
+            time.gmtime(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)))
+        ) if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_data += (age,)
-
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        return field_data
 
     def _update_order_status(self,
                              event_tag: int,
@@ -345,18 +588,18 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write_operation(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._write(write_operation, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -392,15 +635,17 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        trade_fee: Dict[str, Any] = evt.trade_fee.to_json()
+
+        def write_operation(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=trade_fee)
+            session.add(rp_update)
+
+        self._write(write_operation, connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -410,14 +655,14 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write_operation(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                             strategy=self._strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+
+        self._write(write_operation, connector)
@@ -0,0 +1,131 @@
+import csv
+import os.path
+import threading
+import time
+from shutil import move
+from typing import IO, Any, Optional, Sequence, Tuple
+
+
+class TradeJournal:
+    """
+    Append-only CSV journal of trade fills.
+
+    The file is opened once and kept open. Its header is validated only when the file is opened (a file with a
+    different header is moved aside), and the journal is rotated when it grows beyond ``max_file_size`` bytes or, if
+    ``rotate_daily`` is set, when the UTC day changes.
+
+    By default every row is flushed to disk when it is written. With a positive ``flush_interval`` rows are buffered
+    by the ``csv.writer`` instead, and only flushed by a write or a call to ``flush_if_due()`` at least
+    ``flush_interval`` seconds after the previous flush, so the owner of the journal has to call ``flush_if_due()``
+    periodically.
+    """
+    DEFAULT_FLUSH_INTERVAL: float = 0.0
+    DEFAULT_MAX_FILE_SIZE: int = 100 * 1024 * 1024
+
+    def __init__(self,
+                 file_path: str,
+                 header: Sequence[str],
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 max_file_size: Optional[int] = DEFAULT_MAX_FILE_SIZE,
+                 rotate_daily: bool = False):
+        self._file_path: str = file_path
+        self._header: Tuple[str, ...] = tuple(header)
+        self._flush_interval: float = flush_interval
+        self._max_file_size: Optional[int] = max_file_size
+        self._rotate_daily: bool = rotate_daily
+
+        self._file: Optional[IO[str]] = None
+        self._writer: Optional[Any] = None
+        self._file_day: Optional[str] = None
+        self._file_size: int = 0
+        self._last_flush_timestamp: float = 0.0
+        self._unflushed_rows: int = 0
+        self._lock: threading.RLock = threading.RLock()
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def header(self) -> Tuple[str, ...]:
+        return self._header
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    @property
+    def unflushed_rows(self) -> int:
+        return self._unflushed_rows
+
+    def write_row(self, row: Sequence[Any]):
+        with self._lock:
+            if self._file is not None and self._rotation_due():
+                self._rotate()
+            if self._file is None:
+                self._open()
+            self._file_size += self._writer.writerow(row)
+            self._unflushed_rows += 1
+            self.flush_if_due()
+
+    def flush_if_due(self):
+        with self._lock:
+            if self._unflushed_rows > 0 and time.monotonic() - self._last_flush_timestamp >= self._flush_interval:
+                self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            self._unflushed_rows = 0
+            self._last_flush_timestamp = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self.flush()
+                self._file.close()
+                self._file = None
+                self._writer = None
+
+    def _open(self):
+        if os.path.exists(self._file_path) and not self._file_matches_header():
+            move(self._file_path, self._suffixed_path("_old_" + time.strftime("%Y%m%d-%H%M%S", time.gmtime())))
+        write_header: bool = not os.path.exists(self._file_path)
+        self._file = open(self._file_path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        self._file_day = self._current_day()
+        self._file_size = os.path.getsize(self._file_path)
+        self._last_flush_timestamp = time.monotonic()
+        if write_header:
+            self._file_size += self._writer.writerow(self._header)
+            self._unflushed_rows += 1
+
+    def _file_matches_header(self) -> bool:
+        with open(self._file_path, newline="") as file:
+            first_row = next(csv.reader(file), None)
+        return first_row is not None and tuple(first_row) == self._header
+
+    def _rotation_due(self) -> bool:
+        if self._rotate_daily and self._file_day != self._current_day():
+            return True
+        return self._max_file_size is not None and self._file_size >= self._max_file_size
+
+    def _rotate(self):
+        file_day: str = self._file_day
+        self.close()
+        suffix: str = "_" + (file_day if self._rotate_daily else time.strftime("%Y%m%d-%H%M%S", time.gmtime()))
+        rotated_path: str = self._suffixed_path(suffix)
+        index: int = 1
+        while os.path.exists(rotated_path):
+            rotated_path = self._suffixed_path(f"{suffix}_{index}")
+            index += 1
+        move(self._file_path, rotated_path)
+
+    def _suffixed_path(self, suffix: str) -> str:
+        root, extension = os.path.splitext(self._file_path)
+        return root + suffix + extension
+
+    @staticmethod
+    def _current_day() -> str:
+        return time.strftime("%Y%m%d", time.gmtime())
@@ -127,6 +127,8 @@ class TimeSynchronizerRESTPreProcessor(RESTPreProcessorBase):
     to accept API requests. It ensures the synchronizer has at least one server time sample before being used.
     """
 
+    copy_on_write = True
+
     def __init__(self, synchronizer: TimeSynchronizer, time_provider: Callable):
         super().__init__()
         self._synchronizer = synchronizer
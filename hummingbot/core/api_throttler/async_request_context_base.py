@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
@@ -12,6 +13,16 @@ arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
 
 
+def usable_capacity(limit: int, capacity_share: float) -> int:
+    """
+    :return: the part of the limit a request can use, after leaving the headroom reserved for more urgent requests
+    """
+    if capacity_share >= 1:
+        return limit
+    # The small epsilon compensates float errors like 10 * (1 - 0.8) = 1.9999999999999996
+    return limit - math.floor(float(limit) * (1 - capacity_share) + 1e-9)
+
+
 class AsyncRequestContextBase(ABC):
     """
     An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
@@ -34,6 +45,7 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 capacity_share: float = 1.0,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +54,7 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param capacity_share: Share of each limit this API Request can use, the rest is kept for more urgent requests
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +62,7 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._capacity_share: float = capacity_share
 
     def flush(self):
         """
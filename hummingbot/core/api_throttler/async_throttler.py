@@ -1,13 +1,14 @@
 import time
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
+    usable_capacity,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -32,7 +33,7 @@ class AsyncRequestContext(AsyncRequestContextBase):
                                           if rate_limit.limit_id == task.rate_limit.limit_id and
                                           Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
 
-                if capacity_used + weight > rate_limit.limit:
+                if capacity_used + weight > usable_capacity(rate_limit.limit, self._capacity_share):
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
                         msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
                               f"{rate_limit.time_interval}s) has almost reached. Limits used " \
@@ -57,16 +58,22 @@ class AsyncThrottler(AsyncThrottlerBase):
         Pool 1 - rate limit is 10 calls per second
         Task A which consumes capacity from both Pool 0 and Pool 1 can be called at 10 calls per second, any calls after
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
+    When priority capacity shares are configured, less urgent tasks stop short of the limits, keeping headroom for
+    cancels and new orders.
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the request, defaults to the one set with request_priority()
         :return: An async context (used with async with syntax)
+        :raises ValueError: if the request weight exceeds the capacity its priority can use in any of its limits
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        priority = self.resolve_priority(priority)
+        self._validate_request_weight(rate_limit, related_rate_limits, priority)
         return AsyncRequestContext(
             task_logs=self._task_logs,
             rate_limit=rate_limit,
@@ -74,4 +81,5 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            capacity_share=self.capacity_share(priority),
         )
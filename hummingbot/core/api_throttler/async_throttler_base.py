@@ -3,13 +3,34 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase, usable_capacity
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.logger import HummingbotLogger
 
+# Priority of the requests issued from the current asyncio task, for the requests that do not set one explicitly
+_current_request_priority: ContextVar[Optional[RequestPriority]] = ContextVar("request_priority", default=None)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Sets the priority of the throttled requests issued within the context, including the requests issued by tasks
+    created within it.
+    (i.e.)
+        with request_priority(RequestPriority.CANCEL):
+            await self._place_cancel(order_id, tracked_order)
+    """
+    token = _current_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_request_priority.reset(token)
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -19,6 +40,14 @@ class AsyncThrottlerBase(ABC):
 
     _logger = None
 
+    # Share of every rate limit each priority class can use. The rest is reserved for the more urgent classes.
+    DEFAULT_PRIORITY_CAPACITY_SHARES: Dict[RequestPriority, float] = {
+        RequestPriority.CANCEL: 1.0,
+        RequestPriority.CREATE: 0.95,
+        RequestPriority.USER_QUERY: 0.85,
+        RequestPriority.MARKET_DATA: 0.8,
+    }
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -29,7 +58,8 @@ class AsyncThrottlerBase(ABC):
                  rate_limits: List[RateLimit],
                  retry_interval: float = 0.1,
                  safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
-                 limits_share_percentage: Optional[Decimal] = None
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_capacity_shares: Optional[Dict[RequestPriority, float]] = None,
                  ):
         """
         :param rate_limits: List of RateLimit(s).
@@ -38,6 +68,8 @@ class AsyncThrottlerBase(ABC):
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
             bots operate with the same account)
+        :param priority_capacity_shares: Share (0 to 1) of every limit each request priority can use, to keep headroom
+            for the more urgent requests. If None, all requests can use the whole limits.
         """
         # If configured, users can define the percentage of rate limits to allocate to the throttler.
         share_percentage = limits_share_percentage or self._client_config_map().rate_limits_share_pct
@@ -55,6 +87,8 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        self._priority_capacity_shares: Optional[Dict[RequestPriority, float]] = priority_capacity_shares
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
@@ -84,6 +118,35 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def resolve_priority(self, priority: Optional[RequestPriority] = None) -> RequestPriority:
+        """
+        :return: the given priority, or else the one set with request_priority() for the current task, or else the
+            lowest priority
+        """
+        return priority or _current_request_priority.get() or RequestPriority.MARKET_DATA
+
+    def capacity_share(self, priority: RequestPriority) -> float:
+        if self._priority_capacity_shares is None:
+            return 1.0
+        return self._priority_capacity_shares.get(priority, 1.0)
+
+    def _validate_request_weight(self,
+                                 rate_limit: Optional[RateLimit],
+                                 related_limits: List[Tuple[RateLimit, int]],
+                                 priority: RequestPriority):
+        """
+        Raises a ValueError if the request is heavier than the capacity its priority can use in any of its limits,
+        because it would wait forever for that capacity.
+        """
+        if rate_limit is None:
+            return
+        capacity_share = self.capacity_share(priority)
+        for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits:
+            capacity = usable_capacity(limit.limit, capacity_share)
+            if weight > capacity:
+                raise ValueError(f"The weight {weight} of {rate_limit.limit_id} requests exceeds the capacity "
+                                 f"{capacity} of the {limit.limit_id} limit available to {priority.name} requests.")
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
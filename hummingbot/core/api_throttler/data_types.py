@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,16 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(Enum):
+    """
+    Priority classes of the requests sharing the same rate limits. Lower values are more urgent.
+    """
+    CANCEL = 1
+    CREATE = 2
+    USER_QUERY = 3
+    MARKET_DATA = 4
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
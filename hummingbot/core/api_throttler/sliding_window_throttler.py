@@ -0,0 +1,202 @@
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    usable_capacity,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+
+# Extra delay added when sleeping until a window entry expires, so the entry is gone once the task wakes up
+MIN_WAKE_UP_DELAY = 0.001
+
+
+class RateLimitWindow:
+    """
+    The requests recorded against one rate limit, kept as (expiry timestamp, weight) pairs in expiry order together
+    with the running sum of their weights.
+    """
+
+    __slots__ = ("entries", "capacity_used")
+
+    def __init__(self):
+        self.entries: Deque[Tuple[float, int]] = deque()
+        self.capacity_used: int = 0
+
+    def expire(self, now: float):
+        entries = self.entries
+        while entries and entries[0][0] < now:
+            self.capacity_used -= entries.popleft()[1]
+
+    def add(self, expiry: float, weight: int):
+        self.entries.append((expiry, weight))
+        self.capacity_used += weight
+
+    def capacity_available_at(self, max_capacity_used: int) -> Optional[float]:
+        """
+        :param max_capacity_used: the capacity that can be in use for the pending request to fit in the limit
+        :return: the timestamp after which enough entries expired for the request to fit, or None if it never fits
+        """
+        capacity_used = self.capacity_used
+        for expiry, weight in self.entries:
+            capacity_used -= weight
+            if capacity_used <= max_capacity_used:
+                return expiry
+        return None
+
+
+class SlidingWindowRequestContext:
+    """
+    An async context class ('async with' syntax) that waits until the request fits in all its rate limits.
+    """
+
+    def __init__(self,
+                 throttler: "SlidingWindowThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 capacity_share: float = 1.0):
+        self._throttler: SlidingWindowThrottler = throttler
+        self._rate_limit: Optional[RateLimit] = rate_limit
+        self._related_limits: List[Tuple[RateLimit, int]] = related_limits
+        self._capacity_share: float = capacity_share
+
+    def within_capacity(self) -> bool:
+        return self._throttler.within_capacity(self._rate_limit, self._related_limits, self._capacity_share)
+
+    async def acquire(self):
+        await self._throttler.acquire(self._rate_limit, self._related_limits, self._capacity_share)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Handles call rate limits like AsyncThrottler, but keeps a sliding window per rate limit with the running sum of the
+    weights in it. Checking the capacity is O(1) amortized per limit, regardless of how many requests are in the
+    windows, and a request that has to wait sleeps until enough capacity expires instead of polling.
+
+    Requests run in the event loop thread, so checking the capacity and recording a request happen atomically without
+    a lock. A request waiting for capacity does not block requests on unrelated limits, and with priority capacity
+    shares configured a less urgent request waiting for capacity cannot take the headroom kept for more urgent ones.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_capacity_shares: Optional[Dict[RequestPriority, float]] = None):
+        """
+        :param rate_limits: List of RateLimit(s).
+        :param retry_interval: Time between capacity checks for requests heavier than their updated limits.
+        :param safety_margin_pct: Percentage of the time interval added to it when deciding if a request left a window.
+        :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
+            bots operate with the same account)
+        :param priority_capacity_shares: Share (0 to 1) of every limit each request priority can use, to keep headroom
+            for the more urgent requests. If None, all requests can use the whole limits.
+        """
+        super().__init__(rate_limits=rate_limits,
+                         retry_interval=retry_interval,
+                         safety_margin_pct=safety_margin_pct,
+                         limits_share_percentage=limits_share_percentage,
+                         priority_capacity_shares=priority_capacity_shares)
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._last_max_cap_warning_ts: float = 0.0
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the request, defaults to the one set with request_priority()
+        :return: An async context (used with async with syntax)
+        :raises ValueError: if the request weight exceeds the capacity its priority can use in any of its limits
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        priority = self.resolve_priority(priority)
+        self._validate_request_weight(rate_limit, related_rate_limits, priority)
+        return SlidingWindowRequestContext(throttler=self,
+                                           rate_limit=rate_limit,
+                                           related_limits=related_rate_limits,
+                                           capacity_share=self.capacity_share(priority))
+
+    def within_capacity(self,
+                        rate_limit: Optional[RateLimit],
+                        related_limits: List[Tuple[RateLimit, int]],
+                        capacity_share: float = 1.0) -> bool:
+        return self._next_capacity_check(rate_limit, related_limits, self._time(), capacity_share) is None
+
+    async def acquire(self,
+                      rate_limit: Optional[RateLimit],
+                      related_limits: List[Tuple[RateLimit, int]],
+                      capacity_share: float = 1.0):
+        if rate_limit is None:
+            return
+        while True:
+            now = self._time()
+            next_check = self._next_capacity_check(rate_limit, related_limits, now, capacity_share)
+            if next_check is None:
+                break
+            await asyncio.sleep(max(next_check - now, 0) + MIN_WAKE_UP_DELAY)
+
+        self._window(rate_limit.limit_id).add(self._expiry(rate_limit, now), rate_limit.weight)
+        for limit, weight in related_limits:
+            self._window(limit.limit_id).add(self._expiry(limit, now), weight)
+
+    def capacity_used(self, limit_id: str) -> int:
+        window = self._window(limit_id)
+        window.expire(self._time())
+        return window.capacity_used
+
+    def _next_capacity_check(self,
+                             rate_limit: Optional[RateLimit],
+                             related_limits: List[Tuple[RateLimit, int]],
+                             now: float,
+                             capacity_share: float = 1.0) -> Optional[float]:
+        """
+        :return: None if the request fits in all its limits, otherwise the timestamp at which to check again
+        """
+        if rate_limit is None:
+            return None
+        next_check: Optional[float] = None
+        for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits:
+            window = self._window(limit.limit_id)
+            window.expire(now)
+            capacity = usable_capacity(limit.limit, capacity_share)
+            if window.capacity_used + weight > capacity:
+                self._log_max_capacity_reached(limit, window.capacity_used, now)
+                available_at = window.capacity_available_at(capacity - weight)
+                if available_at is None:
+                    available_at = now + self._retry_interval
+                next_check = available_at if next_check is None else max(next_check, available_at)
+        return next_check
+
+    def _window(self, limit_id: str) -> RateLimitWindow:
+        window = self._windows.get(limit_id)
+        if window is None:
+            window = RateLimitWindow()
+            self._windows[limit_id] = window
+        return window
+
+    def _expiry(self, rate_limit: RateLimit, now: float) -> float:
+        return now + rate_limit.time_interval * (1 + self._safety_margin_pct)
+
+    def _log_max_capacity_reached(self, rate_limit: RateLimit, capacity_used: int, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {capacity_used} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            self._last_max_cap_warning_ts = now
+
+    def _time(self) -> float:
+        return time.time()
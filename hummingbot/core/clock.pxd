@@ -10,3 +10,10 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _min_tick_interval
+        object _tick_trigger
+        list _tick_trigger_listeners
+        bint _profile_ticks
+        dict _tick_durations
+
+    cdef c_tick_iterator(self, object iterator)
@@ -3,16 +3,48 @@
 import asyncio
 import logging
 import time
-from typing import List
+from enum import Enum
+from typing import Dict, List
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.pubsub import PubSub
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
 
+class IteratorTickStats:
+    """
+    Durations of the ticks of one time iterator, in seconds.
+    """
+
+    __slots__ = ("ticks", "total_duration", "max_duration", "last_duration")
+
+    def __init__(self):
+        self.ticks = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.last_duration = 0.0
+
+    @property
+    def average_duration(self) -> float:
+        return self.total_duration / self.ticks if self.ticks > 0 else 0.0
+
+    def record(self, duration: float):
+        self.ticks += 1
+        self.total_duration += duration
+        self.last_duration = duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+    def __repr__(self) -> str:
+        return (f"IteratorTickStats(ticks={self.ticks}, average_duration={self.average_duration:.6f}, "
+                f"max_duration={self.max_duration:.6f}, last_duration={self.last_duration:.6f})")
+
+
 cdef class Clock:
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -21,12 +53,22 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 min_tick_interval: float = 0.1,
+                 profile_ticks: bool = False):
         """
-        :param clock_mode: either real time mode or back testing mode
-        :param tick_size: time interval of each tick
+        :param clock_mode: real time mode, event driven mode or back testing mode
+        :param tick_size: time interval of each tick. In event driven mode, the maximum time between two ticks when no
+        trigger fires
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param min_tick_interval: (event driven mode only) minimum time between two ticks, triggers firing sooner are
+        coalesced into the next tick
+        :param profile_ticks: whether to record how long each iterator takes to tick, see tick_durations
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +78,11 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._min_tick_interval = min_tick_interval
+        self._tick_trigger = asyncio.Event()
+        self._tick_trigger_listeners = []
+        self._profile_ticks = profile_ticks
+        self._tick_durations = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +104,50 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def min_tick_interval(self) -> float:
+        return self._min_tick_interval
+
+    @property
+    def profile_ticks(self) -> bool:
+        return self._profile_ticks
+
+    @profile_ticks.setter
+    def profile_ticks(self, value: bool):
+        self._profile_ticks = value
+
+    @property
+    def tick_durations(self) -> Dict[TimeIterator, IteratorTickStats]:
+        """
+        Tick durations of each iterator, recorded while profile_ticks is enabled.
+        """
+        return self._tick_durations
+
+    def reset_tick_durations(self):
+        self._tick_durations = {}
+
+    def trigger_tick(self):
+        """
+        In event driven mode, wakes the clock up to tick as soon as the minimum tick interval allows. Ignored in the
+        other modes.
+        """
+        self._tick_trigger.set()
+
+    def add_tick_trigger(self, pubsub: PubSub, event_tag: Enum):
+        """
+        Triggers a tick every time the event is emitted, e.g. OrderBookEvent.TopOfBookChanged by an order book, or
+        MarketEvent.OrderFilled by a connector.
+        """
+        listener = EventForwarder(lambda _: self.trigger_tick())
+        pubsub.add_listener(event_tag, listener)
+        # The PubSub only keeps weak references to its listeners
+        self._tick_trigger_listeners.append((pubsub, event_tag, listener))
+
+    def remove_tick_triggers(self):
+        for pubsub, event_tag, listener in self._tick_trigger_listeners:
+            pubsub.remove_listener(event_tag, listener)
+        self._tick_trigger_listeners = []
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -94,7 +185,10 @@ cdef class Clock:
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
 
-        self._current_tick = (now // self._tick_size) * self._tick_size
+        if self._clock_mode is ClockMode.EVENT_DRIVEN:
+            self._current_tick = now
+        else:
+            self._current_tick = (now // self._tick_size) * self._tick_size
         if not self._started:
             for ci in self._current_context:
                 child_iterator = ci
@@ -107,16 +201,18 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                if self._clock_mode is ClockMode.EVENT_DRIVEN:
+                    next_tick_time = await self._wait_for_tick_trigger(now)
+                else:
+                    # Sleep until the next tick
+                    next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                    await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
-                    child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(ci)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
@@ -127,6 +223,45 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    async def _wait_for_tick_trigger(self, now: float) -> float:
+        """
+        Waits until a tick trigger fires or the tick size elapses since the last tick, but no less than the minimum
+        tick interval.
+        :return: the timestamp of the next tick
+        """
+        cdef double max_tick_time = self._current_tick + self._tick_size
+        if not self._tick_trigger.is_set() and now < max_tick_time:
+            try:
+                await asyncio.wait_for(self._tick_trigger.wait(), timeout=max_tick_time - now)
+            except asyncio.TimeoutError:
+                pass
+        now = time.time()
+        if now < self._current_tick + self._min_tick_interval:
+            await asyncio.sleep(self._current_tick + self._min_tick_interval - now)
+            now = time.time()
+        # Triggers fired until now are handled by this tick
+        self._tick_trigger.clear()
+        return now
+
+    cdef c_tick_iterator(self, object iterator):
+        cdef:
+            TimeIterator child_iterator = iterator
+            double start_time
+            object stats
+
+        if not self._profile_ticks:
+            child_iterator.c_tick(self._current_tick)
+            return
+
+        start_time = time.perf_counter()
+        try:
+            child_iterator.c_tick(self._current_tick)
+        finally:
+            stats = self._tick_durations.get(iterator)
+            if stats is None:
+                stats = self._tick_durations[iterator] = IteratorTickStats()
+            stats.record(time.perf_counter() - start_time)
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
@@ -140,9 +275,8 @@ cdef class Clock:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
                 for ci in self._child_iterators:
-                    child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(ci)
                     except StopIteration:
                         raise
                     except Exception:
@@ -6,3 +6,5 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+    # Real time, but ticking as soon as a registered trigger fires instead of only at the tick size boundaries
+    EVENT_DRIVEN = 3
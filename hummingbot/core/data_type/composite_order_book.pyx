@@ -1,7 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from itertools import islice
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
@@ -11,6 +14,9 @@ from libcpp.vector cimport vector
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+NaN = float("nan")
+
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
@@ -28,6 +34,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book.c_invalidate_depth_index()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -78,6 +85,12 @@ cdef class CompositeOrderBook(OrderBook):
     def original_ask_entries(self) -> Iterator[OrderBookRow]:
         return super().ask_entries()
 
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        depth = None if depth is None else max(depth, 0)
+        bids_array = np.array(list(islice(self.bid_entries(), depth)), dtype=np.float64).reshape(-1, 3)
+        asks_array = np.array(list(islice(self.ask_entries(), depth)), dtype=np.float64).reshape(-1, 3)
+        return bids_array, asks_array
+
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
             set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
@@ -192,3 +205,144 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    # The depth queries below walk the composite bid_entries() / ask_entries() rather than the raw C++ sets used by
+    # OrderBook, so that previously recorded fills are taken into account.
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                cumulative_volume += order_book_row.amount
+                if cumulative_volume >= volume:
+                    result_price = order_book_row.price
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                cumulative_volume += order_book_row.amount
+                if cumulative_volume >= volume:
+                    result_price = order_book_row.price
+                    break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                total_cost += order_book_row.amount * order_book_row.price
+                total_volume += order_book_row.amount
+                if total_volume >= volume:
+                    total_cost -= order_book_row.amount * order_book_row.price
+                    total_volume -= order_book_row.amount
+                    incremental_amount = volume - total_volume
+                    total_cost += incremental_amount * order_book_row.price
+                    total_volume += incremental_amount
+                    result_vwap = total_cost / total_volume
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                total_cost += order_book_row.amount * order_book_row.price
+                total_volume += order_book_row.amount
+                if total_volume >= volume:
+                    total_cost -= order_book_row.amount * order_book_row.price
+                    total_volume -= order_book_row.amount
+                    incremental_amount = volume - total_volume
+                    total_cost += incremental_amount * order_book_row.price
+                    total_volume += incremental_amount
+                    result_vwap = total_cost / total_volume
+                    break
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                if cumulative_volume >= quote_volume:
+                    result_price = order_book_row.price
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                if cumulative_volume >= quote_volume:
+                    result_price = order_book_row.price
+                    break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                row_amount = order_book_row.amount
+                if row_amount + cumulative_base_amount >= base_amount:
+                    row_amount = base_amount - cumulative_base_amount
+                cumulative_base_amount += row_amount
+                cumulative_volume += row_amount * order_book_row.price
+                if cumulative_base_amount >= base_amount:
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                row_amount = order_book_row.amount
+                if row_amount + cumulative_base_amount >= base_amount:
+                    row_amount = base_amount - cumulative_base_amount
+                cumulative_base_amount += row_amount
+                cumulative_volume += row_amount * order_book_row.price
+                if cumulative_base_amount >= base_amount:
+                    break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                if order_book_row.price > price:
+                    break
+                cumulative_volume += order_book_row.amount
+                result_price = order_book_row.price
+        else:
+            for order_book_row in self.bid_entries():
+                if order_book_row.price < price:
+                    break
+                cumulative_volume += order_book_row.amount
+                result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                if order_book_row.price > price:
+                    break
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                result_price = order_book_row.price
+        else:
+            for order_book_row in self.bid_entries():
+                if order_book_row.price < price:
+                    break
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
@@ -0,0 +1,235 @@
+import os
+import struct
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+MAGIC = b"HBMD"
+FORMAT_VERSION = 1
+
+FILE_HEADER = struct.Struct("<4sH")
+RECORD_KIND = struct.Struct("<B")
+# code, name length, followed by the utf-8 encoded trading pair
+TRADING_PAIR_RECORD = struct.Struct("<HH")
+# code, recorded timestamp, timestamp, update id, first update id, bid levels, ask levels, followed by the levels as
+# float64 [price, amount] pairs, bids first
+BOOK_RECORD = struct.Struct("<HddqqII")
+# code, recorded timestamp, timestamp, trade id, trade type, price, amount
+TRADE_RECORD = struct.Struct("<HddqBdd")
+
+TRADING_PAIR_KIND = 0
+LEVEL_SIZE = 2 * np.dtype(np.float64).itemsize
+
+RecordedMessage = Tuple[float, OrderBookMessage]
+
+
+class MarketDataFileError(Exception):
+    pass
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def _levels_array(message: OrderBookMessage, side: str) -> np.ndarray:
+    raw_levels = message.content[side]
+    if message.has_raw_levels and isinstance(raw_levels, np.ndarray):
+        levels = raw_levels[:, :2]
+    else:
+        rows = message.bids if side == "bids" else message.asks
+        levels = np.array([(row.price, row.amount) for row in rows], dtype=np.float64).reshape(-1, 2)
+    return np.ascontiguousarray(levels, dtype=np.float64)
+
+
+class MarketDataWriter:
+    """
+    Appends order book snapshot, diff and trade messages to a compact binary market data file.
+
+    The file starts with a magic number and the format version, followed by one record per message in the order they
+    are written. Every record stores the time the message was recorded at, which is what the replay orders messages
+    by, along with the message timestamp. Trading pairs are written once per writer as code definition records, so
+    files can be appended to by several recording sessions.
+
+    Levels, prices and amounts are stored as 64-bit floats. Update and trade ids are stored as 64-bit integers, ids
+    that are not integers are stored as -1.
+    """
+
+    def __init__(self, path: str):
+        self._path: str = path
+        is_new_file: bool = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not is_new_file:
+            _read_file_header(path)
+        self._file: BinaryIO = open(path, "ab")
+        if is_new_file:
+            self._file.write(FILE_HEADER.pack(MAGIC, FORMAT_VERSION))
+        self._codes: Dict[str, int] = {}
+        self._last_recorded_timestamp: float = float("-inf")
+        self._records_count: int = 0
+
+    def __enter__(self) -> "MarketDataWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def records_count(self) -> int:
+        return self._records_count
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, message: OrderBookMessage, recorded_timestamp: float):
+        """
+        Appends a message to the file. Recorded timestamps earlier than the last one written are moved forward to it,
+        so the records of a file are always in replay order.
+        """
+        recorded_timestamp = max(recorded_timestamp, self._last_recorded_timestamp)
+        code: int = self._code(message.trading_pair)
+        timestamp: float = message.timestamp if message.timestamp is not None else recorded_timestamp
+        if message.type is OrderBookMessageType.TRADE:
+            trade_type: int = (TradeType.SELL.value
+                               if message.content["trade_type"] == float(TradeType.SELL.value)
+                               else TradeType.BUY.value)
+            self._file.write(RECORD_KIND.pack(message.type.value))
+            self._file.write(TRADE_RECORD.pack(code,
+                                               recorded_timestamp,
+                                               timestamp,
+                                               _to_int(message.trade_id),
+                                               trade_type,
+                                               float(message.content["price"]),
+                                               float(message.content["amount"])))
+        else:
+            bids: np.ndarray = _levels_array(message, "bids")
+            asks: np.ndarray = _levels_array(message, "asks")
+            self._file.write(RECORD_KIND.pack(message.type.value))
+            self._file.write(BOOK_RECORD.pack(code,
+                                              recorded_timestamp,
+                                              timestamp,
+                                              _to_int(message.update_id),
+                                              _to_int(message.first_update_id),
+                                              len(bids),
+                                              len(asks)))
+            self._file.write(bids.tobytes())
+            self._file.write(asks.tobytes())
+        self._last_recorded_timestamp = recorded_timestamp
+        self._records_count += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def _code(self, trading_pair: str) -> int:
+        code: Optional[int] = self._codes.get(trading_pair)
+        if code is None:
+            code = len(self._codes)
+            self._codes[trading_pair] = code
+            name: bytes = trading_pair.encode("utf8")
+            self._file.write(RECORD_KIND.pack(TRADING_PAIR_KIND))
+            self._file.write(TRADING_PAIR_RECORD.pack(code, len(name)))
+            self._file.write(name)
+        return code
+
+
+class MarketDataReader:
+    """
+    Reads the messages of a market data file written by `MarketDataWriter`, as (recorded timestamp, message) tuples in
+    the order they were written, without loading the whole file in memory.
+
+    The bids and asks of the snapshot and diff messages are float64 arrays of [price, amount] rows, that
+    `OrderBook.apply_raw_snapshot` and `OrderBook.apply_raw_diffs` consume directly. Trade messages have the same
+    content keys as the ones the exchange data sources produce.
+    """
+
+    def __init__(self, path: str):
+        self._path: str = path
+        self._data_offset: int = _read_file_header(path)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __iter__(self) -> Iterator[RecordedMessage]:
+        return self.iter_messages()
+
+    def iter_messages(self) -> Iterator[RecordedMessage]:
+        names: Dict[int, str] = {}
+        with open(self._path, "rb") as file:
+            file.seek(self._data_offset)
+            while True:
+                kind_bytes: bytes = file.read(RECORD_KIND.size)
+                if len(kind_bytes) < RECORD_KIND.size:
+                    return
+                kind: int = RECORD_KIND.unpack(kind_bytes)[0]
+                if kind == TRADING_PAIR_KIND:
+                    code, name_length = TRADING_PAIR_RECORD.unpack(self._read(file, TRADING_PAIR_RECORD.size))
+                    names[code] = self._read(file, name_length).decode("utf8")
+                elif kind == OrderBookMessageType.TRADE.value:
+                    (code, recorded_timestamp, timestamp, trade_id, trade_type, price, amount) = TRADE_RECORD.unpack(
+                        self._read(file, TRADE_RECORD.size))
+                    content = {
+                        "trading_pair": names[code],
+                        "trade_type": float(trade_type),
+                        "trade_id": trade_id,
+                        "update_id": trade_id,
+                        "price": price,
+                        "amount": amount,
+                    }
+                    yield recorded_timestamp, OrderBookMessage(OrderBookMessageType.TRADE, content, timestamp)
+                elif kind in (OrderBookMessageType.SNAPSHOT.value, OrderBookMessageType.DIFF.value):
+                    (code, recorded_timestamp, timestamp, update_id, first_update_id, bids_count, asks_count) = \
+                        BOOK_RECORD.unpack(self._read(file, BOOK_RECORD.size))
+                    # The levels are read into a writable buffer, since the order book needs writable arrays
+                    levels_buffer = bytearray((bids_count + asks_count) * LEVEL_SIZE)
+                    if file.readinto(levels_buffer) < len(levels_buffer):
+                        raise MarketDataFileError(f"Market data file {self._path} ends with a truncated record.")
+                    levels = np.frombuffer(levels_buffer, dtype=np.float64).reshape(-1, 2)
+                    message_type = OrderBookMessageType(kind)
+                    content = {
+                        "trading_pair": names[code],
+                        "update_id": update_id,
+                        "bids": levels[:bids_count],
+                        "asks": levels[bids_count:],
+                    }
+                    if message_type is OrderBookMessageType.DIFF:
+                        content["first_update_id"] = first_update_id
+                    yield recorded_timestamp, OrderBookMessage(message_type, content, timestamp)
+                else:
+                    raise MarketDataFileError(f"Unknown record kind {kind} in market data file {self._path}.")
+
+    def _read(self, file: BinaryIO, size: int) -> bytes:
+        data: bytes = file.read(size)
+        if len(data) < size:
+            raise MarketDataFileError(f"Market data file {self._path} ends with a truncated record.")
+        return data
+
+
+def _read_file_header(path: str) -> int:
+    """
+    Checks the file is a market data file of a supported version.
+
+    :return: the offset of the first record
+    """
+    if os.path.getsize(path) < FILE_HEADER.size:
+        raise MarketDataFileError(f"{path} is not a market data file.")
+    with open(path, "rb") as file:
+        magic, version = FILE_HEADER.unpack(file.read(FILE_HEADER.size))
+    if magic != MAGIC:
+        raise MarketDataFileError(f"{path} is not a market data file.")
+    if version != FORMAT_VERSION:
+        raise MarketDataFileError(f"Unsupported market data file version {version} in {path}.")
+    return FILE_HEADER.size
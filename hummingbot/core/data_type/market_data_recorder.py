@@ -0,0 +1,68 @@
+import logging
+import time
+from typing import Optional
+
+from hummingbot.core.data_type.market_data_file import MarketDataWriter
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.logger import HummingbotLogger
+
+
+class MarketDataRecorder:
+    """
+    Records the order book snapshot, diff and trade messages received by an order book tracker into a market data
+    file, to replay them later with `MarketDataReplayOrderBookTracker`.
+
+    Messages are written as they are received, stamped with the local time, and the file is flushed every
+    `flush_interval` seconds. The recorder should be started before the tracker, to also record the initial order
+    book snapshots.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, order_book_tracker: OrderBookTracker, path: str, flush_interval: float = 1.0):
+        self._order_book_tracker: OrderBookTracker = order_book_tracker
+        self._path: str = path
+        self._flush_interval: float = flush_interval
+        self._writer: Optional[MarketDataWriter] = None
+        self._last_flush_timestamp: float = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def recording(self) -> bool:
+        return self._writer is not None
+
+    @property
+    def records_count(self) -> int:
+        return self._writer.records_count if self._writer is not None else 0
+
+    def start(self):
+        if self._writer is not None:
+            return
+        self._writer = MarketDataWriter(self._path)
+        self._last_flush_timestamp = time.time()
+        self._order_book_tracker.add_message_listener(self._record_message)
+        self.logger().info(f"Recording market data to {self._path}.")
+
+    def stop(self):
+        if self._writer is None:
+            return
+        self._order_book_tracker.remove_message_listener(self._record_message)
+        self._writer.close()
+        self.logger().info(f"Recorded {self._writer.records_count} market data messages to {self._path}.")
+        self._writer = None
+
+    def _record_message(self, message: OrderBookMessage):
+        now: float = time.time()
+        self._writer.write(message, recorded_timestamp=now)
+        if now - self._last_flush_timestamp >= self._flush_interval:
+            self._writer.flush()
+            self._last_flush_timestamp = now
@@ -0,0 +1,192 @@
+import heapq
+from typing import Deque, Dict, Iterator, List, Optional
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_file import MarketDataReader, RecordedMessage
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class MarketDataReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Data source reading the messages recorded in one or more market data files, merged in the order they were
+    recorded. Messages of trading pairs other than the ones of the data source are skipped.
+    """
+
+    def __init__(self, trading_pairs: List[str], data_files: List[str]):
+        super().__init__(trading_pairs)
+        self._readers: List[MarketDataReader] = [MarketDataReader(path) for path in data_files]
+        self._messages: Optional[Iterator[RecordedMessage]] = None
+        self._next_message: Optional[RecordedMessage] = None
+        self._last_traded_prices: Dict[str, float] = {}
+
+    @property
+    def next_timestamp(self) -> Optional[float]:
+        """
+        The recorded timestamp of the next message to replay, None when all the messages have been replayed.
+        """
+        if self._messages is None:
+            self.reset()
+        return self._next_message[0] if self._next_message is not None else None
+
+    def reset(self):
+        """
+        Rewinds the replay to the first recorded message.
+        """
+        self._messages = heapq.merge(*[reader.iter_messages() for reader in self._readers],
+                                     key=lambda recorded_message: recorded_message[0])
+        self._next_message = next(self._messages, None)
+        self._last_traded_prices.clear()
+
+    def messages_until(self, timestamp: float) -> Iterator[OrderBookMessage]:
+        """
+        Yields the messages recorded up to the timestamp that have not been replayed yet, in replay order.
+        """
+        if self._messages is None:
+            self.reset()
+        while self._next_message is not None and self._next_message[0] <= timestamp:
+            message: OrderBookMessage = self._next_message[1]
+            self._next_message = next(self._messages, None)
+            if message.trading_pair not in self._trading_pairs:
+                continue
+            if message.type is OrderBookMessageType.TRADE:
+                self._last_traded_prices[message.trading_pair] = message.content["price"]
+            yield message
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._last_traded_prices[trading_pair]
+                for trading_pair in trading_pairs
+                if trading_pair in self._last_traded_prices}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        for reader in self._readers:
+            for _, message in reader.iter_messages():
+                if message.type is OrderBookMessageType.SNAPSHOT and message.trading_pair == trading_pair:
+                    return message
+        raise ValueError(f"No order book snapshot was recorded for {trading_pair}.")
+
+
+class MarketDataReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker that builds its order books from market data recorded by `MarketDataRecorder`, for backtesting.
+
+    No network task is started, the order books are only updated by `replay_until()`, which applies the recorded
+    messages in order, the same way the live tracker does: an order book is created from the first snapshot of its
+    trading pair, diffs older than the order book snapshot are skipped and trades are applied to the order books,
+    so paper trade exchanges get their trade events. Usually `MarketDataReplayIterator` drives the replay from the
+    clock in backtest mode.
+    """
+
+    def __init__(self, data_files: List[str], trading_pairs: List[str]):
+        super().__init__(data_source=MarketDataReplayDataSource(trading_pairs, data_files),
+                         trading_pairs=trading_pairs)
+        self._replayed_messages_count: int = 0
+
+    @property
+    def data_source(self) -> MarketDataReplayDataSource:
+        return self._data_source
+
+    @property
+    def replayed_messages_count(self) -> int:
+        return self._replayed_messages_count
+
+    def start(self):
+        # The replay position is owned by replay_until() and reset(), so restarting the network of a paper trade
+        # exchange does not rewind it
+        pass
+
+    def stop(self):
+        pass
+
+    def reset(self):
+        """
+        Discards the order books and rewinds the replay to the first recorded message.
+        """
+        self._data_source.reset()
+        self._order_books.clear()
+        self._past_diffs_windows.clear()
+        self._saved_message_queues.clear()
+        self._order_books_initialized.clear()
+        for event in self._order_book_initialized_events.values():
+            event.clear()
+        self._replayed_messages_count = 0
+
+    def replay_until(self, timestamp: float) -> int:
+        """
+        Applies the messages recorded up to the timestamp that have not been replayed yet to the order books.
+
+        :return: the number of messages applied
+        """
+        messages_count: int = 0
+        for message in self._data_source.messages_until(timestamp):
+            self._notify_message_listeners(message)
+            self._apply_message(message)
+            messages_count += 1
+        self._replayed_messages_count += messages_count
+        return messages_count
+
+    def _apply_message(self, message: OrderBookMessage):
+        trading_pair: str = message.trading_pair
+        order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+        if message.type is OrderBookMessageType.DIFF:
+            if order_book is None:
+                # Like in the live tracker, diffs received before the snapshot are applied once it is received
+                self._saved_message_queues[trading_pair].append(message)
+            elif message.update_id >= order_book.snapshot_uid:
+                order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+                self._past_diffs_windows[trading_pair].append(message)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            if order_book is None:
+                self._init_order_book_from_snapshot(message)
+            else:
+                order_book.restore_from_snapshot_and_diffs(message, list(self._past_diffs_windows[trading_pair]))
+        elif order_book is not None:
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=trading_pair,
+                timestamp=message.timestamp,
+                price=float(message.content["price"]),
+                amount=float(message.content["amount"]),
+                type=TradeType.SELL if message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+            ))
+
+    def _init_order_book_from_snapshot(self, snapshot: OrderBookMessage):
+        trading_pair: str = snapshot.trading_pair
+        order_book: OrderBook = self._data_source.order_book_create_function()
+        order_book.apply_raw_snapshot(snapshot.content["bids"], snapshot.content["asks"], snapshot.update_id)
+        saved_diffs: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        for diff in saved_diffs:
+            if diff.update_id > snapshot.update_id:
+                order_book.apply_raw_diffs(diff.content["bids"], diff.content["asks"], diff.update_id)
+                self._past_diffs_windows[trading_pair].append(diff)
+        saved_diffs.clear()
+        self._order_books[trading_pair] = order_book
+        self._order_book_initialized_events[trading_pair].set()
+        if all(self.is_order_book_ready(tracked_pair) for tracked_pair in self._trading_pairs):
+            self._order_books_initialized.set()
+
+
+class MarketDataReplayIterator(PyTimeIterator):
+    """
+    Replays the recorded market data of a tracker up to the clock time on every tick. It has to be added to the clock
+    before the connectors and strategies using the order books, so they see the order books as of the tick time.
+    """
+
+    def __init__(self, order_book_tracker: MarketDataReplayOrderBookTracker):
+        super().__init__()
+        self._order_book_tracker: MarketDataReplayOrderBookTracker = order_book_tracker
+
+    @property
+    def order_book_tracker(self) -> MarketDataReplayOrderBookTracker:
+        return self._order_book_tracker
+
+    @property
+    def finished(self) -> bool:
+        return self._order_book_tracker.data_source.next_timestamp is None
+
+    def tick(self, timestamp: float):
+        self._order_book_tracker.replay_until(timestamp)
+
@@ -20,6 +20,15 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_enabled
+    cdef bint _bid_depth_index_valid
+    cdef bint _ask_depth_index_valid
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_cumulative_base
+    cdef vector[double] _bid_cumulative_quote
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_cumulative_base
+    cdef vector[double] _ask_cumulative_quote
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -30,7 +39,11 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_copy_levels(self, bint is_bid, double[:, ::1] levels)
+    cdef c_invalidate_depth_index(self)
+    cdef c_ensure_depth_index(self, bint is_buy)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef double c_get_amount_at_price(self, bint is_bid, double price)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
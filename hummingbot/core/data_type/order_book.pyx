@@ -37,8 +37,72 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef inline size_t first_at_least(vector[double] &values, double target):
+    # Index of the first element >= target in a non-decreasing vector, or values.size() if there is none.
+    cdef:
+        size_t low = 0
+        size_t high = values.size()
+        size_t mid
+    while low < high:
+        mid = (low + high) // 2
+        if values[mid] >= target:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+cdef inline size_t levels_up_to_price(vector[double] &prices, double price, bint ascending):
+    # Number of leading levels in a best-first price vector that are at or better than the given price.
+    cdef:
+        size_t low = 0
+        size_t high = prices.size()
+        size_t mid
+    while low < high:
+        mid = (low + high) // 2
+        if (prices[mid] > price) if ascending else (prices[mid] < price):
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+cdef inline double last_or_zero(vector[double] &values):
+    return values.back() if values.size() > 0 else 0
+
+
+cdef inline bint price_changed(double previous_price, double price):
+    # NaN means no price, so two NaN prices are the same
+    return previous_price != price and not (previous_price != previous_price and price != price)
+
+
+cdef levels_to_entries(object levels, int64_t update_id, vector[OrderBookEntry] &entries,
+                       bint level_update_ids=False):
+    # Raw levels are either a 2D float64 array with price and amount columns, or exchange style [price, amount, ...]
+    # sequences with string or numeric values. With level_update_ids, the third column is the update id of the level.
+    cdef:
+        double[:, :] levels_view
+        Py_ssize_t i
+        int64_t level_update_id = update_id
+
+    if isinstance(levels, np.ndarray):
+        levels_view = levels
+        entries.reserve(levels_view.shape[0])
+        for i in range(levels_view.shape[0]):
+            if level_update_ids:
+                level_update_id = <int64_t>levels_view[i, 2]
+            entries.push_back(OrderBookEntry(levels_view[i, 0], levels_view[i, 1], level_update_id))
+    else:
+        entries.reserve(len(levels))
+        for level in levels:
+            if level_update_ids:
+                level_update_id = level[2]
+            entries.push_back(OrderBookEntry(float(level[0]), float(level[1]), level_update_id))
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChanged.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -47,7 +111,13 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, depth_index=False):
+        """
+        :param dex: whether overlapping bid / ask entries are resolved the decentralised exchange way
+        :param depth_index: whether to keep lazily rebuilt cumulative depth arrays, so the volume and price depth
+        queries become binary searches instead of linear walks. Worth enabling for deep books that are queried more
+        often than they are updated.
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -56,6 +126,9 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = depth_index
+        self._bid_depth_index_valid = False
+        self._ask_depth_index_valid = False
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -66,6 +139,10 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -82,8 +159,16 @@ cdef class OrderBook(PubSub):
                 self._ask_book.insert(ask)
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
 
+        # Only a side that received diffs or lost entries to the overlap truncation needs its depth index rebuilt.
+        if bids.size() > 0 or self._bid_book.size() != bid_book_size:
+            self._bid_depth_index_valid = False
+        if asks.size() > 0 or self._ask_book.size() != ask_book_size:
+            self._ask_depth_index_valid = False
+
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
         ask_iterator = self._ask_book.begin()
@@ -97,10 +182,15 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        if price_changed(previous_best_bid, self._best_bid) or price_changed(previous_best_ask, self._best_ask):
+            self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG, self)
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
             set[OrderBookEntry].reverse_iterator bid_iterator
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
@@ -109,6 +199,7 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self.c_invalidate_depth_index()
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -137,6 +228,9 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        if price_changed(previous_best_bid, self._best_bid) or price_changed(previous_best_ask, self._best_ask):
+            self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG, self)
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -162,6 +256,22 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def depth_index_enabled(self) -> bool:
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        self._depth_index_enabled = value
+        if not value:
+            self._bid_depth_prices.clear()
+            self._bid_cumulative_base.clear()
+            self._bid_cumulative_quote.clear()
+            self._ask_depth_prices.clear()
+            self._ask_cumulative_base.clear()
+            self._ask_cumulative_quote.clear()
+        self.c_invalidate_depth_index()
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -172,12 +282,56 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.get_snapshot()
+
+    def get_snapshot(self, depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Returns the bids and asks as data frames with the [price, amount, update_id] columns, best levels first.
+
+        :param depth: maximum number of levels per side, the whole book if None
+        """
+        bids_array, asks_array = self.to_numpy(depth)
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, copy=False)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, copy=False)
         return bids_df, asks_df
 
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copies the bids and asks into two float64 arrays of [price, amount, update_id] rows, best levels first.
+
+        :param depth: maximum number of levels per side, the whole book if None
+        """
+        cdef:
+            size_t bid_levels = self._bid_book.size()
+            size_t ask_levels = self._ask_book.size()
+        if depth is not None:
+            bid_levels = min(bid_levels, max(depth, 0))
+            ask_levels = min(ask_levels, max(depth, 0))
+        bids_array = np.empty((bid_levels, 3), dtype=np.float64)
+        asks_array = np.empty((ask_levels, 3), dtype=np.float64)
+        self.c_copy_levels(True, bids_array)
+        self.c_copy_levels(False, asks_array)
+        return bids_array, asks_array
+
+    cdef c_copy_levels(self, bint is_bid, double[:, ::1] levels):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            size_t i
+
+        if is_bid:
+            for i in range(levels.shape[0]):
+                levels[i, 0] = deref(bid_it).getPrice()
+                levels[i, 1] = deref(bid_it).getAmount()
+                levels[i, 2] = deref(bid_it).getUpdateId()
+                inc(bid_it)
+        else:
+            for i in range(levels.shape[0]):
+                levels[i, 0] = deref(ask_it).getPrice()
+                levels[i, 1] = deref(ask_it).getAmount()
+                levels[i, 2] = deref(ask_it).getUpdateId()
+                inc(ask_it)
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -188,6 +342,32 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids, asks, update_id: int, level_update_ids: bool = False):
+        """
+        Applies diffs straight from raw levels, without building an OrderBookRow per level.
+
+        The bids and asks are either float64 arrays with [price, amount] as their first two columns, or sequences of
+        exchange style [price, amount, ...] levels with string or numeric values. All entries get the given update id,
+        unless level_update_ids is set, in which case every level is a [price, amount, update id] triple.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        levels_to_entries(bids, update_id, cpp_bids, level_update_ids)
+        levels_to_entries(asks, update_id, cpp_asks, level_update_ids)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_raw_snapshot(self, bids, asks, update_id: int):
+        """
+        Same as apply_raw_diffs(), but replaces the whole book.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        levels_to_entries(bids, update_id, cpp_bids)
+        levels_to_entries(asks, update_id, cpp_asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -227,13 +407,16 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -254,13 +437,16 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -309,6 +495,58 @@ cdef class OrderBook(PubSub):
                 break
         return retval
 
+    cdef c_invalidate_depth_index(self):
+        self._bid_depth_index_valid = False
+        self._ask_depth_index_valid = False
+
+    cdef c_ensure_depth_index(self, bint is_buy):
+        """
+        Rebuilds the best-first price and cumulative base / quote volume arrays of one side of the book, if that side
+        changed since they were last built.
+        """
+        cdef:
+            double cumulative_base = 0
+            double cumulative_quote = 0
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
+        if is_buy:
+            if self._ask_depth_index_valid:
+                return
+            self._ask_depth_prices.clear()
+            self._ask_cumulative_base.clear()
+            self._ask_cumulative_quote.clear()
+            self._ask_depth_prices.reserve(self._ask_book.size())
+            self._ask_cumulative_base.reserve(self._ask_book.size())
+            self._ask_cumulative_quote.reserve(self._ask_book.size())
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                cumulative_base += deref(ask_it).getAmount()
+                cumulative_quote += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                self._ask_depth_prices.push_back(deref(ask_it).getPrice())
+                self._ask_cumulative_base.push_back(cumulative_base)
+                self._ask_cumulative_quote.push_back(cumulative_quote)
+                inc(ask_it)
+            self._ask_depth_index_valid = True
+        else:
+            if self._bid_depth_index_valid:
+                return
+            self._bid_depth_prices.clear()
+            self._bid_cumulative_base.clear()
+            self._bid_cumulative_quote.clear()
+            self._bid_depth_prices.reserve(self._bid_book.size())
+            self._bid_cumulative_base.reserve(self._bid_book.size())
+            self._bid_cumulative_quote.reserve(self._bid_book.size())
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                cumulative_base += deref(bid_it).getAmount()
+                cumulative_quote += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                self._bid_depth_prices.push_back(deref(bid_it).getPrice())
+                self._bid_cumulative_base.push_back(cumulative_base)
+                self._bid_cumulative_quote.push_back(cumulative_quote)
+                inc(bid_it)
+            self._bid_depth_index_valid = True
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -316,6 +554,20 @@ cdef class OrderBook(PubSub):
             raise EnvironmentError("Order book is empty - no price quote is possible.")
         return self._best_ask if is_buy else self._best_bid
 
+    cdef double c_get_amount_at_price(self, bint is_bid, double price):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = book.find(OrderBookEntry(price, 0, 0))
+        if it == book.end():
+            return 0
+        return deref(it).getAmount()
+
+    def get_amount_at_price(self, is_bid: bool, price: float) -> float:
+        """
+        Returns the amount displayed at exactly the price on one side of the book, 0 if there is no such level.
+        """
+        return self.c_get_amount_at_price(is_bid, price)
+
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
@@ -323,19 +575,39 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_ensure_depth_index(is_buy)
+            prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            cumulative_base = ref(self._ask_cumulative_base) if is_buy else ref(self._bid_cumulative_base)
+            cumulative_quote = ref(self._ask_cumulative_quote) if is_buy else ref(self._bid_cumulative_quote)
+            i = first_at_least(deref(cumulative_base), volume)
+            if i < deref(prices).size():
+                return OrderBookQueryResult(NaN, volume, deref(prices)[i], min(deref(cumulative_base)[i], volume))
+            return OrderBookQueryResult(NaN, volume, NaN, min(last_or_zero(deref(cumulative_base)), volume))
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
@@ -344,30 +616,55 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+            double price
+            double amount
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_ensure_depth_index(is_buy)
+            prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            cumulative_base = ref(self._ask_cumulative_base) if is_buy else ref(self._bid_cumulative_base)
+            cumulative_quote = ref(self._ask_cumulative_quote) if is_buy else ref(self._bid_cumulative_quote)
+            i = first_at_least(deref(cumulative_base), volume)
+            if i < deref(prices).size():
+                if i > 0:
+                    total_volume = deref(cumulative_base)[i - 1]
+                    total_cost = deref(cumulative_quote)[i - 1]
+                total_cost += (volume - total_volume) * deref(prices)[i]
+                return OrderBookQueryResult(NaN, volume, total_cost / volume, volume)
+            return OrderBookQueryResult(NaN, volume, NaN, min(last_or_zero(deref(cumulative_base)), volume))
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                price = deref(ask_it).getPrice()
+                amount = deref(ask_it).getAmount()
+                if total_volume + amount >= volume:
+                    total_cost += (volume - total_volume) * price
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += amount * price
+                total_volume += amount
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                price = deref(bid_it).getPrice()
+                amount = deref(bid_it).getAmount()
+                if total_volume + amount >= volume:
+                    total_cost += (volume - total_volume) * price
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += amount * price
+                total_volume += amount
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -375,19 +672,40 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_ensure_depth_index(is_buy)
+            prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            cumulative_base = ref(self._ask_cumulative_base) if is_buy else ref(self._bid_cumulative_base)
+            cumulative_quote = ref(self._ask_cumulative_quote) if is_buy else ref(self._bid_cumulative_quote)
+            i = first_at_least(deref(cumulative_quote), quote_volume)
+            if i < deref(prices).size():
+                return OrderBookQueryResult(NaN, quote_volume, deref(prices)[i],
+                                            min(deref(cumulative_quote)[i], quote_volume))
+            return OrderBookQueryResult(NaN, quote_volume, NaN, min(last_or_zero(deref(cumulative_quote)), quote_volume))
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
@@ -396,25 +714,50 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_ensure_depth_index(is_buy)
+            prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            cumulative_base = ref(self._ask_cumulative_base) if is_buy else ref(self._bid_cumulative_base)
+            cumulative_quote = ref(self._ask_cumulative_quote) if is_buy else ref(self._bid_cumulative_quote)
+            i = first_at_least(deref(cumulative_base), base_amount)
+            if i < deref(prices).size():
+                if i > 0:
+                    cumulative_base_amount = deref(cumulative_base)[i - 1]
+                    cumulative_volume = deref(cumulative_quote)[i - 1]
+                cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[i]
+            else:
+                cumulative_volume = last_or_zero(deref(cumulative_quote))
+            return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                row_amount = deref(ask_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(ask_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                row_amount = deref(bid_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(bid_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -422,19 +765,39 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_ensure_depth_index(is_buy)
+            prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            cumulative_base = ref(self._ask_cumulative_base) if is_buy else ref(self._bid_cumulative_base)
+            cumulative_quote = ref(self._ask_cumulative_quote) if is_buy else ref(self._bid_cumulative_quote)
+            i = levels_up_to_price(deref(prices), price, is_buy)
+            if i > 0:
+                return OrderBookQueryResult(price, NaN, deref(prices)[i - 1], deref(cumulative_base)[i - 1])
+            return OrderBookQueryResult(price, NaN, NaN, 0)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -442,19 +805,39 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_ensure_depth_index(is_buy)
+            prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            cumulative_base = ref(self._ask_cumulative_base) if is_buy else ref(self._bid_cumulative_base)
+            cumulative_quote = ref(self._ask_cumulative_quote) if is_buy else ref(self._bid_cumulative_quote)
+            i = levels_up_to_price(deref(prices), price, is_buy)
+            if i > 0:
+                return OrderBookQueryResult(price, NaN, deref(prices)[i - 1], deref(cumulative_quote)[i - 1])
+            return OrderBookQueryResult(price, NaN, NaN, 0)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -487,6 +870,12 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        if snapshot.has_raw_levels:
+            self.apply_raw_snapshot(snapshot.content["bids"], snapshot.content["asks"], snapshot.update_id)
+        else:
+            self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            if diff.has_raw_levels:
+                self.apply_raw_diffs(diff.content["bids"], diff.content["asks"], diff.update_id)
+            else:
+                self.apply_diffs(diff.bids, diff.asks, diff.update_id)
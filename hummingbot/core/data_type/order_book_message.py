@@ -1,6 +1,6 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from typing import Dict, List, Optional
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -17,6 +17,8 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     type: OrderBookMessageType
     content: Dict[str, any]
     timestamp: float
+    # Local time at which the order book tracker received the message, set by its diff router
+    queued_timestamp: Optional[float] = None
 
     def __new__(
         cls,
@@ -52,18 +54,28 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
+    @cached_property
     def asks(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
         ]
 
-    @property
+    @cached_property
     def bids(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def has_raw_levels(self) -> bool:
+        """
+        True when the bids and asks in the content are [price, amount, ...] levels (or float64 arrays with those
+        columns) that OrderBook.apply_raw_diffs() can consume directly, i.e. when a subclass does not override how
+        bids and asks are parsed.
+        """
+        message_class = type(self)
+        return message_class.bids is OrderBookMessage.bids and message_class.asks is OrderBookMessage.asks
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -2,17 +2,21 @@ import asyncio
 import logging
 import time
 from collections import defaultdict, deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +25,42 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class DiffBatchMetrics:
+    """
+    Statistics on how the diff messages of one trading pair were coalesced before being applied to its order book.
+    The queue size is the number of messages still waiting when a batch was drained. The queue lag is the time in
+    seconds the oldest message of a batch waited since the diff router received it until it was applied.
+    """
+    batches: int = 0
+    messages: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    last_queue_size: int = 0
+    max_queue_size: int = 0
+    last_queue_lag: float = 0.0
+    max_queue_lag: float = 0.0
+
+    @property
+    def average_batch_size(self) -> float:
+        return self.messages / self.batches if self.batches > 0 else 0.0
+
+    def record(self, batch_size: int, queue_size: int, queue_lag: float):
+        self.batches += 1
+        self.messages += batch_size
+        self.last_batch_size = batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.last_queue_size = queue_size
+        self.max_queue_size = max(self.max_queue_size, queue_size)
+        self.last_queue_lag = queue_lag
+        self.max_queue_lag = max(self.max_queue_lag, queue_lag)
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_DIFF_BATCH_SIZE: int = 500
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 20
+    SNAPSHOT_RETRY_INTERVAL: float = 5.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +69,26 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 throttler: Optional[AsyncThrottlerBase] = None):
+        """
+        :param data_source: the data source providing the order book snapshots and streams
+        :param trading_pairs: the trading pairs to track
+        :param domain: the connector domain, if any
+        :param throttler: the throttler the data source sends its snapshot requests through. When provided, the order
+            books are initialized concurrently and the throttler paces the requests. Otherwise they are initialized one
+            by one, one second apart.
+        """
         self._domain: Optional[str] = domain
+        self._throttler: Optional[AsyncThrottlerBase] = throttler
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_initialized_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        self._order_book_initialization_times: Dict[str, float] = {}
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +98,8 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._diff_batch_metrics: Dict[str, DiffBatchMetrics] = defaultdict(DiffBatchMetrics)
+        self._message_listeners: List[Callable[[OrderBookMessage], None]] = []
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +123,25 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        The trading pairs whose order books are initialized and tracked, so strategies can start on them before all
+        order books are ready.
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    @property
+    def order_book_initialization_times(self) -> Dict[str, float]:
+        """
+        Seconds it took each initialized order book to become ready, counted from the start of the initialization.
+        """
+        return self._order_book_initialization_times
+
+    @property
+    def diff_batch_metrics(self) -> Dict[str, DiffBatchMetrics]:
+        return self._diff_batch_metrics
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -75,6 +149,24 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_book_initialized_events and \
+            self._order_book_initialized_events[trading_pair].is_set()
+
+    def add_message_listener(self, listener: Callable[[OrderBookMessage], None]):
+        """
+        Registers a callable that receives every snapshot, diff and trade message the tracker receives, in the order
+        they are received, e.g. to record them. The initial order book of each trading pair is notified as a snapshot
+        message when its tracking starts.
+        """
+        self._message_listeners.append(listener)
+
+    def remove_message_listener(self, listener: Callable[[OrderBookMessage], None]):
+        self._message_listeners.remove(listener)
+
+    async def wait_for_order_book(self, trading_pair: str):
+        await self._order_book_initialized_events[trading_pair].wait()
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -138,6 +230,9 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_initialized_events.values():
+            event.clear()
+        self._order_book_initialization_times.clear()
 
     async def _update_last_trade_prices_loop(self):
         '''
@@ -173,14 +268,57 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        start_time = time.perf_counter()
+        if self._throttler is None:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                self._start_tracking_order_book(trading_pair, order_book, start_time)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await asyncio.sleep(1)
+        else:
+            # The snapshot requests wait for capacity in the throttler, the semaphore only avoids queueing a request
+            # for every trading pair at once.
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+            await safe_gather(*[self._init_order_book(trading_pair, semaphore, start_time)
+                                for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
+        self.logger().info(f"Initialized {len(self._trading_pairs)} order books in "
+                           f"{time.perf_counter() - start_time:.2f} seconds.")
+
+    async def _init_order_book(self, trading_pair: str, semaphore: asyncio.Semaphore, start_time: float):
+        while True:
+            try:
+                async with semaphore:
+                    order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                self._start_tracking_order_book(trading_pair, order_book, start_time)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{len(self._order_book_initialization_times)}/{len(self._trading_pairs)} "
+                                   f"completed.")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                    f"Retrying after {self.SNAPSHOT_RETRY_INTERVAL:.0f} seconds."
+                )
+                await asyncio.sleep(self.SNAPSHOT_RETRY_INTERVAL)
+
+    def _start_tracking_order_book(self, trading_pair: str, order_book: OrderBook, start_time: float):
+        self._order_books[trading_pair] = order_book
+        if len(self._message_listeners) > 0:
+            bids, asks = order_book.to_numpy()
+            self._notify_message_listeners(OrderBookMessage(
+                OrderBookMessageType.SNAPSHOT,
+                {"trading_pair": trading_pair, "update_id": order_book.snapshot_uid, "bids": bids, "asks": asks},
+                time.time()))
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_initialization_times[trading_pair] = time.perf_counter() - start_time
+        self._order_book_initialized_events[trading_pair].set()
 
     async def _order_book_diff_router(self):
         """
@@ -194,6 +332,8 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                ob_message.queued_timestamp = time.time()
+                self._notify_message_listeners(ob_message)
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
@@ -239,6 +379,7 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
+                self._notify_message_listeners(ob_message)
                 trading_pair: str = ob_message.trading_pair
                 if trading_pair not in self._tracking_message_queues:
                     continue
@@ -255,29 +396,59 @@ class OrderBookTracker:
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        batch_metrics: DiffBatchMetrics = self._diff_batch_metrics[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        diff_batches_applied: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                # Process a message left over from the last batch, then saved messages, if there are any
+                if pending_message is not None:
+                    message, pending_message = pending_message, None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    # Drain the diffs that are already waiting, so a burst is applied to the book as a single update.
+                    # A snapshot ends the batch and is processed right after it, to keep messages in order.
+                    queue_size = len(saved_messages) + message_queue.qsize()
+                    diff_batch: List[OrderBookMessage] = [message]
+                    while len(diff_batch) < self.MAX_DIFF_BATCH_SIZE:
+                        if len(saved_messages) > 0:
+                            next_message = saved_messages.popleft()
+                        elif not message_queue.empty():
+                            next_message = message_queue.get_nowait()
+                        else:
+                            break
+                        if next_message.type is not OrderBookMessageType.DIFF:
+                            pending_message = next_message
+                            break
+                        diff_batch.append(next_message)
+
+                    self._apply_diff_batch(order_book, diff_batch)
+                    past_diffs_window.extend(diff_batch)
+                    now: float = time.time()
+                    queue_lag: float = (max(now - message.queued_timestamp, 0.0)
+                                        if message.queued_timestamp is not None else 0.0)
+                    batch_metrics.record(len(diff_batch), queue_size, queue_lag)
+                    diff_messages_accepted += len(diff_batch)
+                    diff_batches_applied += 1
 
                     # Output some statistics periodically.
-                    now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair} "
+                                            f"in {diff_batches_applied} batches "
+                                            f"(max batch size: {batch_metrics.max_batch_size}, "
+                                            f"max queue size: {batch_metrics.max_queue_size}, "
+                                            f"max queue lag: {batch_metrics.max_queue_lag:.3f}s).")
                         diff_messages_accepted = 0
+                        diff_batches_applied = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
@@ -293,6 +464,57 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _notify_message_listeners(self, message: OrderBookMessage):
+        for listener in self._message_listeners:
+            try:
+                listener(message)
+            except Exception:
+                self.logger().error("Unexpected error notifying an order book message listener.", exc_info=True)
+
+    @staticmethod
+    def _apply_diff_batch(order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        """
+        Applies a batch of diff messages as one net update. For every price level the entry with the highest update id
+        wins, and the last message wins on ties.
+        """
+        if len(diff_messages) == 1:
+            message = diff_messages[0]
+            if message.has_raw_levels:
+                order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+            else:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+            return
+
+        update_id = max(message.update_id for message in diff_messages)
+        if all(message.has_raw_levels for message in diff_messages):
+            # Merge the raw levels as (price, amount, update id) triples, so no OrderBookRow is built for the batch
+            raw_bids: Dict[float, Tuple[float, float, int]] = {}
+            raw_asks: Dict[float, Tuple[float, float, int]] = {}
+            for message in diff_messages:
+                message_update_id: int = message.update_id
+                for raw_levels, message_levels in ((raw_bids, message.content["bids"]),
+                                                   (raw_asks, message.content["asks"])):
+                    if isinstance(message_levels, np.ndarray):
+                        message_levels = message_levels[:, :2].tolist()
+                    for level in message_levels:
+                        price = float(level[0])
+                        current_level = raw_levels.get(price)
+                        if current_level is None or message_update_id >= current_level[2]:
+                            raw_levels[price] = (price, float(level[1]), message_update_id)
+            order_book.apply_raw_diffs(list(raw_bids.values()), list(raw_asks.values()), update_id,
+                                       level_update_ids=True)
+            return
+
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        for message in diff_messages:
+            for levels, rows in ((bids, message.bids), (asks, message.asks)):
+                for row in rows:
+                    current_row = levels.get(row.price)
+                    if current_row is None or row.update_id >= current_row.update_id:
+                        levels[row.price] = row
+        order_book.apply_diffs(list(bids.values()), list(asks.values()), update_id)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -301,6 +523,7 @@ class OrderBookTracker:
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
+                self._notify_message_listeners(trade_message)
                 trading_pair: str = trade_message.trading_pair
 
                 if trading_pair not in self._order_books:
@@ -9,22 +9,30 @@ from typing import (
 
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.event.order_fill_store import OrderFillStore
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 recent_order_fills: int = OrderFillStore.DEFAULT_RECENT_CAPACITY,
+                 spill_directory: Optional[str] = None):
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
+        # Order fills are required for PnL calculation, older ones are kept in the compact order fill store
         self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
-        self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
+        self._order_fills = OrderFillStore(recent_capacity=recent_order_fills, spill_directory=spill_directory)
+        self._logged_events = {OrderFilledEvent: self._order_fills}
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return list(self._generic_logged_events) + list(self._order_filled_logged_events)
+        return list(self._generic_logged_events) + self._order_fills.recent_events
+
+    @property
+    def order_fills(self) -> OrderFillStore:
+        return self._order_fills
 
     @property
     def event_source(self) -> str:
@@ -32,7 +40,7 @@ cdef class EventLogger(EventListener):
 
     def clear(self):
         self._generic_logged_events.clear()
-        self._order_filled_logged_events.clear()
+        self._order_fills.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -34,6 +34,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopOfBookChanged = 902
 
 
 class TokenApprovalEvent(Enum):
@@ -0,0 +1,251 @@
+import tempfile
+from collections import deque
+from decimal import Decimal
+from typing import IO, Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade import Trade
+from hummingbot.core.data_type.trade_fee import (
+    AddedToCostTradeFee,
+    DeductedFromReturnsTradeFee,
+    TokenAmount,
+    TradeFeeBase,
+)
+from hummingbot.core.event.events import OrderFilledEvent
+
+s_decimal_0 = Decimal("0")
+
+# Decimal values are stored as an integer coefficient and a base 10 exponent
+FILL_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    ("price", np.int64),
+    ("price_exponent", np.int8),
+    ("amount", np.int64),
+    ("amount_exponent", np.int8),
+    ("trading_pair", np.int32),
+    ("trade_type", np.int8),
+    ("order_type", np.int8),
+    ("fee_type", np.int8),
+    ("fee_percent", np.int64),
+    ("fee_percent_exponent", np.int8),
+    ("fee_percent_token", np.int32),
+    ("flat_fee_token", np.int32),
+    ("flat_fee_amount", np.int64),
+    ("flat_fee_amount_exponent", np.int8),
+])
+
+FEE_CLASSES = (AddedToCostTradeFee, DeductedFromReturnsTradeFee)
+NO_CODE = -1
+# Exponent marking the decimal values that don't fit in a row, kept aside in a dictionary instead
+OVERSIZED_EXPONENT = np.iinfo(np.int8).min
+MAX_COEFFICIENT = np.iinfo(np.int64).max
+
+
+class OrderFillStore:
+    """
+    Bounded store of the order filled events logged by a connector.
+
+    The most recent ``recent_capacity`` fills are kept as ``OrderFilledEvent`` objects. Older fills are spilled into
+    compact fixed size rows (timestamp, price, amount, side, order type and fee) held in an anonymous memory-mapped
+    file, so the process memory does not grow with the number of fills over the life of a bot. Spilled fills keep
+    what ``Trade`` and the filled balances need; their order ids and exchange trade ids are only kept in the trades
+    database written by the ``MarketsRecorder``.
+
+    Prices, amounts and fees of spilled fills are stored as 64-bit integer coefficients with a decimal exponent, so
+    they are read back as the exact same ``Decimal`` values.
+    """
+    DEFAULT_RECENT_CAPACITY: int = 1000
+    INITIAL_SPILL_CAPACITY: int = 1024
+
+    def __init__(self, recent_capacity: int = DEFAULT_RECENT_CAPACITY, spill_directory: Optional[str] = None):
+        self._recent_events: Deque[OrderFilledEvent] = deque()
+        self._recent_capacity: int = recent_capacity
+        self._spill_directory: Optional[str] = spill_directory
+        self._spill_file: Optional[IO[bytes]] = None
+        self._spilled: Optional[np.memmap] = None
+        self._spilled_count: int = 0
+        self._extra_flat_fees: Dict[int, List[TokenAmount]] = {}
+        self._oversized_decimals: Dict[Tuple[int, str], Decimal] = {}
+        self._codes: Dict[str, int] = {}
+        self._names: List[str] = []
+        # Base and quote balance changes by trading pair, the pairs are only split into tokens when reading them
+        self._total_pair_balances: Dict[str, Tuple[Decimal, Decimal]] = {}
+        self._min_timestamp: float = float("inf")
+
+    def __len__(self) -> int:
+        return self._spilled_count + len(self._recent_events)
+
+    @property
+    def recent_capacity(self) -> int:
+        return self._recent_capacity
+
+    @property
+    def recent_events(self) -> List[OrderFilledEvent]:
+        return list(self._recent_events)
+
+    @property
+    def spilled_count(self) -> int:
+        return self._spilled_count
+
+    def append(self, event: OrderFilledEvent):
+        self._recent_events.append(event)
+        if len(self._recent_events) > self._recent_capacity:
+            self._spill(self._recent_events.popleft())
+        self._min_timestamp = min(self._min_timestamp, event.timestamp)
+        self._add_fill_balances(self._total_pair_balances, event.trading_pair, event.trade_type, event.price,
+                                event.amount)
+
+    def clear(self):
+        self._recent_events.clear()
+        self._close_spill_file()
+        self._spilled_count = 0
+        self._extra_flat_fees.clear()
+        self._oversized_decimals.clear()
+        self._total_pair_balances.clear()
+        self._min_timestamp = float("inf")
+
+    def iter_trades(self, market_name: str) -> Iterator[Trade]:
+        """
+        Yields the fills as trades in the order they were logged, building them only when they are consumed.
+        """
+        for index in range(self._spilled_count):
+            row = self._spilled[index]
+            yield Trade(self._names[row["trading_pair"]],
+                        TradeType(int(row["trade_type"])),
+                        self._get_decimal(index, row, "price"),
+                        self._get_decimal(index, row, "amount"),
+                        OrderType(int(row["order_type"])),
+                        market_name,
+                        float(row["timestamp"]),
+                        self._trade_fee(index, row))
+        for event in list(self._recent_events):
+            yield Trade(event.trading_pair,
+                        event.trade_type,
+                        event.price,
+                        event.amount,
+                        event.order_type,
+                        market_name,
+                        event.timestamp,
+                        event.trade_fee)
+
+    def filled_balances(self, starting_timestamp: float = 0) -> Dict[str, Decimal]:
+        """
+        Calculates total asset balance changes from the fills logged after the timestamp, without fees.
+        """
+        if starting_timestamp < self._min_timestamp:
+            return self._token_balances(self._total_pair_balances)
+        pair_balances: Dict[str, Tuple[Decimal, Decimal]] = {}
+        if self._spilled_count > 0:
+            rows = self._spilled[:self._spilled_count]
+            for index in np.flatnonzero(rows["timestamp"] > starting_timestamp):
+                row = rows[index]
+                self._add_fill_balances(pair_balances,
+                                        self._names[row["trading_pair"]],
+                                        TradeType(int(row["trade_type"])),
+                                        self._get_decimal(index, row, "price"),
+                                        self._get_decimal(index, row, "amount"))
+        for event in self._recent_events:
+            if event.timestamp > starting_timestamp:
+                self._add_fill_balances(pair_balances, event.trading_pair, event.trade_type, event.price, event.amount)
+        return self._token_balances(pair_balances)
+
+    def _spill(self, event: OrderFilledEvent):
+        if self._spilled is None or self._spilled_count == len(self._spilled):
+            self._grow_spill_file()
+        trade_fee: TradeFeeBase = event.trade_fee
+        flat_fees: List[TokenAmount] = trade_fee.flat_fees
+        index: int = self._spilled_count
+        row = self._spilled[index]
+        row["timestamp"] = event.timestamp
+        self._set_decimal(index, row, "price", event.price)
+        self._set_decimal(index, row, "amount", event.amount)
+        row["trading_pair"] = self._code(event.trading_pair)
+        row["trade_type"] = event.trade_type.value
+        row["order_type"] = event.order_type.value
+        row["fee_type"] = 0 if isinstance(trade_fee, AddedToCostTradeFee) else 1
+        self._set_decimal(index, row, "fee_percent", trade_fee.percent)
+        row["fee_percent_token"] = self._code(trade_fee.percent_token)
+        row["flat_fee_token"] = self._code(flat_fees[0].token) if len(flat_fees) > 0 else NO_CODE
+        self._set_decimal(index, row, "flat_fee_amount", flat_fees[0].amount if len(flat_fees) > 0 else s_decimal_0)
+        if len(flat_fees) > 1:
+            self._extra_flat_fees[self._spilled_count] = list(flat_fees[1:])
+        self._spilled_count += 1
+
+    def _grow_spill_file(self):
+        capacity: int = self.INITIAL_SPILL_CAPACITY if self._spilled is None else 2 * len(self._spilled)
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="order_fills_", dir=self._spill_directory)
+        if self._spilled is not None:
+            self._spilled.flush()
+            self._spilled = None
+        self._spill_file.truncate(capacity * FILL_DTYPE.itemsize)
+        self._spilled = np.memmap(self._spill_file, dtype=FILL_DTYPE, mode="r+", shape=(capacity,))
+
+    def _close_spill_file(self):
+        self._spilled = None
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def _trade_fee(self, index: int, row: np.void) -> TradeFeeBase:
+        flat_fees: List[TokenAmount] = []
+        if row["flat_fee_token"] != NO_CODE:
+            flat_fees.append(TokenAmount(self._names[row["flat_fee_token"]],
+                                         self._get_decimal(index, row, "flat_fee_amount")))
+        flat_fees.extend(self._extra_flat_fees.get(index, []))
+        percent_token: Optional[str] = (self._names[row["fee_percent_token"]]
+                                        if row["fee_percent_token"] != NO_CODE else None)
+        return FEE_CLASSES[row["fee_type"]](percent=self._get_decimal(index, row, "fee_percent"),
+                                            percent_token=percent_token,
+                                            flat_fees=flat_fees)
+
+    def _code(self, name: Optional[str]) -> int:
+        if name is None:
+            return NO_CODE
+        code: Optional[int] = self._codes.get(name)
+        if code is None:
+            code = len(self._names)
+            self._codes[name] = code
+            self._names.append(name)
+        return code
+
+    def _set_decimal(self, index: int, row: np.void, field: str, value: Decimal):
+        exponent = value.as_tuple().exponent if value.is_finite() else OVERSIZED_EXPONENT
+        if OVERSIZED_EXPONENT < exponent <= np.iinfo(np.int8).max:
+            coefficient = int(value.scaleb(-exponent))
+            if abs(coefficient) <= MAX_COEFFICIENT:
+                row[field] = coefficient
+                row[f"{field}_exponent"] = exponent
+                return
+        row[field] = 0
+        row[f"{field}_exponent"] = OVERSIZED_EXPONENT
+        self._oversized_decimals[(index, field)] = value
+
+    def _get_decimal(self, index: int, row: np.void, field: str) -> Decimal:
+        exponent = int(row[f"{field}_exponent"])
+        if exponent == OVERSIZED_EXPONENT:
+            return self._oversized_decimals[(index, field)]
+        return Decimal(int(row[field])).scaleb(exponent)
+
+    @staticmethod
+    def _add_fill_balances(pair_balances: Dict[str, Tuple[Decimal, Decimal]],
+                           trading_pair: str,
+                           trade_type: TradeType,
+                           price: Decimal,
+                           amount: Decimal):
+        base_change, quote_change = pair_balances.get(trading_pair, (s_decimal_0, s_decimal_0))
+        if trade_type is TradeType.BUY:
+            pair_balances[trading_pair] = (base_change + amount, quote_change - price * amount)
+        else:
+            pair_balances[trading_pair] = (base_change - amount, quote_change + price * amount)
+
+    @staticmethod
+    def _token_balances(pair_balances: Dict[str, Tuple[Decimal, Decimal]]) -> Dict[str, Decimal]:
+        balances: Dict[str, Decimal] = {}
+        for trading_pair, (base_change, quote_change) in pair_balances.items():
+            base, quote = trading_pair.split("-")[0], trading_pair.split("-")[1]
+            balances[base] = balances.get(base, s_decimal_0) + base_change
+            balances[quote] = balances.get(quote, s_decimal_0) + quote_change
+        return balances
@@ -24,6 +24,14 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
+def _listener_collected_callback(object pubsub_weakref, int64_t event_tag, object listener_weakref):
+    def callback(collected_listener_weakref):
+        pubsub = pubsub_weakref()
+        if pubsub is not None:
+            (<PubSub>pubsub).c_listener_collected(event_tag, listener_weakref)
+    return callback
+
+
 cdef class PubSub:
     """
     PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
@@ -40,7 +48,16 @@ cdef class PubSub:
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
     3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+       Every time the listener snapshot of the event is rebuilt.
+
+    The listeners of each event are kept in an immutable snapshot tuple of weak references, which is what
+    c_trigger_event() iterates. The snapshot is only rebuilt after it is invalidated, that is when a listener is added
+    or removed, or when a listener is garbage collected. Triggering an event with an up to date snapshot does not copy
+    or scan the listeners collection.
+
+    The listeners collection holds the weak references without callback, which Python shares for the same listener,
+    so adding and removing a listener find the same entry. Garbage collection is detected by a separate weak
+    reference with a callback per listener and event, kept in _listener_collected_refs.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,6 +69,10 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self, *args, **kwargs):
+        self._listener_snapshots = {}
+        self._listener_collected_refs = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -83,6 +104,10 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+        self._listener_collected_refs[(event_tag, listener_weakref)] = PyWeakref_NewRef(
+            listener, _listener_collected_callback(PyWeakref_NewRef(self, None), event_tag, listener_weakref)
+        )
+        self.c_invalidate_listener_snapshot(event_tag)
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -94,12 +119,14 @@ cdef class PubSub:
             object listener_weakref = PyWeakref_NewRef(listener, None)
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
             EventListenersIterator lit
+        self._listener_collected_refs.pop((event_tag, listener_weakref), None)
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+        self.c_invalidate_listener_snapshot(event_tag)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -123,43 +150,59 @@ cdef class PubSub:
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
 
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
+    cdef c_listener_collected(self, int64_t event_tag, object listener_weakref):
+        # The dead weak reference is still found in the dict, since its hash is cached and it is compared by identity
+        self._listener_collected_refs.pop((event_tag, listener_weakref), None)
+        self.c_invalidate_listener_snapshot(event_tag)
 
+    cdef c_invalidate_listener_snapshot(self, int64_t event_tag):
+        self._listener_snapshots.pop(event_tag, None)
+
+    cdef tuple c_get_listener_snapshot(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
+            tuple snapshot = self._listener_snapshots.get(event_tag)
+            EventsIterator it
             EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
+            list listener_weakrefs = []
 
-        if it == self._events.end():
-            return []
+        if snapshot is not None:
+            return snapshot
+
+        self.c_remove_dead_listeners(event_tag)
+        it = self._events.find(event_tag)
+        if it != self._events.end():
+            listeners_ptr = address(deref(it).second)
+            for pyref in deref(listeners_ptr):
+                listener_weakrefs.append(<object>pyref.get())
+        snapshot = tuple(listener_weakrefs)
+        self._listener_snapshots[event_tag] = snapshot
+        return snapshot
+
+    cdef c_get_listeners(self, int64_t event_tag):
+        cdef:
+            object listener_weafref
+            object listener
 
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weafref in self.c_get_listener_snapshot(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weafref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
             object listener_weafref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        # The snapshot is an immutable tuple, so listeners are allowed to call c_add_listener() and
+        # c_remove_listener() while the event is being dispatched.
+        for listener_weafref in self.c_get_listener_snapshot(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weafref)
+            if listener is None:
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
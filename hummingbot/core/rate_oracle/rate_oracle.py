@@ -13,7 +13,7 @@ from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGecko
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -30,7 +30,8 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    A conversion graph of the prices is then used to find a rate on a given pair. The graph and the rates found are
+    kept until the prices are refreshed.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -51,6 +52,7 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._rate_graph: Optional[RateConversionGraph] = None
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -143,7 +145,7 @@ class RateOracle(NetworkBase):
         """
         prices = await self._source.get_prices(quote_token=self._quote_token)
         pair = combine_to_hb_trading_pair(base=base_token, quote=self._quote_token)
-        return find_rate(prices, pair)
+        return self._find_rate(prices, pair)
 
     def get_pair_rate(self, pair: str) -> Decimal:
         """
@@ -153,7 +155,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._find_rate(self._prices, pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -179,7 +181,13 @@ class RateOracle(NetworkBase):
         :return A conversion rate
         """
         prices = await self._source.get_prices(quote_token=self._quote_token)
-        return find_rate(prices, pair)
+        return self._find_rate(prices, pair)
+
+    def _find_rate(self, prices: Dict[str, Decimal], pair: str) -> Decimal:
+        # Sources return the same prices dictionary until they refresh it, so the graph is only rebuilt on refreshes
+        if self._rate_graph is None or not self._rate_graph.is_built_from(prices):
+            self._rate_graph = RateConversionGraph(prices)
+        return self._rate_graph.find_rate(pair)
 
     async def _fetch_price_loop(self):
         while True:
@@ -1,10 +1,112 @@
+from collections import deque
 from decimal import Decimal
-from typing import Dict
+from itertools import chain
+from typing import Deque, Dict, Optional
 
-from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
+from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
 
 
+class RateConversionGraph:
+    """
+    Graph of the assets of a dictionary of prices, to find conversion rates without scanning the prices.
+
+    Every price BASE-QUOTE is an edge from BASE to QUOTE, with wrapped token symbols unwrapped (e.g. WETH-USDT is an
+    edge from ETH to USDT, unless ETH-USDT is also priced). Rates are looked up as, in order of preference: the price of
+    the pair, 1 when both tokens are the same once unwrapped, the price of the unwrapped pair or the inverse price of
+    the reverse pair, a rate through one intermediate asset priced against the base, and finally the rate through the
+    shortest path of prices between the tokens.
+
+    Rates are memoized, the graph has to be rebuilt when the prices change.
+    """
+
+    def __init__(self, prices: Dict[str, Decimal]):
+        self._prices: Dict[str, Decimal] = prices
+        self._prices_count: int = len(prices)
+        # asset -> {quote asset: price of the asset in the quote asset}
+        self._quotes: Dict[str, Dict[str, Decimal]] = {}
+        # asset -> {base asset: price of the base asset in the asset}
+        self._bases: Dict[str, Dict[str, Decimal]] = {}
+        self._rates: Dict[str, Optional[Decimal]] = {}
+        for pair, price in prices.items():
+            try:
+                base, quote = split_hb_trading_pair(trading_pair=pair)
+            except ValueError:
+                continue
+            unwrapped_base = unwrap_token_symbol(base)
+            unwrapped_quote = unwrap_token_symbol(quote)
+            # The prices of the unwrapped tokens take precedence over the ones of the wrapped tokens
+            if unwrapped_base == base and unwrapped_quote == quote:
+                self._quotes.setdefault(base, {})[quote] = price
+                self._bases.setdefault(quote, {})[base] = price
+            else:
+                self._quotes.setdefault(unwrapped_base, {}).setdefault(unwrapped_quote, price)
+                self._bases.setdefault(unwrapped_quote, {}).setdefault(unwrapped_base, price)
+
+    def is_built_from(self, prices: Dict[str, Decimal]) -> bool:
+        """
+        Tells whether the graph was built from the prices dictionary. Prices should be replaced rather than modified,
+        since only the dictionary identity and size are checked.
+        """
+        return prices is self._prices and len(prices) == self._prices_count
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the conversion rate of a trading pair, None if the prices do not connect its tokens.
+
+        :param pair: The trading pair, e.g. BTC-USDT
+        """
+        if pair in self._rates:
+            return self._rates[pair]
+        rate = self._find_rate(pair)
+        self._rates[pair] = rate
+        return rate
+
+    def _find_rate(self, pair: str) -> Optional[Decimal]:
+        if pair in self._prices:
+            return self._prices[pair]
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1")
+        base_quotes: Dict[str, Decimal] = self._quotes.get(base, {})
+        if quote in base_quotes:
+            return base_quotes[quote]
+        quote_quotes: Dict[str, Decimal] = self._quotes.get(quote, {})
+        if base in quote_quotes:
+            return Decimal("1") / quote_quotes[base]
+        for link_quote, proxy_price in base_quotes.items():
+            link_quotes: Dict[str, Decimal] = self._quotes.get(link_quote, {})
+            if quote in link_quotes:
+                return proxy_price * link_quotes[quote]
+            if link_quote in quote_quotes:
+                return proxy_price / quote_quotes[link_quote]
+        return self._find_path_rate(base, quote)
+
+    def _find_path_rate(self, base: str, quote: str) -> Optional[Decimal]:
+        """
+        Finds the rate through the path with the fewest conversions between the tokens, using both the prices and their
+        inverse.
+        """
+        rates: Dict[str, Decimal] = {base: Decimal("1")}
+        queue: Deque[str] = deque([base])
+        while queue:
+            asset: str = queue.popleft()
+            asset_rate: Decimal = rates[asset]
+            neighbour_rates = chain(
+                ((quote_asset, asset_rate * price) for quote_asset, price in self._quotes.get(asset, {}).items()),
+                ((base_asset, asset_rate / price) for base_asset, price in self._bases.get(asset, {}).items()))
+            for neighbour, rate in neighbour_rates:
+                if neighbour in rates:
+                    continue
+                rates[neighbour] = rate
+                if neighbour == quote:
+                    return rates[neighbour]
+                queue.append(neighbour)
+        return None
+
+
 def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     '''
     Finds exchange rate for a given trading pair from a dictionary of prices
@@ -13,25 +115,8 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    Use a RateConversionGraph to find several rates from the same prices.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
-    if pair in prices:
-        return prices[pair]
-    base, quote = split_hb_trading_pair(trading_pair=pair)
-    base = unwrap_token_symbol(base)
-    quote = unwrap_token_symbol(quote)
-    if base == quote:
-        return Decimal("1")
-    reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
-    if reverse_pair in prices:
-        return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = split_hb_trading_pair(base_pair)[1]
-        link_pair = combine_to_hb_trading_pair(base=link_quote, quote=quote)
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    return RateConversionGraph(prices).find_rate(pair)
@@ -1,6 +1,7 @@
 from decimal import Decimal
+from typing import Optional
 
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph
 
 
 class FixedRateSource:
@@ -9,6 +10,7 @@ class FixedRateSource:
         super().__init__()
 
         self._known_rates: dict = {}
+        self._rate_graph: Optional[RateConversionGraph] = None
 
     def __str__(self):
         return "fixed rates"
@@ -19,6 +21,7 @@ class FixedRateSource:
         :param rate: The rate to associate to the token pair
         """
         self._known_rates[token_pair] = rate
+        self._rate_graph = None
 
     def get_pair_rate(self, pair: str) -> Decimal:
         """
@@ -28,4 +31,6 @@ class FixedRateSource:
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._known_rates, pair)
+        if self._rate_graph is None:
+            self._rate_graph = RateConversionGraph(self._known_rates)
+        return self._rate_graph.find_rate(pair)
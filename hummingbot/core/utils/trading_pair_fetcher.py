@@ -1,12 +1,65 @@
+import asyncio
+import json
 import logging
+import os
+import time
+from os.path import join
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from hummingbot import data_path
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
 from .async_utils import safe_ensure_future
 
+TRADING_PAIRS_CACHE_VERSION = 1
+TRADING_PAIRS_CACHE_FILE_NAME = "trading_pairs_cache.json"
+
+
+class TradingPairsCache:
+    """
+    On-disk cache of the trading pairs of each connector. The trading pairs of a connector are considered fresh for
+    `ttl` seconds after they were fetched.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 12 * 60 * 60):
+        self._path: str = path or join(data_path(), TRADING_PAIRS_CACHE_FILE_NAME)
+        self._ttl: float = ttl
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get(self, connector_name: str) -> Optional[List[str]]:
+        """
+        Returns the cached trading pairs of the connector, None if they are missing or expired.
+        """
+        entry: Optional[Dict[str, Any]] = self._entries.get(connector_name)
+        if entry is None or time.time() - entry["timestamp"] > self._ttl:
+            return None
+        return entry["trading_pairs"]
+
+    def set(self, connector_name: str, trading_pairs: List[str]):
+        self._entries[connector_name] = {"timestamp": time.time(), "trading_pairs": list(trading_pairs)}
+
+    def save(self):
+        temporary_path: str = f"{self._path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump({"version": TRADING_PAIRS_CACHE_VERSION, "connectors": self._entries}, file)
+        os.replace(temporary_path, self._path)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._path) as file:
+                data: Dict[str, Any] = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != TRADING_PAIRS_CACHE_VERSION:
+            return {}
+        return data["connectors"]
+
 
 class TradingPairFetcher:
     _sf_shared_instance: "TradingPairFetcher" = None
@@ -22,44 +75,56 @@ class TradingPairFetcher:
     def get_instance(cls, client_config_map: Optional["ClientConfigAdapter"] = None) -> "TradingPairFetcher":
         if cls._sf_shared_instance is None:
             client_config_map = client_config_map or cls._get_client_config_map()
-            cls._sf_shared_instance = TradingPairFetcher(client_config_map)
+            cls._sf_shared_instance = TradingPairFetcher(client_config_map, trading_pairs_cache=TradingPairsCache())
         return cls._sf_shared_instance
 
-    def __init__(self, client_config_map: ClientConfigAdapter):
+    def __init__(self, client_config_map: ClientConfigAdapter, trading_pairs_cache: Optional[TradingPairsCache] = None):
+        """
+        :param client_config_map: the client configuration
+        :param trading_pairs_cache: when set, connectors with fresh cached trading pairs are neither instantiated nor
+            queried, and the trading pairs fetched are cached
+        """
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
+        self._trading_pairs_cache: Optional[TradingPairsCache] = trading_pairs_cache
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
     def _fetch_pairs_from_connector_setting(
             self,
             connector_setting: ConnectorSetting,
-            connector_name: Optional[str] = None):
+            connector_name: Optional[str] = None) -> asyncio.Future:
         connector_name = connector_name or connector_setting.name
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
         if connector_setting.uses_gateway_generic_connector():
             connector_params = connector_setting.name.split("_")
             try:
-                safe_ensure_future(self.call_fetch_pairs(
+                return safe_ensure_future(self.call_fetch_pairs(
                     connector.all_trading_pairs(connector_params[1], connector_params[2]), connector_name))
             except TypeError:  # some gateway generic connector like gateway_EVM_Perpetual require an extra name parameter
-                safe_ensure_future(self.call_fetch_pairs(
+                return safe_ensure_future(self.call_fetch_pairs(
                     connector.all_trading_pairs(connector_params[1], connector_params[2], connector_params[0]), connector_name))
         else:
-            safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+            return safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         connector_settings = self._all_connector_settings()
+        fetch_tasks: List[asyncio.Future] = []
         for conn_setting in connector_settings.values():
+            if self._trading_pairs_cache is not None:
+                cached_trading_pairs: Optional[List[str]] = self._trading_pairs_cache.get(conn_setting.name)
+                if cached_trading_pairs is not None:
+                    self.trading_pairs[conn_setting.name] = cached_trading_pairs
+                    continue
             # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
             # data source module for them.
             try:
                 if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
+                    fetch_tasks.append(self._fetch_pairs_from_connector_setting(
                         connector_setting=connector_settings[conn_setting.parent_name],
                         connector_name=conn_setting.name
-                    )
+                    ))
                 else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                    fetch_tasks.append(self._fetch_pairs_from_connector_setting(connector_setting=conn_setting))
             except ModuleNotFoundError:
                 continue
             except Exception:
@@ -68,16 +133,31 @@ class TradingPairFetcher:
 
         self.ready = True
 
+        if self._trading_pairs_cache is not None and len(fetch_tasks) > 0:
+            # The cache file is written once, after every connector answered
+            await asyncio.gather(*fetch_tasks, return_exceptions=True)
+            self._save_trading_pairs_cache()
+
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            # Connectors usually return no trading pairs when they could not fetch them, so those are not cached
+            if self._trading_pairs_cache is not None and len(pairs) > 0:
+                self._trading_pairs_cache.set(exchange_name, pairs)
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
             # In case of error just assign empty list, this is st. the bot won't stop working
             self.trading_pairs[exchange_name] = []
 
+    def _save_trading_pairs_cache(self):
+        try:
+            self._trading_pairs_cache.save()
+        except OSError:
+            self.logger().warning(f"Could not save the trading pairs cache to {self._trading_pairs_cache.path}.",
+                                  exc_info=True)
+
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
         return AllConnectorSettings.get_connector_settings()
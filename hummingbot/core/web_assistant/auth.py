@@ -9,8 +9,14 @@ class AuthBase(ABC):
     Hint: If the authentication requires a simple REST request to acquire information from the
     server that is required in the message signature, this class can be passed a `RESTConnection`
     object that it can use to that end.
+
+    Authentication objects that never modify the request they receive, and return a new request when they need to
+    change it (e.g. a shallow `copy` with new `params`, `data` or `headers`), can set `copy_on_write` to True. The
+    assistants then skip the defensive deep copy of the requests they authenticate.
     """
 
+    copy_on_write: bool = False
+
     @abstractmethod
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         ...
@@ -0,0 +1,56 @@
+import json
+from typing import Any, Callable, Union
+
+import ujson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecoder = Callable[[Union[str, bytes]], Any]
+
+
+def stdlib_json_decoder(data: Union[str, bytes]) -> Any:
+    return json.loads(data)
+
+
+def ujson_decoder(data: Union[str, bytes]) -> Any:
+    return ujson.loads(data, precise_float=True)
+
+
+def _ujson_supports_precise_float() -> bool:
+    try:
+        ujson.loads("0.1", precise_float=True)
+    except TypeError:
+        return False
+    return True
+
+
+def get_default_json_decoder() -> JSONDecoder:
+    """
+    Returns the fastest available JSON decoder: orjson when it is installed, else ujson (with exact float parsing)
+    and the standard library decoder as fallback.
+
+    All the decoders accept both `str` and `bytes` and raise `ValueError` (or a subclass) on invalid documents.
+    """
+    if orjson is not None:
+        return orjson.loads
+    if _ujson_supports_precise_float():
+        return ujson_decoder
+    return stdlib_json_decoder
+
+
+def decode_json(data: Union[str, bytes], decoder: JSONDecoder) -> Any:
+    """
+    Decodes the JSON document with the decoder, and retries with the standard library decoder when it fails, since
+    the fast decoders reject some documents the standard library accepts (e.g. integers beyond 64 bits, or NaN).
+
+    :raises ValueError: if the data is not a JSON document
+    """
+    try:
+        return decoder(data)
+    except (ValueError, OverflowError):
+        if decoder is stdlib_json_decoder:
+            raise
+        return json.loads(data)
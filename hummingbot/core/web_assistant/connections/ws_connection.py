@@ -1,16 +1,19 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder, decode_json, get_default_json_decoder
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    _DATA_MESSAGE_TYPES = (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY)
+
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_decoder: Optional[JSONDecoder] = None):
         self._client_session = aiohttp_client_session
+        self._json_decoder: JSONDecoder = json_decoder or get_default_json_decoder()
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -54,14 +57,18 @@ class WSConnection:
     async def ping(self):
         await self._connection.ping()
 
-    async def receive(self) -> Optional[WSResponse]:
+    async def receive(self, raw: bool = False) -> Optional[WSResponse]:
+        """
+        :param raw: if True the response data is the text or bytes of the frame, not decoded from JSON, to let the
+        caller parse it lazily
+        """
         self._ensure_connected()
         response = None
         while self._connected:
             msg = await self._read_message()
             msg = await self._process_message(msg)
             if msg is not None:
-                response = self._build_resp(msg)
+                response = WSResponse(msg.data) if raw else self._build_resp(msg)
                 break
         return response
 
@@ -81,7 +88,8 @@ class WSConnection:
         return msg
 
     async def _process_message(self, msg: aiohttp.WSMessage) -> Optional[aiohttp.WSMessage]:
-        msg = await self._check_msg_types(msg)
+        if msg.type not in self._DATA_MESSAGE_TYPES:
+            msg = await self._check_msg_types(msg)
         self._update_last_recv_time(msg)
         return msg
 
@@ -122,14 +130,13 @@ class WSConnection:
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = decode_json(msg.data, self._json_decoder)
+            except (ValueError, OverflowError):
                 data = msg.data
         response = WSResponse(data)
         return response
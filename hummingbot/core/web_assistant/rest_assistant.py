@@ -1,6 +1,7 @@
 import json
 from asyncio import wait_for
-from copy import deepcopy
+from copy import copy, deepcopy
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
@@ -17,7 +18,18 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    Requests are deep copied before being pre-processed and authenticated, unless all the pre-processors and the auth
+    applied to them are copy-on-write (see `RESTPreProcessorBase` and `AuthBase`).
     """
+    # Read-only, every request gets its own copy since auth and pre-processors may modify the headers in place
+    _STATIC_HEADERS = {
+        method: MappingProxyType({
+            "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")
+        })
+        for method in RESTMethod
+    }
+
     def __init__(
         self,
         connection: RESTConnection,
@@ -31,6 +43,9 @@ class RESTAssistant:
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._pre_processors_copy_on_write = all(
+            pre_processor.copy_on_write for pre_processor in self._rest_pre_processors
+        )
 
     async def execute_request(
             self,
@@ -44,11 +59,7 @@ class RESTAssistant:
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None) -> Union[str, Dict[str, Any]]:
 
-        headers = headers or {}
-
-        local_headers = {
-            "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
-        local_headers.update(headers)
+        local_headers = {**self._STATIC_HEADERS[method], **(headers or {})}
 
         data = json.dumps(data) if data is not None else data
 
@@ -78,15 +89,31 @@ class RESTAssistant:
             return result
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
+        if not self._is_copy_on_write(request):
+            request = deepcopy(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
-        request.headers["Content-Type"] = "application/json" if request.method.value in ["PUT", "POST"] else "application/x-www-form-urlencoded"
-        # print(json.dumps(request.headers))
+        request = self._with_content_type(request)
         resp = await wait_for(self._connection.call(request), timeout)
         resp = await self._post_process_response(resp)
         return resp
 
+    def _is_copy_on_write(self, request: RESTRequest) -> bool:
+        return self._pre_processors_copy_on_write and (
+            self._auth is None or not request.is_auth_required or self._auth.copy_on_write
+        )
+
+    @staticmethod
+    def _with_content_type(request: RESTRequest) -> RESTRequest:
+        content_type = ("application/json"
+                        if request.method.value in ["PUT", "POST"]
+                        else "application/x-www-form-urlencoded")
+        headers = request.headers or {}
+        if headers.get("Content-Type") != content_type:
+            request = copy(request)
+            request.headers = {**headers, "Content-Type": content_type}
+        return request
+
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
         for pre_processor in self._rest_pre_processors:
             request = await pre_processor.pre_process(request)
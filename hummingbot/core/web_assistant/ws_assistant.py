@@ -19,6 +19,9 @@ class WSAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `WSPreProcessorBase` and `WSPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    Requests are deep copied before being pre-processed and authenticated, unless all the pre-processors and the auth
+    applied to them are copy-on-write (see `WSPreProcessorBase` and `AuthBase`).
     """
 
     def __init__(
@@ -32,6 +35,9 @@ class WSAssistant:
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
+        self._pre_processors_copy_on_write = all(
+            pre_processor.copy_on_write for pre_processor in self._ws_pre_processors
+        )
 
     @property
     def last_recv_time(self) -> float:
@@ -55,7 +61,8 @@ class WSAssistant:
         await self.send(request)
 
     async def send(self, request: WSRequest):
-        request = deepcopy(request)
+        if not self._is_copy_on_write(request):
+            request = deepcopy(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         await self._connection.send(request)
@@ -63,21 +70,33 @@ class WSAssistant:
     async def ping(self):
         await self._connection.ping()
 
-    async def iter_messages(self) -> AsyncGenerator[Optional[WSResponse], None]:
-        """Will yield None and stop if `WSDelegate.disconnect()` is called while waiting for a response."""
+    async def iter_messages(self, raw: bool = False) -> AsyncGenerator[Optional[WSResponse], None]:
+        """Will yield None and stop if `WSDelegate.disconnect()` is called while waiting for a response.
+
+        If `raw` is True the responses data is the undecoded text or bytes of the messages.
+        """
         while self._connection.connected:
-            response = await self._connection.receive()
+            response = await self._connection.receive(raw=raw)
             if response is not None:
-                response = await self._post_process_response(response)
+                if self._ws_post_processors:
+                    response = await self._post_process_response(response)
                 yield response
 
-    async def receive(self) -> Optional[WSResponse]:
-        """This method will return `None` if `WSDelegate.disconnect()` is called while waiting for a response."""
-        response = await self._connection.receive()
-        if response is not None:
+    async def receive(self, raw: bool = False) -> Optional[WSResponse]:
+        """This method will return `None` if `WSDelegate.disconnect()` is called while waiting for a response.
+
+        If `raw` is True the response data is the undecoded text or bytes of the message.
+        """
+        response = await self._connection.receive(raw=raw)
+        if response is not None and self._ws_post_processors:
             response = await self._post_process_response(response)
         return response
 
+    def _is_copy_on_write(self, request: WSRequest) -> bool:
+        return self._pre_processors_copy_on_write and (
+            self._auth is None or not request.is_auth_required or self._auth.copy_on_write
+        )
+
     async def _pre_process_request(self, request: WSRequest) -> WSRequest:
         for pre_processor in self._ws_pre_processors:
             request = await pre_processor.pre_process(request)
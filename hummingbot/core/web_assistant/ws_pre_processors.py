@@ -8,8 +8,13 @@ class WSPreProcessorBase(abc.ABC):
 
     The logic provided by a class implementing this interface is applied to a request
     before it is sent out to the server.
+
+    Pre-processors that never modify the request they receive, and return a new request when they need to change it,
+    can set `copy_on_write` to True to let the assistant skip the defensive deep copy of the request.
     """
 
+    copy_on_write: bool = False
+
     @abc.abstractmethod
     async def pre_process(self, request: WSRequest) -> WSRequest:
         ...
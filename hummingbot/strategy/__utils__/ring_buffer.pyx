@@ -1,10 +1,17 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isinf, isnan, sqrt
+from libc.stdint cimport int64_t
 
 
 pmm_logger = None
 
+
+cdef inline bint _is_finite(double value):
+    return not (isnan(value) or isinf(value))
+
+
 cdef class RingBuffer:
     @classmethod
     def logger(cls):
@@ -15,17 +22,50 @@ cdef class RingBuffer:
 
     def __cinit__(self, int length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
+        # Values are written twice, at the delimiter and one length further, so the buffer content is always
+        # available as a contiguous slice
+        self._buffer = np.zeros(2 * length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._non_finite_count = 0
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double value = val
+            double old_value = 0
+            double old_mean = self._mean
+            int64_t size
+
+        if self._is_full:
+            old_value = self._buffer[self._delimiter]
+            if not _is_finite(old_value):
+                self._non_finite_count -= 1
+        if not _is_finite(value):
+            self._non_finite_count += 1
+        self._buffer[self._delimiter] = value
+        self._buffer[self._delimiter + self._length] = value
+
+        # Welford's algorithm, with the oldest value replaced once the buffer is full
+        if self._is_full:
+            self._mean = old_mean + (value - old_value) / self._length
+            self._m2 += (value - old_value) * (value - self._mean + old_value - old_mean)
+        else:
+            size = self._delimiter + 1
+            self._mean = old_mean + (value - old_mean) / size
+            self._m2 += (value - old_mean) * (value - self._mean)
         self.c_increment_delimiter()
 
+        # Statistics are recalculated once per cycle over the buffer to discard the accumulated rounding errors,
+        # and when the last non finite value leaves the buffer
+        if self._delimiter == 0 or (self._non_finite_count == 0 and not (_is_finite(self._mean)
+                                                                         and _is_finite(self._m2))):
+            self.c_recalculate_statistics()
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
@@ -42,39 +82,66 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum_value(self):
+        if self._non_finite_count > 0:
+            return np.sum(self.c_get_as_numpy_view())
+        return self._mean * self.c_size()
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = np.mean(self.c_get_as_numpy_view()) if self._non_finite_count > 0 else self._mean
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            if self._non_finite_count > 0:
+                result = np.var(self.c_get_as_numpy_view())
+            else:
+                result = max(self._m2, 0) / self._length
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_variance()) if self._non_finite_count == 0 else np.std(self.c_get_as_numpy_view())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef c_recalculate_statistics(self):
+        data = self.c_get_as_numpy_view()
+        self._non_finite_count = np.count_nonzero(~np.isfinite(data))
+        if data.size == 0:
+            self._mean = 0
+            self._m2 = 0
+        else:
+            self._mean = np.mean(data)
+            self._m2 = np.sum(np.square(data - self._mean))
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_view(self):
+        cdef np.ndarray[np.double_t, ndim=1] view
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+            view = np.asarray(self._buffer)[:self._delimiter]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            view = np.asarray(self._buffer)[self._delimiter:self._delimiter + self._length]
+        view.flags.writeable = False
+        return view
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_as_numpy_view().copy()
 
     def __init__(self, length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
+        self._buffer = np.zeros(2 * length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._non_finite_count = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +149,13 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_as_numpy_view(self):
+        """
+        Returns a read only view of the buffer content, from the oldest to the newest value, without copying it.
+        The view is only valid until the next value is added.
+        """
+        return self.c_get_as_numpy_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +163,14 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum_value(self):
+        return self.c_sum_value()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -110,9 +192,12 @@ cdef class RingBuffer:
         data = self.get_as_numpy_array()
 
         self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
+        self._buffer = np.zeros(2 * value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._non_finite_count = 0
 
         for val in data[-value:]:
             self.add_value(val)
@@ -20,9 +20,18 @@ class BaseTrailingIndicator(ABC):
         self._sampling_buffer = RingBuffer(sampling_length)
         self._processing_buffer = RingBuffer(processing_length)
         self._samples_length = 0
+        self._samples_since_recalculation = 0
 
     def add_sample(self, value: float):
+        if self._sampling_buffer.is_full:
+            self._remove_oldest_sample(self._sampling_buffer.get_as_numpy_view())
         self._sampling_buffer.add_value(value)
+        self._samples_since_recalculation += 1
+        if self._samples_since_recalculation >= self._sampling_buffer.length:
+            self._recalculate_statistics()
+            self._samples_since_recalculation = 0
+        else:
+            self._add_newest_sample(self._sampling_buffer.get_as_numpy_view())
         indicator_value = self._indicator_calculation()
         self._processing_buffer.add_value(indicator_value)
 
@@ -30,12 +39,34 @@ class BaseTrailingIndicator(ABC):
     def _indicator_calculation(self) -> float:
         raise NotImplementedError
 
+    def _remove_oldest_sample(self, samples: np.ndarray):
+        """
+        Updates the running statistics of the indicator before the oldest of the samples is dropped from the full
+        sampling buffer
+        """
+        pass
+
+    def _add_newest_sample(self, samples: np.ndarray):
+        """
+        Updates the running statistics of the indicator after the last of the samples is added to the sampling buffer
+        """
+        pass
+
+    def _recalculate_statistics(self):
+        """
+        Recalculates the running statistics of the indicator from the whole sampling buffer. It is called once every
+        sampling length samples to discard accumulated rounding errors, and when the sampling length changes.
+        """
+        pass
+
     def _processing_calculation(self) -> float:
         """
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        if self._processing_buffer.size == 0:
+            return np.nan
+        return self._processing_buffer.sum_value / self._processing_buffer.size
 
     @property
     def current_value(self) -> float:
@@ -51,7 +82,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = self._sampling_buffer.size
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -63,6 +94,8 @@ class BaseTrailingIndicator(ABC):
     @sampling_length.setter
     def sampling_length(self, value):
         self._sampling_buffer.length = value
+        self._recalculate_statistics()
+        self._samples_since_recalculation = 0
 
     @property
     def processing_length(self) -> int:
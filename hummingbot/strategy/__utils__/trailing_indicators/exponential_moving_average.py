@@ -1,5 +1,5 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
+import numpy as np
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
@@ -7,11 +7,27 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._weighted_sum = 0.0
+
+    @property
+    def _decay(self) -> float:
+        # Decay factor of an exponential moving average with a span of sampling length
+        return 1 - 2 / (self.sampling_length + 1)
+
+    def _remove_oldest_sample(self, samples: np.ndarray):
+        self._weighted_sum -= self._decay ** (samples.size - 1) * samples[0]
+
+    def _add_newest_sample(self, samples: np.ndarray):
+        self._weighted_sum = self._decay * self._weighted_sum + samples[-1]
+
+    def _recalculate_statistics(self):
+        samples = self._sampling_buffer.get_as_numpy_view()
+        self._weighted_sum = np.dot(self._decay ** np.arange(samples.size - 1, -1, -1), samples)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        # Same as the adjusted exponentially weighted mean of the samples (pandas ewm with adjust=True)
+        weights_sum = (1 - self._decay ** self._sampling_buffer.size) / (1 - self._decay)
+        return self._weighted_sum / weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
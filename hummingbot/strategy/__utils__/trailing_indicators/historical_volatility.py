@@ -5,14 +5,30 @@ import numpy as np
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._squared_log_returns_sum = 0.0
+
+    def _remove_oldest_sample(self, prices: np.ndarray):
+        if prices.size > 1:
+            self._squared_log_returns_sum -= np.log(prices[1] / prices[0]) ** 2
+
+    def _add_newest_sample(self, prices: np.ndarray):
+        if prices.size > 1:
+            self._squared_log_returns_sum += np.log(prices[-1] / prices[-2]) ** 2
+
+    def _recalculate_statistics(self):
+        log_returns = np.diff(np.log(self._sampling_buffer.get_as_numpy_view()))
+        self._squared_log_returns_sum = np.sum(np.square(log_returns))
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        prices = self._sampling_buffer.get_as_numpy_view()
+        returns_count = prices.size - 1
+        if returns_count > 0:
+            # The log returns sum telescopes to the log return between the oldest and the newest price
+            mean_log_return = np.log(prices[-1] / prices[0]) / returns_count
+            variance = max(self._squared_log_returns_sum / returns_count - mean_log_return ** 2, 0)
+            return np.nan_to_num(variance)
+        return 0.0
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if self._processing_buffer.size > 0:
+            return np.sqrt(self._processing_buffer.sum_value / self._processing_buffer.size)
@@ -13,17 +13,28 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _trade_sample_timestamps
+        dict _amounts_by_price_level
+        dict _trades_by_price_level
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        object _quote_timestamps
+        object _quote_prices
         int _sampling_length
         int _samples_length
+        str _fit_method
+        double _refit_interval
+        double _last_fit_timestamp
+        bint _samples_changed
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_sample(self, double sample_timestamp, double price_level, double amount)
+    cdef c_remove_oldest_trade_sample(self)
     cdef c_estimate_intensity(self)
+    cdef c_estimate_intensity_log_linear(self, object price_levels, object log_lambdas)
 
 cdef class TradesForwarder(EventListener):
     cdef:
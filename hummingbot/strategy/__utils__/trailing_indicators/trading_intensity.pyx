@@ -1,7 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+import heapq
 import warnings
+from bisect import bisect_left
+from collections import deque
 from decimal import Decimal
 from typing import Tuple
 
@@ -17,6 +20,10 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+CURVE_FIT_METHOD = "curve_fit"
+LOG_LINEAR_FIT_METHOD = "log_linear"
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -27,10 +34,25 @@ cdef class TradesForwarder(EventListener):
 
 cdef class TradingIntensityIndicator:
 
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 fit_method: str = CURVE_FIT_METHOD,
+                 refit_interval: float = 0):
+        """
+        :param fit_method: curve_fit fits the exponential intensity with scipy, log_linear fits it in closed form
+        with a least squares regression of the log intensities
+        :param refit_interval: minimum number of seconds between two fits of the intensity
+        """
+        if fit_method not in (CURVE_FIT_METHOD, LOG_LINEAR_FIT_METHOD):
+            raise ValueError(f"Invalid trading intensity fit method {fit_method}.")
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
+        self._trade_sample_timestamps = []
+        self._amounts_by_price_level = {}
+        self._trades_by_price_level = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +60,13 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        # Ascending order of price-timestamp quotes
+        self._quote_timestamps = deque()
+        self._quote_prices = deque()
+        self._fit_method = fit_method
+        self._refit_interval = refit_interval
+        self._last_fit_timestamp = -np.inf
+        self._samples_changed = False
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +76,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -64,57 +92,65 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def fit_method(self) -> str:
+        return self._fit_method
+
+    @property
+    def refit_interval(self) -> float:
+        return self._refit_interval
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        # Descending order of price-timestamp quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quote_timestamps = deque(quote["timestamp"] for quote in reversed(value))
+        self._quote_prices = deque(quote["price"] for quote in reversed(value))
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int quote_idx
+            int latest_processed_quote_idx = -1
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(price)
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+            # The latest quote before the trade
+            quote_idx = bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_idx >= 0:
+                latest_processed_quote_idx = max(latest_processed_quote_idx, quote_idx)
+                self.c_add_trade_sample(self._quote_timestamps[quote_idx] + 1,
+                                        abs(trade.price - float(self._quote_prices[quote_idx])),
+                                        trade.amount)
 
         # THere are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        for _ in range(latest_processed_quote_idx):
+            self._quote_timestamps.popleft()
+            self._quote_prices.popleft()
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        while len(self._trade_samples) > self._sampling_length:
+            self.c_remove_oldest_trade_sample()
 
-        if self.is_sampling_buffer_full:
+        if (self.is_sampling_buffer_full
+                and self._samples_changed
+                and timestamp - self._last_fit_timestamp >= self._refit_interval):
             self.c_estimate_intensity()
+            self._last_fit_timestamp = timestamp
+            self._samples_changed = False
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -123,34 +159,43 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade_sample(self, double sample_timestamp, double price_level, double amount):
+        if sample_timestamp not in self._trade_samples:
+            self._trade_samples[sample_timestamp] = []
+            heapq.heappush(self._trade_sample_timestamps, sample_timestamp)
+        self._trade_samples[sample_timestamp].append((price_level, amount))
+        self._amounts_by_price_level[price_level] = self._amounts_by_price_level.get(price_level, 0) + amount
+        self._trades_by_price_level[price_level] = self._trades_by_price_level.get(price_level, 0) + 1
+        self._samples_changed = True
+
+    cdef c_remove_oldest_trade_sample(self):
+        sample_timestamp = heapq.heappop(self._trade_sample_timestamps)
+        for price_level, amount in self._trade_samples.pop(sample_timestamp):
+            trades_count = self._trades_by_price_level[price_level] - 1
+            if trades_count == 0:
+                del self._trades_by_price_level[price_level]
+                del self._amounts_by_price_level[price_level]
+            else:
+                self._trades_by_price_level[price_level] = trades_count
+                self._amounts_by_price_level[price_level] -= amount
+        self._samples_changed = True
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
             list lambdas
             list price_levels
 
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        # Calculate lambdas / trading intensities from the amounts consolidated by price level
+        price_levels = sorted(self._amounts_by_price_level.keys(), reverse=True)
+        lambdas = [self._amounts_by_price_level[price_level] for price_level in price_levels]
 
         # Adjust to be able to calculate log
         lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
 
+        if self._fit_method == LOG_LINEAR_FIT_METHOD:
+            self.c_estimate_intensity_log_linear(np.array(price_levels), np.log(lambdas_adj))
+            return
+
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
             params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
@@ -164,3 +209,18 @@ cdef class TradingIntensityIndicator:
             self._alpha = Decimal(str(params[0][0]))
         except (RuntimeError, ValueError) as e:
             pass
+
+    cdef c_estimate_intensity_log_linear(self, object price_levels, object log_lambdas):
+        # Least squares fit of log(lambda) = log(alpha) - kappa * price_level, with kappa bounded to be positive
+        if price_levels.size < 2 or np.ptp(price_levels) == 0:
+            return
+        price_levels_mean = np.mean(price_levels)
+        log_lambdas_mean = np.mean(log_lambdas)
+        slope = (np.dot(price_levels - price_levels_mean, log_lambdas - log_lambdas_mean)
+                 / np.dot(price_levels - price_levels_mean, price_levels - price_levels_mean))
+        if slope > 0:
+            self._kappa = 0
+            self._alpha = np.exp(log_lambdas_mean)
+        else:
+            self._kappa = -slope
+            self._alpha = np.exp(log_lambdas_mean - slope * price_levels_mean)
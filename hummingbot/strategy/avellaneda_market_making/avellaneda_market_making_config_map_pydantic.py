@@ -1,6 +1,6 @@
 from datetime import datetime, time
 from decimal import Decimal
-from typing import Dict, Optional, Union
+from typing import Dict, Literal, Optional, Union
 
 from pydantic import Field, root_validator, validator
 
@@ -307,6 +307,24 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             prompt=lambda mi: "Enter amount of ticks that will be stored to estimate order book liquidity",
         ),
     )
+    trading_intensity_fit_method: Literal["curve_fit", "log_linear"] = Field(
+        default="curve_fit",
+        description=(
+            "How the order book liquidity is fitted from the trades: curve_fit runs a non-linear fit of the intensity,"
+            " log_linear fits its logarithm in closed form, which is much faster."
+        ),
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the method to fit the order book liquidity (curve_fit/log_linear)",
+        ),
+    )
+    trading_intensity_refit_interval: float = Field(
+        default=0.,
+        description="The minimum number of seconds between two fits of the order book liquidity.",
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the minimum number of seconds between two order book liquidity estimations",
+        ),
+    )
     order_levels_mode: Union[SingleOrderLevelModel, MultiOrderLevelModel] = Field(
         default=SingleOrderLevelModel.construct(),
         description="Allows activating multi-order levels.",
@@ -449,7 +467,7 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             raise ValueError(ret)
         return v
 
-    @validator("min_spread", pre=True)
+    @validator("min_spread", "trading_intensity_refit_interval", pre=True)
     def validate_decimal_zero_or_above(cls, v: str):
         """Used for client-friendly error output."""
         ret = validate_decimal(v, min_value=Decimal("0"), inclusive=True)
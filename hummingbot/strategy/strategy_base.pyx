@@ -1,4 +1,5 @@
 from decimal import Decimal
+import itertools
 import logging
 import pandas as pd
 from typing import (
@@ -12,7 +13,6 @@ from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.connector.connector_base cimport ConnectorBase
 from hummingbot.core.data_type.trade import Trade
-from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.data_type.common import OrderType, PositionAction
 from hummingbot.strategy.order_tracker import OrderTracker
 from hummingbot.connector.derivative_base import DerivativeBase
@@ -190,23 +190,10 @@ cdef class StrategyBase(TimeIterator):
     def trades(self) -> List[Trade]:
         """
         Returns a list of all completed trades from the market.
-        The trades are taken from the market event logs.
+        The trades are built from the order fills logged by the markets when requested.
         """
-        def event_to_trade(order_filled_event: OrderFilledEvent, market_name: str):
-            return Trade(order_filled_event.trading_pair,
-                         order_filled_event.trade_type,
-                         order_filled_event.price,
-                         order_filled_event.amount,
-                         order_filled_event.order_type,
-                         market_name,
-                         order_filled_event.timestamp,
-                         order_filled_event.trade_fee)
-        past_trades = []
-        for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
-            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
-
+        past_trades = itertools.chain.from_iterable(market.order_fills.iter_trades(market.display_name)
+                                                    for market in self.active_markets)
         return sorted(past_trades, key=lambda x: x.timestamp)
 
     def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+"""
+Measures acquire() throughput of the throttler implementations with many requests already inside the rate limit
+windows, as happens under heavy order placement with linked limits.
+
+Usage: python test/debug/benchmark_async_throttler.py [tasks_in_window] [acquires]
+"""
+
+import asyncio
+import sys
+import time
+from decimal import Decimal
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+POOL_IDS = [f"POOL_{i}" for i in range(4)]
+ENDPOINT_ID = "/api/v3/order"
+
+
+def rate_limits(tasks_in_window: int, acquires: int):
+    # Large enough for every request to fit, so the benchmark measures the capacity checks and not the waiting
+    limit = 2 * (tasks_in_window + acquires)
+    pools = [RateLimit(limit_id=pool_id, limit=limit, time_interval=60) for pool_id in POOL_IDS]
+    endpoint = RateLimit(limit_id=ENDPOINT_ID, limit=limit, time_interval=60,
+                         linked_limits=[LinkedLimitWeightPair(pool_id) for pool_id in POOL_IDS])
+    return pools + [endpoint]
+
+
+async def acquire_many(throttler: AsyncThrottlerBase, count: int):
+    for _ in range(count):
+        async with throttler.execute_task(ENDPOINT_ID):
+            pass
+
+
+def fill_windows(throttler: AsyncThrottlerBase, tasks_in_window: int):
+    # Records the requests directly, filling the list based throttler through acquire() would take quadratic time
+    now = time.time()
+    rate_limit, related_limits = throttler.get_related_limits(ENDPOINT_ID)
+    for i in range(tasks_in_window):
+        timestamp = now - 30 * i / tasks_in_window
+        for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits:
+            if isinstance(throttler, SlidingWindowThrottler):
+                throttler._window(limit.limit_id).entries.appendleft((timestamp + limit.time_interval, weight))
+                throttler._window(limit.limit_id).capacity_used += weight
+            else:
+                throttler._task_logs.append(TaskLog(timestamp=timestamp, rate_limit=limit, weight=weight))
+
+
+def acquires_per_second(throttler: AsyncThrottlerBase, tasks_in_window: int, acquires: int) -> float:
+    ev_loop = asyncio.get_event_loop()
+    fill_windows(throttler, tasks_in_window)
+    start = time.perf_counter()
+    ev_loop.run_until_complete(acquire_many(throttler, acquires))
+    return acquires / (time.perf_counter() - start)
+
+
+def main():
+    tasks_in_window = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    acquires = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    limits = rate_limits(tasks_in_window, acquires)
+
+    print(f"{tasks_in_window} tasks in window, {len(POOL_IDS)} linked limits, {acquires} timed acquires")
+    for throttler_class in (AsyncThrottler, SlidingWindowThrottler):
+        throttler = throttler_class(rate_limits=limits, limits_share_percentage=Decimal("100"))
+        rate = acquires_per_second(throttler, tasks_in_window, acquires)
+        print(f"{throttler_class.__name__:<24} {rate:>12,.0f} acquires/s")
+
+
+if __name__ == "__main__":
+    main()
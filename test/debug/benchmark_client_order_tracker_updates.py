@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+"""
+Measures the time `ClientOrderTracker` takes to process user stream order and trade updates with hundreds of active
+and cached orders, comparing the legacy lookups (linear scan by exchange order id and merged dictionaries built on
+every access) with the maintained exchange order id index and read-only order views. Order updates only carry the
+exchange order id, like the ones of many exchanges' user streams.
+
+Usage: python test/debug/benchmark_client_order_tracker_updates.py [updates] [active orders] [cached orders]
+"""
+
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from typing import Dict, Optional
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class BenchmarkExchange(ExchangeBase):
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return dict()
+
+
+class LegacyClientOrderTracker(ClientOrderTracker):
+
+    @property
+    def cached_orders(self) -> Dict[str, InFlightOrder]:
+        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+
+    @property
+    def all_orders(self) -> Dict[str, InFlightOrder]:
+        return {**self.active_orders, **self.cached_orders}
+
+    @property
+    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+
+    @property
+    def lost_orders(self) -> Dict[str, InFlightOrder]:
+        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+
+    def fetch_order(
+        self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
+    ) -> Optional[InFlightOrder]:
+        found_order = None
+        if client_order_id in self.all_orders:
+            found_order = self.all_orders[client_order_id]
+        elif exchange_order_id is not None:
+            found_order = next(
+                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id),
+                None)
+        return found_order
+
+
+def build_tracker(tracker_class, active_orders: int, cached_orders: int) -> ClientOrderTracker:
+    connector = BenchmarkExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    connector._set_current_timestamp(1640000000.0)
+    tracker = tracker_class(connector=connector)
+    # Cached orders are the ones that stopped being tracked recently, so they are older than the active ones
+    for i in range(cached_orders + active_orders):
+        tracker.start_tracking_order(InFlightOrder(
+            client_order_id=f"OID{i}",
+            exchange_order_id=f"EOID{i}",
+            trading_pair=TRADING_PAIR,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1e9"),
+            creation_timestamp=1640000000.0,
+            price=Decimal("1"),
+            initial_state=OrderState.OPEN,
+        ))
+        if i < cached_orders:
+            tracker.stop_tracking_order(f"OID{i}")
+    return tracker
+
+
+async def time_updates(tracker: ClientOrderTracker, updates: int, active_orders: int, cached_orders: int) -> float:
+    fee = AddedToCostTradeFee()
+    start = time.perf_counter()
+    for i in range(updates):
+        order_number = cached_orders + i % active_orders
+        if i % 2 == 0:
+            await tracker.process_order_update(OrderUpdate(
+                exchange_order_id=f"EOID{order_number}",
+                trading_pair=TRADING_PAIR,
+                update_timestamp=1640000000.0 + i,
+                new_state=OrderState.PARTIALLY_FILLED,
+            ))
+        else:
+            tracker.process_trade_update(TradeUpdate(
+                trade_id=f"TID{i}",
+                client_order_id=f"OID{order_number}",
+                exchange_order_id=f"EOID{order_number}",
+                trading_pair=TRADING_PAIR,
+                fill_timestamp=1640000000.0 + i,
+                fill_price=Decimal("1"),
+                fill_base_amount=Decimal("1"),
+                fill_quote_amount=Decimal("1"),
+                fee=fee,
+            ))
+    return time.perf_counter() - start
+
+
+async def main():
+    updates = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    active_orders = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    cached_orders = int(sys.argv[3]) if len(sys.argv) > 3 else 700
+    print(f"{updates} order and trade updates, {active_orders} active orders, {cached_orders} cached orders")
+    for name, tracker_class in (
+        ("legacy lookups:", LegacyClientOrderTracker),
+        ("indexed lookups:", ClientOrderTracker),
+    ):
+        tracker = build_tracker(tracker_class, active_orders, cached_orders)
+        elapsed = await time_updates(tracker, updates, active_orders, cached_orders)
+        print(f"  {name:<20}{elapsed * 1e6 / updates:10.2f} us/update")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
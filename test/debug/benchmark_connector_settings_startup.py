@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+"""
+Measures the cold start cost of creating the connector settings, as `bin/hummingbot.py` does on startup, comparing
+the connector scan importing every connector utils module (no connector manifest yet) with the read of the connector
+manifest. Every measure runs in a new interpreter, so the modules imported by a previous run are not reused.
+
+Usage: python test/debug/benchmark_connector_settings_startup.py [runs]
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from statistics import median
+from typing import List, Tuple
+
+from hummingbot import root_path
+
+STARTUP_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import hummingbot
+hummingbot.set_data_path(sys.argv[1])
+from hummingbot.client.settings import AllConnectorSettings
+connectors_count = len(AllConnectorSettings.create_connector_settings())
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "connectors": connectors_count,
+    "connector_modules": sum(1 for name in sys.modules if name.startswith("hummingbot.connector.")),
+}))
+"""
+
+
+def run_startup(data_path: str) -> Tuple[float, int, int]:
+    output: str = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT, data_path],
+                                 cwd=str(root_path()),
+                                 check=True,
+                                 capture_output=True,
+                                 text=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["elapsed"], result["connectors"], result["connector_modules"]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    scan_results: List[Tuple[float, int, int]] = []
+    manifest_results: List[Tuple[float, int, int]] = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as data_path:
+            # The first start builds the manifest, the next one reads it
+            scan_results.append(run_startup(data_path))
+            manifest_results.append(run_startup(data_path))
+    print(f"Connector settings creation, median of {runs} cold starts")
+    for name, results in (("connector scan:", scan_results), ("connector manifest:", manifest_results)):
+        print(f"  {name:<24}{median(result[0] for result in results) * 1e3:10.1f} ms "
+              f"({results[0][1]} connectors, {results[0][2]} connector modules imported)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+"""
+Compares linear depth walks with the cumulative depth index of `OrderBook` under mixes of diff updates and queries.
+
+Each round applies one diff message touching a few levels near the top of the book and then runs a number of depth
+queries against both sides; the index is rebuilt lazily once per round on each side that changed.
+
+Usage: python test/debug/benchmark_order_book_depth_index.py [levels] [rounds]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+MID_PRICE = 10000.0
+TICK = 0.01
+
+
+def make_order_book(levels: int, depth_index: bool) -> OrderBook:
+    update_ids = np.zeros(levels)
+    bids = np.column_stack([MID_PRICE - TICK * (np.arange(levels) + 1), np.random.uniform(0.1, 2.0, levels), update_ids])
+    asks = np.column_stack([MID_PRICE + TICK * (np.arange(levels) + 1), np.random.uniform(0.1, 2.0, levels), update_ids])
+    order_book = OrderBook(depth_index=depth_index)
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def make_diffs(rounds: int, levels_per_diff: int = 5):
+    diffs = []
+    for update_id in range(1, rounds + 1):
+        offsets = np.random.randint(1, 50, size=(2, levels_per_diff))
+        amounts = np.random.uniform(0.0, 2.0, size=(2, levels_per_diff))
+        bids = np.column_stack([MID_PRICE - TICK * offsets[0], amounts[0], np.full(levels_per_diff, update_id)])
+        asks = np.column_stack([MID_PRICE + TICK * offsets[1], amounts[1], np.full(levels_per_diff, update_id)])
+        diffs.append((bids, asks))
+    return diffs
+
+
+def run(order_book: OrderBook, diffs, volumes, queries_per_update: int) -> float:
+    start = time.perf_counter()
+    query_index = 0
+    for bids, asks in diffs:
+        order_book.apply_numpy_diffs(bids, asks)
+        for _ in range(queries_per_update):
+            volume = volumes[query_index % len(volumes)]
+            order_book.get_price_for_volume(query_index % 2 == 0, volume)
+            order_book.get_vwap_for_volume(query_index % 2 == 1, volume)
+            query_index += 1
+    return time.perf_counter() - start
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    diffs = make_diffs(rounds)
+    volumes = np.random.uniform(0.1, levels / 2, size=1000).tolist()
+
+    print(f"{levels} levels per side, {rounds} diff updates")
+    for queries_per_update in (1, 10, 100):
+        linear = run(make_order_book(levels, False), diffs, volumes, queries_per_update)
+        indexed = run(make_order_book(levels, True), diffs, volumes, queries_per_update)
+        print(f"{queries_per_update:>4} query pairs/update   linear: {linear * 1e3:>9.1f} ms   "
+              f"indexed: {indexed * 1e3:>9.1f} ms   x{linear / indexed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
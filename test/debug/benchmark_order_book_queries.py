@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+"""
+Measures depth query throughput on deep order books.
+
+The "generator" figures walk `bid_entries()` / `ask_entries()` the way the depth queries used to, allocating one
+`OrderBookRow` per level, while the "native" figures call the `OrderBook` query API directly.
+
+Usage: python test/debug/benchmark_order_book_queries.py [levels] [iterations]
+"""
+
+import sys
+import time
+from typing import Callable
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def make_order_book(levels: int) -> OrderBook:
+    mid_price = 10000.0
+    tick = 0.01
+    amounts = np.random.uniform(0.1, 2.0, size=(2, levels))
+    update_ids = np.arange(levels, dtype=np.float64)
+    bids = np.column_stack([mid_price - tick * (np.arange(levels) + 1), amounts[0], update_ids])
+    asks = np.column_stack([mid_price + tick * (np.arange(levels) + 1), amounts[1], update_ids])
+    order_book = OrderBook()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def generator_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    cumulative_volume = 0.0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return float("nan")
+
+
+def generator_vwap_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    total_cost = total_volume = 0.0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        if total_volume + row.amount >= volume:
+            return (total_cost + (volume - total_volume) * row.price) / volume
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+    return float("nan")
+
+
+def queries_per_second(query: Callable[[bool, float], object], volumes: np.ndarray) -> float:
+    start = time.perf_counter()
+    for i, volume in enumerate(volumes):
+        query(i % 2 == 0, volume)
+    return len(volumes) / (time.perf_counter() - start)
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    order_book = make_order_book(levels)
+    # Volumes spread from the top of the book down to roughly half its depth.
+    volumes = np.random.uniform(0.1, levels / 2, size=iterations).tolist()
+
+    cases = [
+        ("price_for_volume",
+         lambda is_buy, volume: generator_price_for_volume(order_book, is_buy, volume),
+         order_book.get_price_for_volume),
+        ("vwap_for_volume",
+         lambda is_buy, volume: generator_vwap_for_volume(order_book, is_buy, volume),
+         order_book.get_vwap_for_volume),
+    ]
+    print(f"{levels} levels per side, {iterations} queries per case")
+    for name, generator_query, native_query in cases:
+        before = queries_per_second(generator_query, volumes)
+        after = queries_per_second(native_query, volumes)
+        print(f"{name:<20} generator: {before:>12,.0f} q/s   native: {after:>12,.0f} q/s   x{after / before:.1f}")
+
+
+if __name__ == "__main__":
+    main()
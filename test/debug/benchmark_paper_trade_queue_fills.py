@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of trade events and clock ticks of `PaperTradeExchange` with thousands of resting limit orders,
+comparing the default fill model (fills when trades cross the order price, every resting order is checked for crossing
+on every tick) with the queue position fill model (fills when trades have consumed the amount ahead of the orders,
+crossing checks only when the top of the order book changes).
+
+Usage: python test/debug/benchmark_paper_trade_queue_fills.py [resting orders] [trades]
+"""
+
+import random
+import sys
+import time
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def run(queue_position_fills: bool, resting_orders: int, trades: int):
+    exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                 queue_position_fills=queue_position_fills)
+    exchange.set_balanced_order_book(TRADING_PAIR, 100, 10, 190, 0.5, 10)
+    exchange.set_balance("COINALPHA", Decimal("1e9"))
+    exchange.set_balance("HBOT", Decimal("1e12"))
+    clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=1000, end_time=1e9)
+    clock.add_iterator(exchange)
+    clock.backtest_til(1001)
+
+    rng = random.Random(42)
+    for i in range(resting_orders):
+        # Resting orders away from the trades, so both models keep the same number of orders
+        if i % 2 == 0:
+            exchange.buy(TRADING_PAIR, Decimal("1"), OrderType.LIMIT, Decimal(str(50 + rng.randrange(80) * 0.5)))
+        else:
+            exchange.sell(TRADING_PAIR, Decimal("1"), OrderType.LIMIT, Decimal(str(110.5 + rng.randrange(80) * 0.5)))
+    order_book = exchange.order_books[TRADING_PAIR]
+
+    start = time.perf_counter()
+    for i in range(trades):
+        trade_type = TradeType.BUY if i % 2 == 0 else TradeType.SELL
+        price = 100.5 if trade_type is TradeType.BUY else 99.5
+        order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=TRADING_PAIR, timestamp=1001, type=trade_type, price=price, amount=1))
+    trades_elapsed = time.perf_counter() - start
+
+    ticks = 1000
+    start = time.perf_counter()
+    clock.backtest_til(1001 + ticks)
+    ticks_elapsed = time.perf_counter() - start
+    return trades_elapsed * 1e6 / trades, ticks_elapsed * 1e6 / ticks, len(exchange.limit_orders)
+
+
+def main():
+    resting_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    trades = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    print(f"{resting_orders} resting limit orders, {trades} trades")
+    for name, queue_position_fills in (("crossing fills:", False), ("queue position fills:", True)):
+        trade_us, tick_us, open_orders = run(queue_position_fills, resting_orders, trades)
+        print(f"  {name:<24}{trade_us:10.2f} us/trade {tick_us:10.2f} us/tick ({open_orders} open orders)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+"""
+Compares the per trade `PerformanceMetrics.create` report with the columnar `PerformanceMetrics.from_trade_columns`
+report, and times loading the trade columns from a SQLite trades database with `PerformanceMetrics.load_trade_columns`.
+
+The per trade report is timed on a sample of the fills (it takes minutes on millions of fills) and extrapolated.
+
+Usage: python test/debug/benchmark_performance_metrics.py [fills] [sample_fills]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model import HummingbotBase
+from hummingbot.model.order import Order  # noqa: F401
+from hummingbot.model.order_status import OrderStatus  # noqa: F401
+from hummingbot.model.trade_fill import TradeFill
+
+TRADING_PAIR = "COINALPHA-HBOT"
+MARKET = "binance"
+FEE_JSONS = [json.dumps({"fee_type": "AddedToCost", "percent": "0.001", "percent_token": None, "flat_fees": []}),
+             json.dumps({"fee_type": "AddedToCost", "percent": "0", "percent_token": None,
+                         "flat_fees": [{"token": "HBOT", "amount": "0.05"}]})]
+
+
+def make_trade_columns(fills: int) -> pd.DataFrame:
+    order_ids = np.random.randint(0, fills // 3 + 1, size=fills)
+    return pd.DataFrame({
+        "market": MARKET,
+        "symbol": TRADING_PAIR,
+        "trade_type": np.where(order_ids % 2 == 0, "BUY", "SELL"),
+        "price": np.round(np.random.uniform(90, 110, size=fills), 6),
+        "amount": np.round(np.random.uniform(0.1, 2, size=fills), 6),
+        "order_id": [f"OID{order_id}" for order_id in order_ids],
+        "position": "NIL",
+        "trade_fee": np.array(FEE_JSONS, dtype=object)[np.random.randint(0, len(FEE_JSONS), size=fills)],
+    })
+
+
+def trade_rows(trades: pd.DataFrame):
+    return [{"config_file_path": "benchmark.yml", "strategy": "pure_market_making", "market": row.market,
+             "symbol": row.symbol, "base_asset": "COINALPHA", "quote_asset": "HBOT", "timestamp": index,
+             "order_id": row.order_id, "trade_type": row.trade_type, "order_type": "LIMIT",
+             "price": Decimal(str(row.price)), "amount": Decimal(str(row.amount)), "leverage": 1,
+             "trade_fee": json.loads(row.trade_fee), "exchange_trade_id": f"TID{index}", "position": row.position}
+            for index, row in enumerate(trades.itertuples())]
+
+
+def write_database(db_path: str, trades: pd.DataFrame):
+    engine = create_engine(f"sqlite:///{db_path}")
+    HummingbotBase.metadata.create_all(engine)
+    rows = trade_rows(trades)
+    with engine.begin() as connection:
+        connection.execute(TradeFill.__table__.insert(), rows)
+    return engine
+
+
+async def main():
+    fills = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sample_fills = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    RateOracle.get_instance()._prices[TRADING_PAIR] = Decimal("100")
+    balances = {"COINALPHA": Decimal("1000"), "HBOT": Decimal("100000")}
+    trades = make_trade_columns(fills)
+
+    start = time.perf_counter()
+    columnar = await PerformanceMetrics.from_trade_columns(TRADING_PAIR, trades, balances)
+    columnar_time = time.perf_counter() - start
+
+    sample = trades.iloc[:sample_fills]
+    sample_objects = [TradeFill(**row) for row in trade_rows(sample)]
+    start = time.perf_counter()
+    await PerformanceMetrics.create(TRADING_PAIR, sample_objects, balances)
+    per_trade_time = (time.perf_counter() - start) * fills / len(sample)
+
+    print(f"{fills} fills")
+    print(f"  {'columnar report:':<30}{columnar_time:8.3f} s (total P&L {columnar.total_pnl:.4f})")
+    print(f"  {'per trade report (estimate):':<30}{per_trade_time:8.3f} s ({len(sample)} fills sampled)")
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        engine = write_database(os.path.join(db_dir, "benchmark.sqlite"), trades)
+        with sessionmaker(bind=engine)() as session:
+            start = time.perf_counter()
+            loaded = PerformanceMetrics.load_trade_columns(session, config_file_path="benchmark.yml")
+            load_time = time.perf_counter() - start
+        engine.dispose()
+    print(f"  {'columnar load from SQLite:':<30}{load_time:8.3f} s ({len(loaded)} fills)")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
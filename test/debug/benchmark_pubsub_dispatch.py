@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""
+Measures event dispatch throughput of `PubSub.trigger_event` with a growing number of listeners subscribed to the
+same event, and the cost of triggering events while listeners are being added and removed.
+
+Usage: python test/debug/benchmark_pubsub_dispatch.py [events]
+"""
+
+import sys
+import time
+from typing import List
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.pubsub import PubSub
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def __call__(self, arg):
+        self.calls += 1
+
+
+def time_dispatch(pubsub: PubSub, events: int) -> float:
+    start = time.perf_counter()
+    for _ in range(events):
+        pubsub.trigger_event(OrderBookEvent.TradeEvent, None)
+    return time.perf_counter() - start
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{events} events")
+    for listeners_count in (0, 1, 10, 100):
+        pubsub = PubSub()
+        listeners: List[CountingListener] = [CountingListener() for _ in range(listeners_count)]
+        for listener in listeners:
+            pubsub.add_listener(OrderBookEvent.TradeEvent, listener)
+        elapsed = time_dispatch(pubsub, events)
+        print(f"  {f'{listeners_count} listeners:':<40}{elapsed * 1e9 / events:10.1f} ns/event")
+
+    pubsub = PubSub()
+    listeners = [CountingListener() for _ in range(10)]
+    for listener in listeners:
+        pubsub.add_listener(OrderBookEvent.TradeEvent, listener)
+    churning_listener = CountingListener()
+    start = time.perf_counter()
+    for index in range(events):
+        if index % 100 == 0:
+            pubsub.add_listener(OrderBookEvent.TradeEvent, churning_listener)
+        elif index % 100 == 50:
+            pubsub.remove_listener(OrderBookEvent.TradeEvent, churning_listener)
+        pubsub.trigger_event(OrderBookEvent.TradeEvent, None)
+    elapsed = time.perf_counter() - start
+    print(f"  {'10 listeners, churn every 50 events:':<40}{elapsed * 1e9 / events:10.1f} ns/event")
+
+
+if __name__ == "__main__":
+    main()
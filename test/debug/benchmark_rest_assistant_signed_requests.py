@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+"""
+Measures the latency added by `RESTAssistant.call` to signed order placement requests authenticated with
+`BinanceAuth`, comparing the legacy path (deep copy of every request) with the copy-on-write path. The requests are
+answered by an in-memory connection, so only the assistant, pre-processor and authentication overhead is measured.
+
+Usage: python test/debug/benchmark_rest_assistant_signed_requests.py [requests]
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+
+class InMemoryRESTConnection(RESTConnection):
+    def __init__(self):
+        super().__init__(aiohttp_client_session=None)
+
+    async def call(self, request: RESTRequest) -> RESTResponse:
+        return None
+
+
+class LegacyBinanceAuth(BinanceAuth):
+    copy_on_write = False
+
+
+class LegacyTimeSynchronizerRESTPreProcessor(TimeSynchronizerRESTPreProcessor):
+    copy_on_write = False
+
+
+async def server_time() -> float:
+    return time.time() * 1e3
+
+
+def order_request() -> RESTRequest:
+    return RESTRequest(
+        method=RESTMethod.POST,
+        url="https://api.binance.com/api/v3/order",
+        data=json.dumps({
+            "symbol": "COINALPHAHBOT",
+            "side": "BUY",
+            "type": "LIMIT",
+            "timeInForce": "GTC",
+            "quantity": "1.2345",
+            "price": "100.25",
+            "newClientOrderId": "x-XEKWYICX-BCAHT6234567890",
+        }),
+        headers={"Content-Type": "application/json"},
+        is_auth_required=True,
+        throttler_limit_id="order",
+    )
+
+
+async def time_calls(assistant: RESTAssistant, requests: int) -> float:
+    request = order_request()
+    start = time.perf_counter()
+    for _ in range(requests):
+        await assistant.call(request)
+    return time.perf_counter() - start
+
+
+async def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    time_synchronizer = TimeSynchronizer()
+    time_synchronizer.add_time_offset_ms_sample(0)
+    print(f"{requests} signed order requests")
+    for name, auth_class, pre_processor_class in (
+        ("deep copy:", LegacyBinanceAuth, LegacyTimeSynchronizerRESTPreProcessor),
+        ("copy-on-write:", BinanceAuth, TimeSynchronizerRESTPreProcessor),
+    ):
+        assistant = RESTAssistant(
+            connection=InMemoryRESTConnection(),
+            throttler=AsyncThrottler(rate_limits=[]),
+            rest_pre_processors=[pre_processor_class(synchronizer=time_synchronizer, time_provider=server_time)],
+            auth=auth_class(api_key="testApiKey", secret_key="testSecret", time_provider=time_synchronizer),
+        )
+        elapsed = await time_calls(assistant, requests)
+        print(f"  {name:<20}{elapsed * 1e6 / requests:10.2f} us/request")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
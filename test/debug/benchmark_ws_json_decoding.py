@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+"""
+Measures `WSConnection` receive throughput of order book diff messages sent by the mock web socket server, decoding
+the messages with each available JSON decoder, and with raw messages (no decoding).
+
+Usage: python test/debug/benchmark_ws_json_decoding.py [messages] [levels]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from typing import List
+from unittest.mock import patch
+
+import aiohttp
+
+from hummingbot.core.mock_api.mock_web_socket_server import MockWebSocketServerFactory
+from hummingbot.core.web_assistant.connections import json_decoder
+from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+
+WS_URL = "wss://benchmark.test/ws"
+
+
+def make_diff_message(update_id: int, levels: int) -> str:
+    return json.dumps({
+        "e": "depthUpdate",
+        "E": 1640000000000 + update_id,
+        "s": "COINALPHAHBOT",
+        "U": update_id,
+        "u": update_id,
+        "b": [[f"{100 - level * 0.01:.2f}", f"{level * 0.5 + 1:.4f}"] for level in range(levels)],
+        "a": [[f"{100 + level * 0.01:.2f}", f"{level * 0.5 + 1:.4f}"] for level in range(levels)],
+    })
+
+
+async def time_receive(connection: WSConnection, payloads: List[str], raw: bool) -> float:
+    server = MockWebSocketServerFactory.get_ws_server(WS_URL)
+
+    async def send_all():
+        for payload in payloads:
+            await server.websocket.send_str(payload)
+
+    asyncio.run_coroutine_threadsafe(send_all(), server.ev_loop)
+    start = time.perf_counter()
+    for _ in payloads:
+        await connection.receive(raw=raw)
+    return time.perf_counter() - start
+
+
+async def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    levels = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    payloads = [make_diff_message(update_id, levels) for update_id in range(messages)]
+    ws_server = MockWebSocketServerFactory.start_new_server(WS_URL)
+    await asyncio.wait_for(ws_server.wait_til_started(), 1)
+
+    decoders = [("stdlib json", json_decoder.stdlib_json_decoder, False),
+                ("default", json_decoder.get_default_json_decoder(), False)]
+    if json_decoder.orjson is not None:
+        decoders.append(("orjson", json_decoder.orjson.loads, False))
+    decoders.append(("raw (no decoding)", None, True))
+
+    with patch("aiohttp.client.ClientSession.ws_connect", autospec=True) as ws_connect_mock:
+        ws_connect_mock.side_effect = MockWebSocketServerFactory.reroute_ws_connect
+        async with aiohttp.ClientSession() as session:
+            connection = WSConnection(session)
+            await connection.connect(WS_URL)
+            ws_server.wait_til_websocket_is_initialized()
+
+            print(f"{messages} messages, {levels} levels per side")
+            for name, decoder, raw in decoders:
+                if decoder is not None:
+                    connection._json_decoder = decoder
+                elapsed = await time_receive(connection, payloads, raw)
+                print(f"  {f'{name}:':<24}{messages / elapsed:12.0f} messages/s")
+            await connection.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
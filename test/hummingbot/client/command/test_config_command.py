@@ -81,6 +81,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ other_commands_timeout | 30                   |\n"
                            "    | tables_format            | psql                 |\n"
                            "    | tick_size                | 1.0                  |\n"
+                           "    | clock_mode               | realtime             |\n"
                            "    +--------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
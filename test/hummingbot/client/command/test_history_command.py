@@ -172,3 +172,19 @@ class HistoryCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_list_trades_flushes_markets_recorder_before_querying(self, _: MagicMock):
+        self.client_config_map.db_mode = DBSqliteMode()
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        self.app.markets_recorder = MagicMock()
+        flushed_before_query = []
+
+        def get_trades_from_session(*_, **__) -> List[TradeFill]:
+            flushed_before_query.append(self.app.markets_recorder.flush.called)
+            return []
+
+        with patch.object(self.app, "_get_trades_from_session", side_effect=get_trades_from_session):
+            self.app.list_trades(start_time=0)
+
+        self.assertEqual([True], flushed_before_query)
@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+from test.mock.mock_cli import CLIMockingAssistant
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import ClockMode
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
+
+
+class StartCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+
+    def tearDown(self) -> None:
+        self.cli_mock_assistant.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication._run_clock", new_callable=AsyncMock)
+    def test_start_market_making_creates_realtime_clock_by_default(self, _: AsyncMock):
+        self.async_run_with_timeout(self.app.start_market_making())
+
+        self.assertEqual(ClockMode.REALTIME, self.app.clock.clock_mode)
+        self.assertEqual(self.client_config_map.tick_size, self.app.clock.tick_size)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication._run_clock", new_callable=AsyncMock)
+    def test_start_market_making_creates_clock_in_configured_mode(self, _: AsyncMock):
+        self.client_config_map.clock_mode = "event_driven"
+
+        self.async_run_with_timeout(self.app.start_market_making())
+
+        self.assertEqual(ClockMode.EVENT_DRIVEN, self.app.clock.clock_mode)
+
+    def test_add_clock_tick_triggers_for_fills_and_top_of_book_changes(self):
+        order_book = MagicMock()
+        market = MagicMock(spec=ExchangeBase)
+        market.order_books = {"COINALPHA-HBOT": order_book}
+        self.app.markets = {"binance": market}
+        clock = MagicMock()
+
+        self.app._add_clock_tick_triggers(clock)
+
+        clock.add_tick_trigger.assert_has_calls([call(market, MarketEvent.OrderFilled),
+                                                 call(order_book, OrderBookEvent.TopOfBookChanged)])
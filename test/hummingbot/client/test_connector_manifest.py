@@ -0,0 +1,108 @@
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from os.path import exists, join
+from pathlib import Path
+from unittest.mock import patch
+
+from hummingbot.client import connector_manifest
+from hummingbot.client.connector_manifest import (
+    CONNECTOR_MANIFEST_VERSION,
+    build_connector_manifest,
+    connector_utils_fingerprint,
+    get_connector_manifest,
+    load_connector_config_keys,
+    load_connector_manifest,
+    trade_fee_schema_from_json,
+    trade_fee_schema_to_json,
+)
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+
+
+class ConnectorManifestTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.manifest = build_connector_manifest()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = join(self.temp_dir.name, "connector_manifest.json")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_manifest_describes_connectors_and_domains(self):
+        connectors = {entry["name"]: entry for entry in self.manifest["connectors"]}
+
+        self.assertEqual(CONNECTOR_MANIFEST_VERSION, self.manifest["version"])
+        self.assertEqual("exchange", connectors["binance"]["type"])
+        self.assertEqual(
+            {"module": "hummingbot.connector.exchange.binance.binance_utils", "domain": None},
+            connectors["binance"]["config_keys"])
+        self.assertTrue(connectors["binance_us"]["is_sub_domain"])
+        self.assertEqual("binance", connectors["binance_us"]["parent_name"])
+        self.assertEqual("us", connectors["binance_us"]["domain_parameter"])
+        self.assertNotIn("paper_trade", connectors)
+        json.dumps(self.manifest)
+
+    def test_config_keys_imported_from_manifest_description(self):
+        connectors = {entry["name"]: entry for entry in self.manifest["connectors"]}
+
+        self.assertEqual("binance", load_connector_config_keys(connectors["binance"]["config_keys"]).connector)
+        self.assertEqual("binance_us", load_connector_config_keys(connectors["binance_us"]["config_keys"]).connector)
+
+    def test_trade_fee_schema_serialization(self):
+        trade_fee_schema = TradeFeeSchema(
+            percent_fee_token="BNB",
+            maker_percent_fee_decimal=Decimal("0.001"),
+            taker_percent_fee_decimal=Decimal("0.002"),
+            taker_fixed_fees=[TokenAmount("ETH", Decimal("0.01"))],
+        )
+
+        data = json.loads(json.dumps(trade_fee_schema_to_json(trade_fee_schema)))
+
+        self.assertEqual(trade_fee_schema, trade_fee_schema_from_json(data))
+        self.assertEqual(["0.1", "0.2"], trade_fee_schema_from_json(trade_fee_schema_to_json([0.1, 0.2])))
+        self.assertIsNone(trade_fee_schema_from_json(trade_fee_schema_to_json(None)))
+
+    def test_manifest_saved_and_reused(self):
+        with patch.object(connector_manifest, "build_connector_manifest", return_value=self.manifest) as build_mock:
+            self.assertEqual(self.manifest, get_connector_manifest(self.manifest_path))
+            self.assertTrue(exists(self.manifest_path))
+            self.assertEqual(self.manifest, get_connector_manifest(self.manifest_path))
+
+        self.assertEqual(1, build_mock.call_count)
+
+    def test_outdated_manifest_not_loaded(self):
+        self.assertIsNone(load_connector_manifest(self.manifest_path))
+
+        with open(self.manifest_path, "w") as file:
+            json.dump({**self.manifest, "version": CONNECTOR_MANIFEST_VERSION + 1}, file)
+        self.assertIsNone(load_connector_manifest(self.manifest_path))
+
+        with open(self.manifest_path, "w") as file:
+            json.dump({**self.manifest, "fingerprint": "outdated"}, file)
+        self.assertIsNone(load_connector_manifest(self.manifest_path))
+
+        with open(self.manifest_path, "w") as file:
+            json.dump(self.manifest, file)
+        self.assertEqual(self.manifest, load_connector_manifest(self.manifest_path))
+
+    def test_fingerprint_changes_with_any_connector_package_module(self):
+        connector_dir = join(self.temp_dir.name, "hummingbot", "connector", "exchange", "mock_exchange")
+        os.makedirs(connector_dir)
+        for module_name in ("__init__", "mock_exchange_utils", "mock_exchange_constants"):
+            with open(join(connector_dir, f"{module_name}.py"), "w") as file:
+                file.write("")
+
+        with patch.object(connector_manifest, "root_path", return_value=Path(self.temp_dir.name)):
+            fingerprint = connector_utils_fingerprint()
+            with open(join(connector_dir, "mock_exchange_constants.py"), "w") as file:
+                file.write("DEFAULT_DOMAIN = 'com'\n")
+
+            self.assertNotEqual(fingerprint, connector_utils_fingerprint())
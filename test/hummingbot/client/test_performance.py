@@ -5,11 +5,16 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from hummingbot.client.performance import PerformanceMetrics, PnLTracker, TradeStats
 from hummingbot.core.data_type.common import PositionAction, OrderType, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model import HummingbotBase
 from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.trade_fill import TradeFill
@@ -326,3 +331,236 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         expected_fee_amount += flat_fees[0].amount * Decimal("0.9") * Decimal("2")
         expected_fee_amount += flat_fees[1].amount * Decimal("2")
         self.assertEqual(expected_fee_amount, performance_metric.fee_in_quote)
+
+    def trade_fill(self, order_id, trade_type, price, amount, position=PositionAction.NIL.value, fee=None):
+        fee = fee or AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0"))])
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=int(time.time()),
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=fee.to_json(),
+            exchange_trade_id=f"{order_id}-{price}",
+            position=position,
+        )
+
+    def test_performance_metrics_from_trade_stats_match_metrics_from_trades(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        RateOracle._shared_instance = rate_oracle
+
+        def trades():
+            return [
+                self.trade_fill("someId0", "BUY", 100, 10, fee=AddedToCostTradeFee(percent=Decimal("0.01"))),
+                self.trade_fill("someId1", "SELL", 120, 15),
+                self.trade_fill("someId2", "SELL", 110, 5),
+            ]
+
+        stats = TradeStats()
+        for trade in trades():
+            stats.add_trade_fill(trade)
+        cur_bals = {base: 100, quote: 10000}
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades(), cur_bals))
+        metrics = self.async_run_with_timeout(PerformanceMetrics.from_trade_stats(trading_pair, stats, cur_bals))
+
+        self.assertEqual(3, stats.num_trades)
+        self.assertFalse(stats.is_derivative)
+        self.assertEqual(expected.num_trades, metrics.num_trades)
+        self.assertEqual(expected.tot_vol_base, metrics.tot_vol_base)
+        self.assertEqual(expected.tot_vol_quote, metrics.tot_vol_quote)
+        self.assertEqual(expected.avg_tot_price, metrics.avg_tot_price)
+        self.assertEqual(expected.start_price, metrics.start_price)
+        self.assertEqual(expected.trade_pnl, metrics.trade_pnl)
+        self.assertEqual(dict(expected.fees), dict(metrics.fees))
+        self.assertEqual(expected.total_pnl, metrics.total_pnl)
+        self.assertEqual(expected.return_pct, metrics.return_pct)
+
+    def test_trade_stats_derivative_pnl_pairs_aggregated_open_and_close_orders(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        RateOracle._shared_instance = rate_oracle
+
+        def trades():
+            return [
+                self.trade_fill("order1", "BUY", 10, 50, position="OPEN"),
+                self.trade_fill("order3", "SELL", 20, 100, position="OPEN"),
+                self.trade_fill("order1", "BUY", 12, 50, position="OPEN"),
+                self.trade_fill("order2", "SELL", 15, 100, position="CLOSE"),
+                self.trade_fill("order4", "BUY", 15, 60, position="CLOSE"),
+                self.trade_fill("order4", "BUY", 17, 40, position="CLOSE"),
+            ]
+
+        stats = TradeStats()
+        for trade in trades():
+            stats.add_trade_fill(trade)
+        cur_bals = {base: 100, quote: 10000}
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades(), cur_bals))
+        metrics = self.async_run_with_timeout(PerformanceMetrics.from_trade_stats(trading_pair, stats, cur_bals))
+
+        self.assertTrue(stats.is_derivative)
+        # Long: (15 - 11) * 100, short: (20 - 16) * 100
+        self.assertEqual(Decimal("800"), stats.derivative_pnl)
+        self.assertEqual(expected.trade_pnl, metrics.trade_pnl)
+
+    def test_pnl_tracker_accumulates_fill_events_and_backfilled_trades(self):
+        tracker = PnLTracker()
+        tracker.add_trade_fills([self.trade_fill("someId0", "BUY", 100, 10)])
+        market = MagicMock(display_name="binance")
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="someId1",
+            trading_pair=trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal("120"),
+            amount=Decimal("4"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")),
+            exchange_trade_id="someExchangeId1",
+        )
+
+        tracker.start([market])
+        tracker._did_fill_order(MarketEvent.OrderFilled.value, market, fill_event)
+        tracker.stop()
+
+        market.add_listener.assert_called_once_with(MarketEvent.OrderFilled, tracker._fill_order_forwarder)
+        market.remove_listener.assert_called_once_with(MarketEvent.OrderFilled, tracker._fill_order_forwarder)
+        self.assertEqual(2, tracker.num_trades)
+        stats = tracker.trade_stats[("binance", trading_pair)]
+        self.assertEqual(1, stats.num_buys)
+        self.assertEqual(1, stats.num_sells)
+        self.assertEqual(Decimal("6"), stats.b_vol_base + stats.s_vol_base)
+        self.assertEqual(Decimal("-520"), stats.b_vol_quote + stats.s_vol_quote)
+        self.assertEqual(Decimal("100"), stats.start_price)
+        self.assertEqual(Decimal("120"), stats.last_price)
+        self.assertEqual(Decimal("4.8"), stats.fees[quote])
+
+    def test_performance_metrics_from_trade_columns_match_metrics_from_trades(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        RateOracle._shared_instance = rate_oracle
+
+        def trades():
+            return [
+                self.trade_fill("someId0", "BUY", 100, 10, fee=AddedToCostTradeFee(percent=Decimal("0.01"))),
+                self.trade_fill("someId1", "SELL", 120, 15, fee=AddedToCostTradeFee(percent=Decimal("0.01"))),
+                self.trade_fill("someId2", "SELL", 110, 5, fee=AddedToCostTradeFee(
+                    flat_fees=[TokenAmount(quote, Decimal("2"))])),
+                self.trade_fill("someId3", "BUY", 105, 2, fee=AddedToCostTradeFee(
+                    flat_fees=[TokenAmount(quote, Decimal("2"))])),
+            ]
+
+        cur_bals = {base: 100, quote: 10000}
+        trade_columns = PerformanceMetrics.trade_columns_from_trades(trades())
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades(), cur_bals))
+        metrics = self.async_run_with_timeout(
+            PerformanceMetrics.from_trade_columns(trading_pair, trade_columns, cur_bals))
+
+        self.assertEqual(expected.num_buys, metrics.num_buys)
+        self.assertEqual(expected.num_sells, metrics.num_sells)
+        self.assertEqual(expected.b_vol_base, metrics.b_vol_base)
+        self.assertEqual(expected.s_vol_quote, metrics.s_vol_quote)
+        self.assertEqual(expected.avg_b_price, metrics.avg_b_price)
+        self.assertEqual(expected.avg_s_price, metrics.avg_s_price)
+        self.assertEqual(expected.start_price, metrics.start_price)
+        self.assertEqual(expected.trade_pnl, metrics.trade_pnl)
+        self.assertEqual(dict(expected.fees), dict(metrics.fees))
+        self.assertEqual(expected.total_pnl, metrics.total_pnl)
+
+    def test_performance_metrics_from_trade_columns_with_dict_fees(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        RateOracle._shared_instance = rate_oracle
+
+        def trades():
+            return [
+                self.trade_fill("someId0", "BUY", 100, 10, fee=AddedToCostTradeFee(percent=Decimal("0.01"))),
+                self.trade_fill("someId1", "SELL", 120, 15, fee=AddedToCostTradeFee(
+                    flat_fees=[TokenAmount(quote, Decimal("2"))])),
+                self.trade_fill("someId2", "SELL", 110, 5, fee=AddedToCostTradeFee(
+                    flat_fees=[TokenAmount(quote, Decimal("2"))])),
+            ]
+
+        cur_bals = {base: 100, quote: 10000}
+        trade_columns = PerformanceMetrics.trade_columns_from_trades(trades())
+        # JSON columns returned as dicts, like some database drivers do
+        trade_columns["trade_fee"] = [trade.trade_fee for trade in trades()]
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades(), cur_bals))
+        metrics = self.async_run_with_timeout(
+            PerformanceMetrics.from_trade_columns(trading_pair, trade_columns, cur_bals))
+
+        self.assertEqual(dict(expected.fees), dict(metrics.fees))
+        self.assertEqual(expected.total_pnl, metrics.total_pnl)
+
+    def test_derivative_performance_metrics_from_trade_columns(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        RateOracle._shared_instance = rate_oracle
+
+        def trades():
+            return [
+                self.trade_fill("order1", "BUY", 10, 50, position="OPEN"),
+                self.trade_fill("order3", "SELL", 20, 100, position="OPEN"),
+                self.trade_fill("order1", "BUY", 12, 50, position="OPEN"),
+                self.trade_fill("order2", "SELL", 15, 100, position="CLOSE"),
+                self.trade_fill("order4", "BUY", 15, 60, position="CLOSE"),
+                self.trade_fill("order4", "BUY", 17, 40, position="CLOSE"),
+            ]
+
+        cur_bals = {base: 100, quote: 10000}
+        trade_columns = PerformanceMetrics.trade_columns_from_trades(trades())
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades(), cur_bals))
+        metrics = self.async_run_with_timeout(
+            PerformanceMetrics.from_trade_columns(trading_pair, trade_columns, cur_bals))
+
+        self.assertEqual(Decimal("800"), metrics.trade_pnl)
+        self.assertEqual(expected.trade_pnl, metrics.trade_pnl)
+        self.assertEqual(expected.total_pnl, metrics.total_pnl)
+
+    def test_load_trade_columns_from_database(self):
+        engine = create_engine("sqlite:///:memory:")
+        HummingbotBase.metadata.create_all(engine)
+        session_cls = sessionmaker(bind=engine)
+        with session_cls() as session:
+            with session.begin():
+                session.add(self.trade_fill("someId1", "SELL", Decimal("120.5"), Decimal("0.25")))
+                session.add(self.trade_fill("someId0", "BUY", 100, 10))
+                session.add(TradeFill(
+                    config_file_path="other-strategy.yml",
+                    strategy="pure_market_making",
+                    market="binance",
+                    symbol=trading_pair,
+                    base_asset=base,
+                    quote_asset=quote,
+                    timestamp=int(time.time()),
+                    order_id="otherId",
+                    trade_type="BUY",
+                    order_type="LIMIT",
+                    price=1,
+                    amount=1,
+                    trade_fee=AddedToCostTradeFee().to_json(),
+                    exchange_trade_id="otherExchangeId",
+                ))
+
+        with session_cls() as session:
+            trade_columns = PerformanceMetrics.load_trade_columns(session, config_file_path="some-strategy")
+
+        self.assertEqual(PerformanceMetrics.TRADE_COLUMNS, list(trade_columns.columns))
+        self.assertEqual(2, len(trade_columns))
+        self.assertEqual({"someId0", "someId1"}, set(trade_columns["order_id"]))
+        sell = trade_columns[trade_columns["order_id"] == "someId1"].iloc[0]
+        self.assertEqual(120.5, sell["price"])
+        self.assertEqual(0.25, sell["amount"])
+        self.assertEqual("SELL", sell["trade_type"])
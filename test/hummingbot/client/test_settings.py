@@ -1,8 +1,11 @@
+import tempfile
 import unittest
+from os.path import join
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -36,3 +39,21 @@ class SettingsTest(unittest.TestCase):
         self.assertEqual(api_key, connector.api_key)
         self.assertNotIsInstance(connector.secret_key, SecretStr)
         self.assertEqual(api_secret, connector.secret_key)
+
+    def test_connector_config_keys_imported_when_requested(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("hummingbot.client.connector_manifest.connector_manifest_path",
+                       return_value=join(temp_dir, "connector_manifest.json")):
+                AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+        connector_settings = AllConnectorSettings.get_connector_settings()
+
+        self.assertIsNone(connector_settings["binance"].config_keys)
+        self.assertEqual(ConnectorType.Exchange, connector_settings["binance"].type)
+
+        config_keys = AllConnectorSettings.get_connector_config_keys("binance")
+
+        self.assertIsInstance(config_keys, BinanceConfigMap)
+        self.assertIs(config_keys, AllConnectorSettings.get_connector_settings()["binance"].config_keys)
+        self.assertIs(config_keys, AllConnectorSettings.resolve_config_keys(connector_settings["binance_paper_trade"]))
+        self.assertEqual("binance_us", AllConnectorSettings.get_connector_config_keys("binance_us").connector)
@@ -74,6 +74,7 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
+        mock_app.pnl_tracker = None
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
         mock_app._get_trades_from_session.return_value = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
         mock_app.get_current_balances = AsyncMock()
@@ -94,6 +95,7 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
+        mock_app.pnl_tracker = None
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
         mock_app._get_trades_from_session.return_value = [
             MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
@@ -116,6 +118,7 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
+        mock_app.pnl_tracker = None
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
         mock_app._get_trades_from_session.return_value = [
             MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
@@ -131,12 +134,37 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 0, Total P&L: 0.00, Return %: 0.00%', mock_result.log.call_args_list[0].args[0])
         self.assertEqual('Trades: 2, Total P&L: 5.00 USDT, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
 
+    @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.from_trade_stats", new_callable=AsyncMock)
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
+    def test_start_trade_monitor_uses_pnl_tracker_trade_stats(self, mock_hb_app, mock_perf, mock_sleep):
+        mock_result = MagicMock()
+        mock_app = mock_hb_app.main_application()
+        mock_app.strategy_task.done.return_value = False
+        mock_app.markets.return_values = {"a": MagicMock(ready=True)}
+        mock_app.pnl_tracker.trade_stats = {
+            ("ExchangeA", "HBOT-USDT"): MagicMock(num_trades=3),
+            ("ExchangeA", "BTC-USDT"): MagicMock(num_trades=1),
+            ("ExchangeA", "ETH-USDT"): MagicMock(num_trades=0),
+        }
+        mock_app.get_current_balances = AsyncMock()
+        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
+                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
+        mock_sleep.side_effect = asyncio.CancelledError()
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(start_trade_monitor(mock_result))
+        self.assertEqual(2, mock_perf.call_count)
+        mock_app._get_trades_from_session.assert_not_called()
+        self.assertEqual(2, mock_result.log.call_count)
+        self.assertEqual('Trades: 4, Total P&L: 5.00 USDT, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
+
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
     def test_start_trade_monitor_market_not_ready(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
+        mock_app.pnl_tracker = None
         mock_app.markets.return_values = {"a": MagicMock(ready=False)}
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
@@ -150,6 +178,7 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
+        mock_app.pnl_tracker = None
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
         mock_app._get_trades_from_session.return_value = []
         mock_sleep.side_effect = asyncio.CancelledError()
@@ -49,3 +49,5 @@ class BinanceAuthTests(TestCase):
         self.assertEqual(now * 1e3, configured_request.params["timestamp"])
         self.assertEqual(expected_signature, configured_request.params["signature"])
         self.assertEqual({"X-MBX-APIKEY": self._api_key}, configured_request.headers)
+        self.assertEqual(params, request.params)
+        self.assertIsNone(request.headers)
@@ -15,6 +15,8 @@ from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchan
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
@@ -981,6 +983,78 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "misc_updates=None)")
         )
 
+    @aioresponses()
+    def test_update_order_status_requests_orders_of_trading_pair_in_bulk(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        open_order = self.exchange.in_flight_orders["OID1"]
+        closed_order = self.exchange.in_flight_orders["OID2"]
+
+        trades_url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        mock_api.get(re.compile(f"^{trades_url}".replace(".", r"\.")), body=json.dumps([]))
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        open_order_status = self._order_status_request_partially_filled_mock_response(order=open_order)
+        mock_api.get(re.compile(f"^{open_orders_url}".replace(".", r"\.")), body=json.dumps([open_order_status]))
+        order_url = self.configure_canceled_order_status_response(order=closed_order, mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        trades_request = self._all_executed_requests(mock_api, trades_url)[0]
+        self.validate_auth_credentials_present(trades_request)
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         trades_request.kwargs["params"]["symbol"])
+        self.assertEqual(int(1640780000 * 1e3), trades_request.kwargs["params"]["startTime"])
+        self.assertNotIn("orderId", trades_request.kwargs["params"])
+
+        open_orders_request = self._all_executed_requests(mock_api, open_orders_url)[0]
+        self.validate_auth_credentials_present(open_orders_request)
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         open_orders_request.kwargs["params"]["symbol"])
+
+        # Only the order missing from the open orders is requested individually
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.validate_order_status_request(order=closed_order, request_call=order_requests[0])
+
+        self.assertEqual(OrderState.PARTIALLY_FILLED, open_order.current_state)
+        self.assertIn(open_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertNotIn(closed_order.client_order_id, self.exchange.in_flight_orders)
+
+    @aioresponses()
+    def test_update_orders_fills_polls_orders_without_exchange_id_one_by_one(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235"), ("OID3", None)):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        pending_order = self.exchange.in_flight_orders["OID3"]
+
+        trades_url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        mock_api.get(re.compile(f"^{trades_url}".replace(".", r"\.")), body=json.dumps([]))
+        order_fills_mock = AsyncMock(return_value=[])
+
+        with patch.object(self.exchange, "_all_trade_updates_for_order", order_fills_mock):
+            self.async_run_with_timeout(
+                self.exchange._update_orders_fills(orders=list(self.exchange.in_flight_orders.values())))
+
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, trades_url)))
+        order_fills_mock.assert_awaited_once_with(order=pending_order)
+
     def test_user_stream_update_for_order_failure(self):
         self.exchange._set_current_timestamp(1640780000)
         self.exchange.start_tracking_order(
@@ -1099,6 +1173,28 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                             "Error: {'code':-1021,'msg':'Other error.'}")
         self.assertFalse(self.exchange._is_request_exception_related_to_time_synchronizer(exception))
 
+    def test_throttler_reserves_capacity_for_urgent_requests(self):
+        throttler = self.exchange._throttler
+
+        self.assertEqual(1.0, throttler.capacity_share(RequestPriority.CANCEL))
+        self.assertEqual(0.8, throttler.capacity_share(RequestPriority.MARKET_DATA))
+
+    def test_throttler_rejects_request_heavier_than_its_priority_capacity(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.rate_limits_share_pct = Decimal("1")
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        # The request weight limit becomes 12, market data requests can use 10 of it and a snapshot weighs 50
+        with self.assertRaises(ValueError):
+            exchange._throttler.execute_task(limit_id=CONSTANTS.SNAPSHOT_PATH_URL)
+        with request_priority(RequestPriority.CANCEL):
+            self.assertTrue(exchange._throttler.execute_task(limit_id=CONSTANTS.ORDER_PATH_URL).within_capacity())
+
     def _validate_auth_credentials_taking_parameters_from_argument(self,
                                                                    request_call_tuple: RequestCall,
                                                                    params: Dict[str, Any]):
@@ -3,7 +3,7 @@ import json
 import re
 import unittest
 from decimal import Decimal
-from typing import Awaitable, Dict, List, NamedTuple, Optional
+from typing import Any, Awaitable, Dict, List, NamedTuple, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from aioresponses import aioresponses
@@ -1314,6 +1314,58 @@ class KucoinExchangeTests(unittest.TestCase):
         self.assertFalse(order.is_filled)
         self.assertFalse(order.is_done)
 
+    @aioresponses()
+    def test_update_order_status_requests_active_orders_of_trading_pair_in_bulk(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "EOID1"), ("OID2", "EOID2")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        active_order: InFlightOrder = self.exchange.in_flight_orders["OID1"]
+        cancelled_order: InFlightOrder = self.exchange.in_flight_orders["OID2"]
+
+        fills_url = web_utils.private_rest_url(CONSTANTS.FILLS_PATH_URL)
+        mock_api.get(re.compile(f"^{fills_url}".replace(".", r"\.")), body=json.dumps({"data": {"items": []}}))
+
+        def order_data(order: InFlightOrder, is_active: bool) -> Dict[str, Any]:
+            return {
+                "id": order.exchange_order_id,
+                "clientOid": order.client_order_id,
+                "symbol": self.trading_pair,
+                "opType": "DEAL",
+                "isActive": is_active,
+                "cancelExist": not is_active,
+            }
+
+        active_orders_url = web_utils.private_rest_url(CONSTANTS.ORDERS_PATH_URL)
+        mock_api.get(re.compile(f"^{active_orders_url}\\?".replace(".", r"\.")),
+                     body=json.dumps({"code": "200000", "data": {"items": [order_data(active_order, True)]}}))
+        order_url = web_utils.private_rest_url(f"{CONSTANTS.ORDERS_PATH_URL}/{cancelled_order.exchange_order_id}")
+        mock_api.get(re.compile(f"^{order_url}".replace(".", r"\.")),
+                     body=json.dumps({"code": "200000", "data": order_data(cancelled_order, False)}))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        active_orders_request = next(value for key, value in mock_api.requests.items()
+                                     if key[1].human_repr().startswith(f"{active_orders_url}?"))
+        request_params = active_orders_request[0].kwargs["params"]
+        self.assertEqual("active", request_params["status"])
+        self.assertEqual(self.trading_pair, request_params["symbol"])
+
+        # Only the order missing from the active orders is requested individually
+        self.assertFalse(any(key[1].human_repr().startswith(f"{active_orders_url}/{active_order.exchange_order_id}")
+                             for key in mock_api.requests))
+        self.assertTrue(any(key[1].human_repr().startswith(order_url) for key in mock_api.requests))
+
+        self.assertTrue(active_order.is_open)
+        self.assertTrue(cancelled_order.is_cancelled)
+
     # ---- Testing the _update_orders_fills() method overwritten from the ExchangePyBase
     def test__update_orders_fills_raises_asyncio(self):
         orders: List[InFlightOrder] = [InFlightOrder(client_order_id="COID1-1",
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -5,10 +6,36 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def mock_exchange(self, queue_position_fills: bool) -> MockPaperExchange:
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                     queue_position_fills=queue_position_fills)
+        # Bids at 99.5 (10), 98.5 (20)... and asks at 100.5 (10), 101.5 (20)...
+        exchange.set_balanced_order_book(self.trading_pair, 100, 90, 110, 1, 10)
+        exchange.set_balance("COINALPHA", Decimal("100"))
+        exchange.set_balance("HBOT", Decimal("10000"))
+        self.clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=1000, end_time=2000)
+        self.clock.add_iterator(exchange)
+        self.clock.backtest_til(1001)
+        self.fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        return exchange
+
+    def trade(self, exchange: MockPaperExchange, trade_type: TradeType, price: float, amount: float):
+        exchange.order_books[self.trading_pair].apply_trade(OrderBookTradeEvent(
+            trading_pair=self.trading_pair, timestamp=1001, type=trade_type, price=price, amount=amount))
 
     def test_get_order_book_tracker_for_connector_using_generic_tracker(self):
         tracker = get_order_book_tracker(connector_name="binance", trading_pairs=["COINALPHA-HBOT"])
@@ -29,3 +56,55 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def test_trades_at_limit_order_price_do_not_fill_by_default(self):
+        exchange = self.mock_exchange(queue_position_fills=False)
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.trade(exchange, TradeType.SELL, 99.5, 100)
+
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual(1, len(exchange.limit_orders))
+
+    def test_queue_position_fills_after_amount_ahead_is_traded(self):
+        exchange = self.mock_exchange(queue_position_fills=True)
+        order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.assertEqual(10, exchange.queue_position_tracker.get_position(order_id).amount_ahead)
+
+        self.trade(exchange, TradeType.SELL, 99.5, 5)
+        self.trade(exchange, TradeType.SELL, 99.5, 5.5)
+
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual(0.5, exchange.queue_position_tracker.get_position(order_id).matched_amount)
+
+        self.trade(exchange, TradeType.SELL, 99.5, 0.5)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(order_id, self.fill_logger.event_log[0].order_id)
+        self.assertEqual(0, len(exchange.limit_orders))
+        self.assertNotIn(order_id, exchange.queue_position_tracker)
+
+    def test_queue_position_fills_orders_traded_through(self):
+        exchange = self.mock_exchange(queue_position_fills=True)
+        exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100.5"))
+        exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("101.5"))
+
+        self.trade(exchange, TradeType.BUY, 101, 1)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("100.5"), self.fill_logger.event_log[0].price)
+        self.assertEqual(1, len(exchange.limit_orders))
+
+    def test_queue_position_fills_crossed_orders_on_top_of_book_change(self):
+        exchange = self.mock_exchange(queue_position_fills=True)
+        exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100.5"))
+        self.clock.backtest_til(1002)
+
+        self.assertEqual(1, len(exchange.limit_orders))
+
+        exchange.order_books[self.trading_pair].apply_diffs([OrderBookRow(101, 1, 2)], [], 2)
+        self.clock.backtest_til(1003)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(0, len(exchange.limit_orders))
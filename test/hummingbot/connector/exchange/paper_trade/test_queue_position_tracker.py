@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from hummingbot.connector.exchange.paper_trade.queue_position_tracker import QueuePositionTracker
+
+
+class QueuePositionTrackerTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def test_trades_consume_amount_ahead_before_matching_the_order(self):
+        tracker = QueuePositionTracker()
+        tracker.add_order("OID1", self.trading_pair, True, 10, 2, displayed_amount=5)
+
+        self.assertEqual([], tracker.match_trade(self.trading_pair, True, 10, 4, displayed_amount=5))
+        self.assertEqual(1, tracker.get_position("OID1").amount_ahead)
+        self.assertEqual([], tracker.match_trade(self.trading_pair, True, 10, 2, displayed_amount=5))
+        self.assertEqual(0, tracker.get_position("OID1").amount_ahead)
+        self.assertEqual(1, tracker.get_position("OID1").matched_amount)
+        self.assertEqual(["OID1"], tracker.match_trade(self.trading_pair, True, 10, 1, displayed_amount=5))
+
+    def test_displayed_amount_decreases_move_order_forward(self):
+        tracker = QueuePositionTracker()
+        tracker.add_order("OID1", self.trading_pair, False, 11, 1, displayed_amount=10)
+
+        # Only 3 are left displayed at the price, e.g. after cancellations ahead of the order
+        self.assertEqual(["OID1"], tracker.match_trade(self.trading_pair, False, 11, 4, displayed_amount=3))
+
+    def test_trades_at_other_levels_or_sides_ignored(self):
+        tracker = QueuePositionTracker()
+        tracker.add_order("OID1", self.trading_pair, True, 10, 1, displayed_amount=0)
+
+        self.assertEqual([], tracker.match_trade(self.trading_pair, True, 9, 5, displayed_amount=0))
+        self.assertEqual([], tracker.match_trade(self.trading_pair, False, 10, 5, displayed_amount=0))
+        self.assertEqual([], tracker.match_trade("ETH-HBOT", True, 10, 5, displayed_amount=0))
+        self.assertEqual(0, tracker.get_position("OID1").matched_amount)
+
+    def test_remove_order(self):
+        tracker = QueuePositionTracker()
+        tracker.add_order("OID1", self.trading_pair, True, 10, 1, displayed_amount=0)
+        tracker.add_order("OID2", self.trading_pair, True, 10, 1, displayed_amount=0)
+
+        tracker.remove_order("OID1")
+        tracker.remove_order("OID1")
+
+        self.assertEqual(1, len(tracker))
+        self.assertTrue(tracker.has_orders_at(self.trading_pair, True, 10))
+        tracker.remove_order("OID2")
+        self.assertFalse(tracker.has_orders_at(self.trading_pair, True, 10))
+        self.assertEqual([], tracker.match_trade(self.trading_pair, True, 10, 5, displayed_amount=0))
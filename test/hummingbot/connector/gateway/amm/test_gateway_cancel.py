@@ -80,7 +80,8 @@ class GatewayCancelUnitTest(unittest.TestCase):
         cls._patch_stack.close()
 
     def tearDown(self) -> None:
-        self._connector._order_tracker.all_orders.clear()
+        self._connector._order_tracker.active_orders.clear()
+        self._connector._order_tracker._cached_orders.clear()
 
     @classmethod
     async def wait_til_ready(cls):
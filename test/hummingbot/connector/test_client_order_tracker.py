@@ -267,6 +267,70 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertIsNone(fetched_order)
 
+    def test_fetch_order_by_exchange_order_id_assigned_outside_the_tracker(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    def test_fetch_order_by_exchange_order_id_of_cached_order(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        del self.tracker._cached_orders[order.client_order_id]
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    def test_order_views_reflect_tracking_changes_and_are_read_only(self):
+        all_orders = self.tracker.all_orders
+        all_fillable_orders = self.tracker.all_fillable_orders
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+        self.tracker.start_tracking_order(order)
+
+        self.assertEqual({order.client_order_id: order}, all_orders)
+        self.assertIs(order, all_fillable_orders.get(order.client_order_id))
+        self.assertEqual(0, len(self.tracker.cached_orders))
+
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertEqual([order.client_order_id], list(all_orders))
+        self.assertEqual(1, len(self.tracker.cached_orders))
+        self.assertNotIn(order.client_order_id, self.tracker.all_updatable_orders)
+        with self.assertRaises(TypeError):
+            all_orders["anotherClientOrderId"] = order
+
     def test_process_order_update_invalid_order_update(self):
 
         order_creation_update: OrderUpdate = OrderUpdate(
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import time
 from decimal import Decimal
 from unittest import TestCase
@@ -14,9 +16,11 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderCancelledEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -49,6 +53,12 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -266,3 +276,231 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    def test_write_behind_queues_writes_until_flush(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, len(session.query(Order).all()))
+        self.assertEqual(2, recorder.write_metrics.pending_writes)
+
+        recorder.flush()
+
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(create_event.order_id, orders[0].id)
+        self.assertEqual(1, len(market_states))
+        self.assertEqual(self.display_name, market_states[0].market)
+        metrics = recorder.write_metrics
+        self.assertEqual(0, metrics.pending_writes)
+        self.assertEqual(1, metrics.flushes)
+        self.assertEqual(2, metrics.written_records)
+        self.assertEqual(0, metrics.failed_records)
+
+    def test_write_behind_coalesces_market_states(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+
+        for i in range(2):
+            self.tracking_states = {"order_id": f"OID{i}"}
+            create_event = BuyOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=f"OID{i}",
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"EOID{i}",
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self, OrderCancelledEvent(1642020000, "OID0"))
+
+        recorder.flush()
+
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).order_by(Order.id).all()
+            market_states = session.query(MarketState).all()
+            last_statuses = [order.last_status for order in orders]
+
+        self.assertEqual([MarketEvent.OrderCancelled.name, MarketEvent.BuyOrderCreated.name], last_statuses)
+        self.assertEqual(1, len(market_states))
+        self.assertEqual({"order_id": "OID1"}, market_states[0].saved_state)
+        metrics = recorder.write_metrics
+        self.assertEqual(2, metrics.coalesced_market_states)
+        self.assertEqual(4, metrics.last_batch_size)
+
+    def test_write_behind_retries_failed_batch_record_by_record(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+
+        def failing_write_operation(session):
+            raise ValueError("Invalid record")
+
+        recorder._write(failing_write_operation)
+        create_event = SellOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        recorder._did_create_order(MarketEvent.SellOrderCreated.value, self, create_event)
+
+        recorder.flush()
+
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+
+        self.assertEqual(1, len(orders))
+        metrics = recorder.write_metrics
+        self.assertEqual(1, metrics.failed_records)
+        self.assertEqual(2, metrics.written_records)
+
+    def test_fill_journaled_to_disk_without_further_writes(self):
+        with tempfile.TemporaryDirectory() as journal_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=journal_dir):
+                recorder = MarketsRecorder(
+                    sql=self.manager,
+                    markets=[self],
+                    config_file_path=self.config_file_path,
+                    strategy_name=self.strategy_name,
+                )
+            fill_event = OrderFilledEvent(
+                timestamp=1642020000,
+                order_id="OID1",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal(1010),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id="TradeId1"
+            )
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+            with open(recorder.trade_journal.file_path) as journal_file:
+                rows = journal_file.read().splitlines()
+            recorder.trade_journal.close()
+
+        self.assertEqual(2, len(rows))
+        self.assertIn(fill_event.exchange_trade_id, rows[1])
+
+    def test_write_behind_journals_fill_once_after_batch_retry(self):
+        with tempfile.TemporaryDirectory() as journal_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=journal_dir):
+                recorder = MarketsRecorder(
+                    sql=self.manager,
+                    markets=[self],
+                    config_file_path=self.config_file_path,
+                    strategy_name=self.strategy_name,
+                    write_behind=True,
+                )
+
+            def failing_write_operation(session):
+                raise ValueError("Invalid record")
+
+            recorder._write(failing_write_operation)
+            fill_event = OrderFilledEvent(
+                timestamp=1642020000,
+                order_id="OID1",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal(1010),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id="TradeId1"
+            )
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+            self.assertFalse(recorder.trade_journal.is_open)
+
+            recorder.flush()
+            recorder.trade_journal.close()
+
+            with open(recorder.trade_journal.file_path) as journal_file:
+                rows = journal_file.read().splitlines()
+
+        self.assertEqual(2, len(rows))
+        self.assertIn(fill_event.exchange_trade_id, rows[1])
+        self.assertEqual(1, recorder.write_metrics.failed_records)
+
+    def test_write_behind_writer_thread_commits_fills_without_waiting_flush_interval(self):
+        with tempfile.TemporaryDirectory() as db_dir:
+            with patch("hummingbot.model.sql_connection_manager.create_engine") as engine_mock:
+                engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir, 'test_DB.sqlite')}")
+                manager = SQLConnectionManager(
+                    ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+                )
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                write_behind=True,
+                flush_interval=60,
+            )
+            recorder.start()
+
+            fill_event = OrderFilledEvent(
+                timestamp=1642020000,
+                order_id="OID1",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal(1010),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id="TradeId1"
+            )
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+            trade_fills = []
+            deadline = time.time() + 5
+            while len(trade_fills) == 0 and time.time() < deadline:
+                time.sleep(0.01)
+                with manager.get_new_session() as session:
+                    trade_fills = session.query(TradeFill).all()
+
+            recorder.stop()
+            manager.engine.dispose()
+
+        self.assertEqual(1, len(trade_fills))
+        self.assertEqual(fill_event.exchange_trade_id, trade_fills[0].exchange_trade_id)
+        self.assertEqual(1, recorder.write_metrics.flushes)
@@ -0,0 +1,118 @@
+import csv
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from hummingbot.connector.trade_journal import TradeJournal
+
+
+class TradeJournalTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "trades_test.csv")
+        self.header = ("exchange_trade_id", "price", "amount")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def read_rows(self, file_path: str):
+        with open(file_path, newline="") as file:
+            return list(csv.reader(file))
+
+    def test_header_written_once_when_creating_file(self):
+        journal = TradeJournal(self.file_path, self.header)
+
+        journal.write_row(("T1", 10, 1))
+        journal.write_row(("T2", 11, 2))
+        journal.close()
+
+        journal = TradeJournal(self.file_path, self.header)
+        journal.write_row(("T3", 12, 3))
+        journal.close()
+
+        self.assertEqual([list(self.header), ["T1", "10", "1"], ["T2", "11", "2"], ["T3", "12", "3"]],
+                         self.read_rows(self.file_path))
+
+    def test_file_with_different_header_is_moved_aside(self):
+        with open(self.file_path, "w", newline="") as file:
+            csv.writer(file).writerows([("id", "price"), ("T0", 9)])
+
+        journal = TradeJournal(self.file_path, self.header)
+        journal.write_row(("T1", 10, 1))
+        journal.close()
+
+        old_files = [name for name in os.listdir(self.temp_dir.name) if name.startswith("trades_test_old_")]
+        self.assertEqual(1, len(old_files))
+        self.assertEqual([["id", "price"], ["T0", "9"]], self.read_rows(os.path.join(self.temp_dir.name, old_files[0])))
+        self.assertEqual([list(self.header), ["T1", "10", "1"]], self.read_rows(self.file_path))
+
+    def test_header_checked_only_when_opening_file(self):
+        with open(self.file_path, "w", newline="") as file:
+            csv.writer(file).writerow(self.header)
+        journal = TradeJournal(self.file_path, self.header)
+
+        with patch.object(TradeJournal, "_file_matches_header", wraps=journal._file_matches_header) as check_mock:
+            journal.write_row(("T1", 10, 1))
+            journal.write_row(("T2", 11, 2))
+            journal.write_row(("T3", 12, 3))
+        journal.close()
+
+        self.assertEqual(1, check_mock.call_count)
+        self.assertEqual(4, len(self.read_rows(self.file_path)))
+
+    def test_rows_flushed_when_written_by_default(self):
+        journal = TradeJournal(self.file_path, self.header)
+
+        journal.write_row(("T1", 10, 1))
+
+        self.assertEqual(0, journal.unflushed_rows)
+        self.assertEqual([list(self.header), ["T1", "10", "1"]], self.read_rows(self.file_path))
+        journal.close()
+
+    def test_rows_buffered_until_flush_interval(self):
+        journal = TradeJournal(self.file_path, self.header, flush_interval=60)
+
+        journal.write_row(("T1", 10, 1))
+        journal.write_row(("T2", 11, 2))
+
+        self.assertTrue(journal.is_open)
+        self.assertEqual(3, journal.unflushed_rows)
+        self.assertEqual(0, len(self.read_rows(self.file_path)))
+
+        journal.flush()
+
+        self.assertEqual(0, journal.unflushed_rows)
+        self.assertEqual(3, len(self.read_rows(self.file_path)))
+        journal.close()
+
+    def test_rotates_when_file_grows_beyond_max_size(self):
+        journal = TradeJournal(self.file_path, self.header, max_file_size=50)
+
+        journal.write_row(("T1", 10, 1))
+        journal.write_row(("T2", 11, 2))
+        journal.write_row(("T3", 12, 3))
+        journal.close()
+
+        rotated_files = sorted(name for name in os.listdir(self.temp_dir.name) if name != "trades_test.csv")
+        self.assertEqual(1, len(rotated_files))
+        self.assertEqual([list(self.header), ["T1", "10", "1"], ["T2", "11", "2"]],
+                         self.read_rows(os.path.join(self.temp_dir.name, rotated_files[0])))
+        self.assertEqual([list(self.header), ["T3", "12", "3"]], self.read_rows(self.file_path))
+
+    @patch("hummingbot.connector.trade_journal.TradeJournal._current_day")
+    def test_rotates_when_day_changes(self, current_day_mock):
+        current_day_mock.return_value = "20220101"
+        journal = TradeJournal(self.file_path, self.header, rotate_daily=True)
+
+        journal.write_row(("T1", 10, 1))
+        current_day_mock.return_value = "20220102"
+        journal.write_row(("T2", 11, 2))
+        journal.close()
+
+        rotated_path = os.path.join(self.temp_dir.name, "trades_test_20220101.csv")
+        self.assertEqual([list(self.header), ["T1", "10", "1"]], self.read_rows(rotated_path))
+        self.assertEqual([list(self.header), ["T2", "11", "2"]], self.read_rows(self.file_path))
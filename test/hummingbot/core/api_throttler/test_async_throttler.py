@@ -11,7 +11,8 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase, request_priority
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -192,6 +193,37 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         self.assertTrue(context.within_capacity())
 
+    def test_within_capacity_keeps_headroom_for_urgent_priorities(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits,
+                                   priority_capacity_shares=AsyncThrottlerBase.DEFAULT_PRIORITY_CAPACITY_SHARES)
+        pool_limit = throttler._id_to_limit_map[TEST_WEIGHTED_POOL_ID]
+        # Simulate a used capacity of 8/10 in the weighted pool
+        throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=pool_limit, weight=8))
+
+        # Market data requests can use 8/10 of the pool, order status queries 9/10 and cancels all of it
+        self.assertFalse(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        self.assertTrue(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID, RequestPriority.USER_QUERY).within_capacity())
+        throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=pool_limit, weight=1))
+        self.assertFalse(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID, RequestPriority.USER_QUERY).within_capacity())
+        with request_priority(RequestPriority.CANCEL):
+            self.assertTrue(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_execute_task_raises_error_when_weight_exceeds_priority_capacity(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits,
+                                   priority_capacity_shares={RequestPriority.MARKET_DATA: 0.4})
+
+        # Task 1 weighs 5 in the pool, but market data requests can only use 4/10 of it
+        with self.assertRaises(ValueError):
+            throttler.execute_task(TEST_WEIGHTED_TASK_1_ID)
+        self.assertTrue(throttler.execute_task(TEST_WEIGHTED_TASK_1_ID, RequestPriority.CANCEL).within_capacity())
+
+    def test_within_capacity_ignores_priorities_without_capacity_shares(self):
+        pool_limit = self.throttler._id_to_limit_map[TEST_WEIGHTED_POOL_ID]
+        self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=pool_limit, weight=9))
+
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID,
+                                                    RequestPriority.MARKET_DATA).within_capacity())
+
     def test_within_capacity_returns_true(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
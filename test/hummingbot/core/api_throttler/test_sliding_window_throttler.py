@@ -0,0 +1,182 @@
+import asyncio
+import sys
+import unittest
+from decimal import Decimal
+from typing import Awaitable, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import RateLimitWindow, SlidingWindowThrottler
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class SlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, limits_share_percentage=Decimal("100"))
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_rate_limit_window_expires_entries_in_order(self):
+        window = RateLimitWindow()
+        window.add(1.0, 2)
+        window.add(2.0, 3)
+        window.add(3.0, 1)
+        self.assertEqual(6, window.capacity_used)
+
+        self.assertEqual(1.0, window.capacity_available_at(4))
+        self.assertEqual(2.0, window.capacity_available_at(1))
+        self.assertIsNone(window.capacity_available_at(-1))
+
+        window.expire(1.0)
+        self.assertEqual(6, window.capacity_used)
+        window.expire(2.5)
+        self.assertEqual(1, window.capacity_used)
+        self.assertEqual(1, len(window.entries))
+
+    def test_acquire_records_request_in_all_related_limits(self):
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire())
+
+        self.assertEqual(1, self.throttler.capacity_used(TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual(5, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        # Another Task 1(weight=5) will exceed the capacity(11/10), but Task 2(weight=1) will not (7/10)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_acquire_keeps_headroom_for_urgent_priorities(self):
+        throttler = SlidingWindowThrottler(
+            rate_limits=self.rate_limits,
+            limits_share_percentage=Decimal("100"),
+            priority_capacity_shares=SlidingWindowThrottler.DEFAULT_PRIORITY_CAPACITY_SHARES)
+        for _ in range(8):
+            self.async_run_with_timeout(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        # Market data requests can use 8/10 of the pool, the rest is kept for queries, new orders and cancels
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire(), timeout=0.2)
+        self.async_run_with_timeout(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID, RequestPriority.CREATE).acquire())
+        with request_priority(RequestPriority.CANCEL):
+            self.assertFalse(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID,
+                                                    RequestPriority.USER_QUERY).within_capacity())
+            self.async_run_with_timeout(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        self.assertEqual(10, throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+
+    def test_execute_task_raises_error_when_weight_exceeds_priority_capacity(self):
+        throttler = SlidingWindowThrottler(rate_limits=self.rate_limits,
+                                           limits_share_percentage=Decimal("100"),
+                                           priority_capacity_shares={RequestPriority.MARKET_DATA: 0.4})
+
+        # Task 1 weighs 5 in the pool, but market data requests can only use 4/10 of it
+        with self.assertRaises(ValueError):
+            throttler.execute_task(TEST_WEIGHTED_TASK_1_ID)
+        self.async_run_with_timeout(throttler.execute_task(TEST_WEIGHTED_TASK_1_ID, RequestPriority.CANCEL).acquire())
+
+        self.assertEqual(5, throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+
+    def test_within_capacity_pool_non_weighted_task(self):
+        context = self.throttler.execute_task(TEST_PATH_URL)
+        self.assertTrue(context.within_capacity())
+
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_POOL_ID).acquire())
+
+        self.assertFalse(context.within_capacity())
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = SlidingWindowThrottler(rate_limits=[], limits_share_percentage=Decimal("100"))
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+        self.async_run_with_timeout(context.acquire())
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.async_run_with_timeout(self.throttler.execute_task(TEST_POOL_ID).acquire())
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(self.throttler.execute_task(TEST_POOL_ID).acquire(), timeout=0.5)
+
+    def test_acquire_sleeps_until_capacity_expires(self):
+        sleep_delays = []
+
+        async def sleep(delay: float):
+            sleep_delays.append(delay)
+            time_mock.return_value += delay
+
+        with patch.object(SlidingWindowThrottler, "_time") as time_mock, \
+                patch("hummingbot.core.api_throttler.sliding_window_throttler.asyncio.sleep", new=sleep):
+            throttler = SlidingWindowThrottler(rate_limits=self.rate_limits,
+                                               safety_margin_pct=0,
+                                               limits_share_percentage=Decimal("100"))
+            time_mock.return_value = 1640000000.0
+            self.async_run_with_timeout(throttler.execute_task(TEST_POOL_ID).acquire())
+            time_mock.return_value = 1640000001.0
+            self.async_run_with_timeout(throttler.execute_task(TEST_POOL_ID).acquire())
+
+        # A single wake-up, right after the first request left the 5 seconds window
+        self.assertEqual(1, len(sleep_delays))
+        self.assertAlmostEqual(4.0, sleep_delays[0], places=2)
+        self.assertGreater(sleep_delays[0], 4.0)
+
+    @patch.object(SlidingWindowThrottler, "_time")
+    def test_within_capacity_for_limits_with_milliseconds_interval(self, time_mock):
+        per_second_limit = RateLimit(limit_id="generic_per_second", limit=3, time_interval=1)
+        per_millisecond_limit = RateLimit(limit_id="generic_per_millisecond", limit=2, time_interval=0.2)
+        specific_limit = RateLimit(limit_id="specific_limit", limit=sys.maxsize, time_interval=1, linked_limits=[
+            LinkedLimitWeightPair(per_second_limit.limit_id),
+            LinkedLimitWeightPair(per_millisecond_limit.limit_id),
+        ])
+        throttler = SlidingWindowThrottler(rate_limits=[per_second_limit, per_millisecond_limit, specific_limit],
+                                           safety_margin_pct=0,
+                                           limits_share_percentage=Decimal("100"))
+        context = throttler.execute_task(specific_limit.limit_id)
+
+        time_mock.return_value = 1640000000.0000
+        self.async_run_with_timeout(context.acquire())
+
+        time_mock.return_value = 1640000000.0100
+        self.assertTrue(context.within_capacity())
+
+        time_mock.return_value = 1640000000.1000
+        self.async_run_with_timeout(context.acquire())
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.1900
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2000
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2100
+        self.assertTrue(context.within_capacity())
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_file import MarketDataFileError, MarketDataReader, MarketDataWriter
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class MarketDataFileTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "market_data.hbmd")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_messages_read_back_in_written_order(self):
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 10,
+             "bids": [["10", "1"], ["9", "2"]], "asks": [["11", "3"]]},
+            timestamp=1000.5,
+        )
+        diff = OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 12, "first_update_id": 11,
+             "bids": np.array([[10.0, 0.0, 12.0]]), "asks": np.empty((0, 2))},
+            timestamp=1001,
+        )
+        trade = OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": "ETH-HBOT", "trade_type": float(TradeType.SELL.value), "trade_id": 7, "update_id": 7,
+             "price": "100.5", "amount": "0.25"},
+            timestamp=1002,
+        )
+
+        with MarketDataWriter(self.path) as writer:
+            writer.write(snapshot, recorded_timestamp=1000)
+            writer.write(diff, recorded_timestamp=1001)
+            writer.write(trade, recorded_timestamp=1002)
+
+        recorded = list(MarketDataReader(self.path))
+
+        self.assertEqual([1000, 1001, 1002], [recorded_timestamp for recorded_timestamp, _ in recorded])
+        read_snapshot, read_diff, read_trade = [message for _, message in recorded]
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, read_snapshot.type)
+        self.assertEqual(1000.5, read_snapshot.timestamp)
+        self.assertEqual(10, read_snapshot.update_id)
+        self.assertEqual([[10, 1], [9, 2]], read_snapshot.content["bids"].tolist())
+        self.assertEqual([[11, 3]], read_snapshot.content["asks"].tolist())
+        self.assertTrue(read_snapshot.has_raw_levels)
+        self.assertEqual(OrderBookMessageType.DIFF, read_diff.type)
+        self.assertEqual(12, read_diff.update_id)
+        self.assertEqual(11, read_diff.first_update_id)
+        self.assertEqual([[10, 0]], read_diff.content["bids"].tolist())
+        self.assertEqual((0, 2), read_diff.content["asks"].shape)
+        self.assertEqual("ETH-HBOT", read_trade.trading_pair)
+        self.assertEqual(7, read_trade.trade_id)
+        self.assertEqual(float(TradeType.SELL.value), read_trade.content["trade_type"])
+        self.assertEqual(100.5, read_trade.content["price"])
+        self.assertEqual(0.25, read_trade.content["amount"])
+
+    def test_recorded_timestamps_never_go_backwards(self):
+        trade = OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": "COINALPHA-HBOT", "trade_type": float(TradeType.BUY.value), "trade_id": "not-an-int",
+             "price": 1, "amount": 1},
+            timestamp=None,
+        )
+
+        with MarketDataWriter(self.path) as writer:
+            writer.write(trade, recorded_timestamp=10)
+            writer.write(trade, recorded_timestamp=9)
+
+        recorded = list(MarketDataReader(self.path))
+
+        self.assertEqual([10, 10], [recorded_timestamp for recorded_timestamp, _ in recorded])
+        self.assertEqual(10, recorded[0][1].timestamp)
+        self.assertEqual(-1, recorded[0][1].trade_id)
+
+    def test_appending_sessions_redefine_trading_pairs(self):
+        def trade(trading_pair: str) -> OrderBookMessage:
+            return OrderBookMessage(
+                OrderBookMessageType.TRADE,
+                {"trading_pair": trading_pair, "trade_type": float(TradeType.BUY.value), "trade_id": 1,
+                 "price": 1, "amount": 1},
+                timestamp=1,
+            )
+
+        with MarketDataWriter(self.path) as writer:
+            writer.write(trade("COINALPHA-HBOT"), recorded_timestamp=1)
+        with MarketDataWriter(self.path) as writer:
+            writer.write(trade("ETH-HBOT"), recorded_timestamp=2)
+            writer.write(trade("COINALPHA-HBOT"), recorded_timestamp=3)
+
+        trading_pairs = [message.trading_pair for _, message in MarketDataReader(self.path)]
+
+        self.assertEqual(["COINALPHA-HBOT", "ETH-HBOT", "COINALPHA-HBOT"], trading_pairs)
+
+    def test_invalid_files_rejected(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not market data")
+
+        with self.assertRaises(MarketDataFileError):
+            MarketDataReader(self.path)
+        with self.assertRaises(MarketDataFileError):
+            MarketDataWriter(self.path)
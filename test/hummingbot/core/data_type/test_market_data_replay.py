@@ -0,0 +1,147 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_file import MarketDataReader, MarketDataWriter
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.market_data_replay import MarketDataReplayIterator, MarketDataReplayOrderBookTracker
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+
+
+class MarketDataReplayTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "market_data.hbmd")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def book_message(self, message_type: OrderBookMessageType, update_id: int, bids, asks,
+                     trading_pair: str = trading_pair) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type,
+            {"trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id),
+        )
+
+    def trade_message(self, trade_id: int, price: str, amount: str) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": self.trading_pair, "trade_type": float(TradeType.SELL.value), "trade_id": trade_id,
+             "update_id": trade_id, "price": price, "amount": amount},
+            timestamp=float(trade_id),
+        )
+
+    def record(self, *recorded_messages):
+        with MarketDataWriter(self.path) as writer:
+            for recorded_timestamp, message in recorded_messages:
+                writer.write(message, recorded_timestamp=recorded_timestamp)
+
+    def test_replay_applies_messages_up_to_timestamp(self):
+        self.record(
+            (1, self.book_message(OrderBookMessageType.DIFF, 2, [["9", "1"]], [])),
+            (2, self.book_message(OrderBookMessageType.SNAPSHOT, 1, [["10", "1"]], [["11", "1"]])),
+            (3, self.book_message(OrderBookMessageType.DIFF, 3, [["10", "0"]], [["12", "2"]])),
+            (4, self.book_message(OrderBookMessageType.SNAPSHOT, 5, [["8", "1"]], [["13", "1"]], "ETH-HBOT")),
+            (5, self.book_message(OrderBookMessageType.DIFF, 0, [["7", "1"]], [])),
+        )
+        tracker = MarketDataReplayOrderBookTracker(data_files=[self.path], trading_pairs=[self.trading_pair])
+
+        self.assertEqual(1, tracker.replay_until(1))
+        self.assertFalse(tracker.ready)
+
+        self.assertEqual(1, tracker.replay_until(2.5))
+        self.assertTrue(tracker.ready)
+        order_book: OrderBook = tracker.order_books[self.trading_pair]
+        bids, asks = order_book.to_numpy()
+        self.assertEqual([[10, 1], [9, 1]], bids[:, :2].tolist())
+        self.assertEqual([[11, 1]], asks[:, :2].tolist())
+
+        # The messages of other trading pairs are skipped, and so are the diffs older than the snapshot
+        self.assertEqual(2, tracker.replay_until(10))
+        bids, asks = order_book.to_numpy()
+        self.assertEqual([[9, 1]], bids[:, :2].tolist())
+        self.assertEqual([[11, 1], [12, 2]], asks[:, :2].tolist())
+        self.assertEqual(["COINALPHA-HBOT"], list(tracker.order_books))
+        self.assertIsNone(tracker.data_source.next_timestamp)
+        self.assertEqual(4, tracker.replayed_messages_count)
+
+    def test_replayed_trades_emit_order_book_trade_events(self):
+        self.record(
+            (1, self.book_message(OrderBookMessageType.SNAPSHOT, 1, [["10", "1"]], [["11", "1"]])),
+            (2, self.trade_message(1, "10", "0.5")),
+        )
+        tracker = MarketDataReplayOrderBookTracker(data_files=[self.path], trading_pairs=[self.trading_pair])
+        tracker.replay_until(1)
+        trade_logger = EventLogger()
+        tracker.order_books[self.trading_pair].add_listener(OrderBookEvent.TradeEvent, trade_logger)
+
+        tracker.replay_until(2)
+
+        self.assertEqual(1, len(trade_logger.event_log))
+        trade_event = trade_logger.event_log[0]
+        self.assertEqual(TradeType.SELL, trade_event.type)
+        self.assertEqual(10, trade_event.price)
+        self.assertEqual(0.5, trade_event.amount)
+        last_traded_prices = asyncio.get_event_loop().run_until_complete(
+            tracker.data_source.get_last_traded_prices([self.trading_pair]))
+        self.assertEqual({self.trading_pair: 10}, last_traded_prices)
+
+    def test_reset_rewinds_replay(self):
+        self.record((1, self.book_message(OrderBookMessageType.SNAPSHOT, 1, [["10", "1"]], [["11", "1"]])))
+        tracker = MarketDataReplayOrderBookTracker(data_files=[self.path], trading_pairs=[self.trading_pair])
+        tracker.replay_until(1)
+
+        tracker.reset()
+
+        self.assertFalse(tracker.ready)
+        self.assertEqual(0, len(tracker.order_books))
+        self.assertEqual(1, tracker.replay_until(1))
+        self.assertTrue(tracker.ready)
+
+    def test_replay_iterator_driven_by_backtest_clock(self):
+        self.record(
+            (1000, self.book_message(OrderBookMessageType.SNAPSHOT, 1, [["10", "1"]], [["11", "1"]])),
+            (1030, self.book_message(OrderBookMessageType.DIFF, 2, [["10.5", "1"]], [])),
+        )
+        tracker = MarketDataReplayOrderBookTracker(data_files=[self.path], trading_pairs=[self.trading_pair])
+        replay_iterator = MarketDataReplayIterator(tracker)
+        clock = Clock(ClockMode.BACKTEST, tick_size=10, start_time=990, end_time=1040)
+        clock.add_iterator(replay_iterator)
+
+        clock.backtest_til(1020)
+
+        self.assertEqual(10, tracker.order_books[self.trading_pair].get_price(False))
+        self.assertFalse(replay_iterator.finished)
+
+        clock.backtest_til(1040)
+
+        self.assertEqual(10.5, tracker.order_books[self.trading_pair].get_price(False))
+        self.assertTrue(replay_iterator.finished)
+
+    def test_recorder_writes_tracker_messages(self):
+        tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        recorder = MarketDataRecorder(tracker, self.path)
+
+        recorder.start()
+        tracker._notify_message_listeners(self.book_message(OrderBookMessageType.DIFF, 2, [["10", "1"]], []))
+        tracker._notify_message_listeners(self.trade_message(3, "10", "1"))
+        recorder.stop()
+        tracker._notify_message_listeners(self.trade_message(4, "10", "1"))
+
+        message_types = [message.type for _, message in MarketDataReader(self.path)]
+        self.assertEqual([OrderBookMessageType.DIFF, OrderBookMessageType.TRADE], message_types)
+        self.assertFalse(recorder.recording)
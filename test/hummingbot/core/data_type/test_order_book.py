@@ -3,6 +3,8 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +52,157 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 1.5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(1.5, result.result_volume)
+        result = order_book.get_price_for_volume(False, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(3, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertEqual(4.5, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 1.5)
+        self.assertAlmostEqual(8 / 3, result.result_price)
+        result = order_book.get_vwap_for_volume(True, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(4, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(True, 9)
+        self.assertEqual(5, result.result_price)
+        result = order_book.get_price_for_quote_volume(False, 4)
+        self.assertEqual(2, result.result_price)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 1.5)
+        self.assertEqual(6.5, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(False, 2)
+        self.assertEqual(5, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 5.5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_volume_for_price(False, 2)
+        self.assertEqual(2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(True, 5)
+        self.assertEqual(9, result.result_volume)
+        result = order_book.get_quote_volume_for_price(False, 2.5)
+        self.assertEqual(3, result.result_volume)
+
+    def test_depth_index_queries_match_linear_walks(self):
+        np.random.seed(0)
+        linear_book = OrderBook()
+        indexed_book = OrderBook(depth_index=True)
+        self.assertFalse(linear_book.depth_index_enabled)
+        self.assertTrue(indexed_book.depth_index_enabled)
+
+        levels = 200
+        bids_array = np.column_stack([100 - np.arange(1, levels + 1) * 0.1,
+                                      np.random.uniform(0.1, 2, levels),
+                                      np.ones(levels)])
+        asks_array = np.column_stack([100 + np.arange(1, levels + 1) * 0.1,
+                                      np.random.uniform(0.1, 2, levels),
+                                      np.ones(levels)])
+        for order_book in (linear_book, indexed_book):
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        def assert_same_results():
+            for is_buy in (True, False):
+                for volume in (0.05, 1, 17.3, 150, 1e6):
+                    for query in ("get_price_for_volume", "get_vwap_for_volume", "get_quote_volume_for_base_amount"):
+                        expected = getattr(linear_book, query)(is_buy, volume)
+                        actual = getattr(indexed_book, query)(is_buy, volume)
+                        np.testing.assert_equal(expected.result_price, actual.result_price)
+                        self.assertAlmostEqual(expected.result_volume, actual.result_volume)
+                    expected = linear_book.get_price_for_quote_volume(is_buy, volume * 100)
+                    actual = indexed_book.get_price_for_quote_volume(is_buy, volume * 100)
+                    np.testing.assert_equal(expected.result_price, actual.result_price)
+                    self.assertAlmostEqual(expected.result_volume, actual.result_volume)
+                for price in (50, 95.05, 99.95, 100, 100.05, 104.95, 150):
+                    for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                        expected = getattr(linear_book, query)(is_buy, price)
+                        actual = getattr(indexed_book, query)(is_buy, price)
+                        np.testing.assert_equal(expected.result_price, actual.result_price)
+                        self.assertAlmostEqual(expected.result_volume, actual.result_volume)
+
+        assert_same_results()
+
+        # Diffs only invalidate the side they touch, and the index is rebuilt on the next query.
+        new_bids = np.array([[99.95, 3, 2], [99.9, 0, 2]], dtype=np.float64)
+        new_asks = np.array([[100.2, 0, 3]], dtype=np.float64)
+        for order_book in (linear_book, indexed_book):
+            order_book.apply_numpy_diffs(new_bids, np.empty((0, 3), dtype=np.float64))
+        assert_same_results()
+        for order_book in (linear_book, indexed_book):
+            order_book.apply_numpy_diffs(np.empty((0, 3), dtype=np.float64), new_asks)
+        assert_same_results()
+
+        indexed_book.depth_index_enabled = False
+        assert_same_results()
+
+    def test_to_numpy_and_snapshot_depth(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.to_numpy()
+        self.assertEqual(np.float64, bids.dtype)
+        np.testing.assert_array_equal(bids_array[::-1], bids)
+        np.testing.assert_array_equal(asks_array, asks)
+
+        bids, asks = order_book.to_numpy(depth=2)
+        np.testing.assert_array_equal([[3, 1, 3], [2, 1, 2]], bids)
+        np.testing.assert_array_equal([[4, 1, 1], [5, 1, 2]], asks)
+
+        bids, asks = order_book.to_numpy(depth=0)
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+        bids_df, asks_df = order_book.get_snapshot(depth=10)
+        self.assertEqual(["price", "amount", "update_id"], list(bids_df.columns))
+        self.assertEqual(3, len(bids_df))
+        self.assertEqual(4, len(asks_df))
+        self.assertEqual([3., 1., 3.], bids_df.iloc[0].tolist())
+        self.assertEqual([4., 1., 1.], asks_df.iloc[0].tolist())
+
+    def test_apply_raw_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["3", "1"], ["2", "1", "extra"]], [[4.0, 1.0], [5.0, 1.0]], 1)
+        bids, asks = order_book.to_numpy()
+        np.testing.assert_array_equal([[3, 1, 1], [2, 1, 1]], bids)
+        np.testing.assert_array_equal([[4, 1, 1], [5, 1, 1]], asks)
+
+        order_book.apply_raw_diffs([["3", "0"], ["2.5", "2"]], np.array([[4.5, 3.0]]), 2)
+        bids, asks = order_book.to_numpy()
+        np.testing.assert_array_equal([[2.5, 2, 2], [2, 1, 1]], bids)
+        np.testing.assert_array_equal([[4, 1, 1], [4.5, 3, 2], [5, 1, 1]], asks)
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual(2.5, order_book.get_price(False))
+
+    def test_top_of_book_changed_event(self):
+        order_book = OrderBook()
+        events = []
+        listener = EventForwarder(events.append)
+        order_book.add_listener(OrderBookEvent.TopOfBookChanged, listener)
+
+        order_book.apply_raw_snapshot([[3.0, 1.0], [2.0, 1.0]], [[4.0, 1.0]], 1)
+        self.assertEqual([order_book], events)
+
+        # Updates below the top of the book do not emit the event
+        order_book.apply_raw_diffs([[2.0, 5.0]], [[5.0, 1.0]], 2)
+        self.assertEqual(1, len(events))
+
+        order_book.apply_raw_diffs([], [[3.5, 1.0]], 3)
+        self.assertEqual(2, len(events))
+        self.assertEqual(3.5, order_book.get_price(True))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -248,3 +248,35 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_bids_and_asks_are_parsed_once(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 3, "bids": [["1.5", "2", "ignored"]], "asks": [["2.5", "0"]]},
+            timestamp=time.time(),
+        )
+
+        self.assertEqual([OrderBookRow(1.5, 2.0, 3)], msg.bids)
+        self.assertEqual([OrderBookRow(2.5, 0.0, 3)], msg.asks)
+        self.assertIs(msg.bids, msg.bids)
+        self.assertIs(msg.asks, msg.asks)
+
+    def test_has_raw_levels(self):
+        class CustomOrderBookMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return []
+
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 1, "bids": [], "asks": []},
+            timestamp=time.time(),
+        )
+        custom_msg = CustomOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 1, "bids": [], "asks": []},
+            timestamp=time.time(),
+        )
+
+        self.assertTrue(msg.has_raw_levels)
+        self.assertFalse(custom_msg.has_raw_levels)
@@ -0,0 +1,192 @@
+import asyncio
+import time
+import unittest
+from collections import deque
+from typing import Awaitable, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        self.tracking_task: Optional[asyncio.Task] = None
+
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot([], [], 1)
+        self.tracker._order_books[self.trading_pair] = self.order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracker._past_diffs_windows[self.trading_pair] = deque()
+        self.tracker._order_books_initialized.set()
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def diff_message(self, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id),
+        )
+
+    def test_track_single_book_coalesces_queued_diffs(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(2, [["10", "1"], ["9", "1"]], [["11", "1"]]))
+        message_queue.put_nowait(self.diff_message(4, [["10", "0"]], [["11", "3"], ["12", "1"]]))
+        # Arrives late, but must not override the newer level for 11
+        message_queue.put_nowait(self.diff_message(3, [["8", "2"]], [["11", "5"]]))
+
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        bids, asks = self.order_book.to_numpy()
+        self.assertEqual([[9, 1, 2], [8, 2, 3]], bids.tolist())
+        self.assertEqual([[11, 3, 4], [12, 1, 4]], asks.tolist())
+        self.assertEqual(4, self.order_book.last_diff_uid)
+        self.assertEqual(3, len(self.tracker._past_diffs_windows[self.trading_pair]))
+
+        metrics = self.tracker.diff_batch_metrics[self.trading_pair]
+        self.assertEqual(1, metrics.batches)
+        self.assertEqual(3, metrics.last_batch_size)
+        self.assertEqual(2, metrics.max_queue_size)
+        self.assertEqual(3, metrics.average_batch_size)
+
+    def test_track_single_book_merges_raw_levels_without_building_rows(self):
+        messages = [self.diff_message(2, [["10", "1"]], [["11", "1"]]),
+                    self.diff_message(3, [["10", "2"]], [["12", "1"]])]
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        for message in messages:
+            message_queue.put_nowait(message)
+
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        bids, asks = self.order_book.to_numpy()
+        self.assertEqual([[10, 2, 3]], bids.tolist())
+        self.assertEqual([[11, 1, 2], [12, 1, 3]], asks.tolist())
+        for message in messages:
+            self.assertNotIn("bids", vars(message))
+            self.assertNotIn("asks", vars(message))
+
+    def test_track_single_book_records_queue_lag_of_oldest_message(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        # Exchange timestamps in milliseconds must not affect the lag, measured from the time the router queued them
+        oldest_message = self.diff_message(2, [["10", "1"]], [])._replace(timestamp=time.time() * 1e3)
+        oldest_message.queued_timestamp = time.time() - 5
+        newest_message = self.diff_message(3, [["9", "1"]], [])._replace(timestamp=time.time() * 1e3)
+        newest_message.queued_timestamp = time.time()
+        message_queue.put_nowait(oldest_message)
+        message_queue.put_nowait(newest_message)
+
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        metrics = self.tracker.diff_batch_metrics[self.trading_pair]
+        self.assertGreaterEqual(metrics.last_queue_lag, 5)
+        self.assertLess(metrics.last_queue_lag, 10)
+        self.assertEqual(metrics.last_queue_lag, metrics.max_queue_lag)
+
+    @patch("hummingbot.core.data_type.order_book_tracker.time.time")
+    def test_diff_router_records_queued_timestamp(self, time_mock):
+        time_mock.return_value = 1640001112.223
+        message = self.diff_message(2, [["10", "1"]], [])._replace(timestamp=1640001112223.0)
+        self.tracker._order_book_diff_stream.put_nowait(message)
+
+        self.tracking_task = self.ev_loop.create_task(self.tracker._order_book_diff_router())
+        queued_message = self.async_run_with_timeout(
+            self.tracker._tracking_message_queues[self.trading_pair].get())
+
+        self.assertEqual(1640001112.223, queued_message.queued_timestamp)
+
+    def test_track_single_book_snapshot_ends_diff_batch(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(2, [["10", "1"]], []))
+        message_queue.put_nowait(OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"trading_pair": self.trading_pair, "update_id": 3, "bids": [["9", "1"]], "asks": [["11", "1"]]},
+            timestamp=3.0,
+        ))
+        message_queue.put_nowait(self.diff_message(4, [["8", "1"]], []))
+
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        bids, asks = self.order_book.to_numpy()
+        self.assertEqual([[9, 1, 3], [8, 1, 4]], bids.tolist())
+        self.assertEqual([[11, 1, 3]], asks.tolist())
+        self.assertEqual(3, self.order_book.snapshot_uid)
+        self.assertEqual(2, self.tracker.diff_batch_metrics[self.trading_pair].batches)
+
+    def test_init_order_books_concurrently_when_throttled(self):
+        trading_pairs = [f"COIN{i}-HBOT" for i in range(5)]
+        data_source = MagicMock()
+        pending_snapshots = {trading_pair: asyncio.Event() for trading_pair in trading_pairs}
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            await pending_snapshots[trading_pair].wait()
+            return OrderBook()
+
+        data_source.get_new_order_book = get_new_order_book
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs, throttler=MagicMock())
+        tracker._track_single_book = AsyncMock()
+
+        init_task = self.ev_loop.create_task(tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertEqual([], tracker.ready_trading_pairs)
+
+        pending_snapshots[trading_pairs[3]].set()
+        self.async_run_with_timeout(tracker.wait_for_order_book(trading_pairs[3]))
+        self.assertTrue(tracker.is_order_book_ready(trading_pairs[3]))
+        self.assertFalse(tracker.is_order_book_ready(trading_pairs[0]))
+        self.assertEqual([trading_pairs[3]], tracker.ready_trading_pairs)
+        self.assertFalse(tracker.ready)
+
+        for event in pending_snapshots.values():
+            event.set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(trading_pairs, tracker.ready_trading_pairs)
+        self.assertEqual(set(trading_pairs), set(tracker.order_book_initialization_times))
+        self.assertEqual(set(trading_pairs), set(tracker.order_books))
+
+    def test_stop_clears_order_book_initialization_times(self):
+        data_source = MagicMock()
+        data_source.get_new_order_book = AsyncMock(return_value=OrderBook())
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair], throttler=MagicMock())
+        tracker._track_single_book = AsyncMock()
+
+        self.async_run_with_timeout(tracker._init_order_books())
+        self.assertEqual({self.trading_pair}, set(tracker.order_book_initialization_times))
+
+        tracker.stop()
+
+        self.assertEqual({}, tracker.order_book_initialization_times)
+
+    @patch("hummingbot.core.data_type.order_book_tracker.asyncio.sleep", new_callable=AsyncMock)
+    def test_init_order_books_retries_failed_snapshot_when_throttled(self, _):
+        data_source = MagicMock()
+        data_source.get_new_order_book = AsyncMock(side_effect=[IOError("Test error"), OrderBook()])
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair], throttler=MagicMock())
+        tracker._track_single_book = AsyncMock()
+
+        self.async_run_with_timeout(tracker._init_order_books())
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(2, data_source.get_new_order_book.call_count)
+        self.assertTrue(tracker.is_order_book_ready(self.trading_pair))
@@ -10,7 +10,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -82,6 +82,37 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_find_rate_with_wrapped_tokens(self):
+        prices = {"WETH-USDT": Decimal("2000"), "ETH-DAI": Decimal("1990"), "BTC-WETH": Decimal("15")}
+        self.assertEqual(Decimal("2000"), find_rate(prices, "ETH-USDT"))
+        self.assertEqual(Decimal("1990"), find_rate(prices, "WETH-DAI"))
+        self.assertEqual(Decimal("1"), find_rate(prices, "WETH-ETH"))
+        self.assertEqual(Decimal("30000"), find_rate(prices, "BTC-USDT"))
+
+    def test_find_rate_through_several_assets(self):
+        prices = {
+            "HBOT-USDT": Decimal("100"),
+            "BTC-USDT": Decimal("20000"),
+            "EUR-USDT": Decimal("1.25"),
+            "GBP-EUR": Decimal("1.25"),
+        }
+        graph = RateConversionGraph(prices)
+        self.assertEqual(Decimal("16000"), graph.find_rate("BTC-EUR"))
+        self.assertEqual(Decimal("0.005"), graph.find_rate("HBOT-BTC"))
+        self.assertEqual(Decimal("64"), graph.find_rate("HBOT-GBP"))
+        self.assertIsNone(graph.find_rate("ZBOT-EUR"))
+
+    def test_pair_rate_found_from_refreshed_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")}
+        self.assertEqual(Decimal("75"), rate_oracle.get_pair_rate("HBOT-GBP"))
+
+        rate_oracle._prices = {"HBOT-USDT": Decimal("200"), "USDT-GBP": Decimal("0.75")}
+        self.assertEqual(Decimal("150"), rate_oracle.get_pair_rate("HBOT-GBP"))
+
+        rate_oracle._prices["GBP-EUR"] = Decimal("1.2")
+        self.assertEqual(Decimal("180"), rate_oracle.get_pair_rate("HBOT-EUR"))
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
@@ -7,9 +7,21 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class TickRecorder(PyTimeIterator):
+    def __init__(self):
+        super().__init__()
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +136,63 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_event_driven_run_ticks_on_trigger(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=10, min_tick_interval=0)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+        pubsub = PubSub()
+        clock.add_tick_trigger(pubsub, OrderBookEvent.TopOfBookChanged)
+
+        async def trigger_soon():
+            await asyncio.sleep(0.1)
+            pubsub.trigger_event(OrderBookEvent.TopOfBookChanged, None)
+
+        with clock:
+            start = time.time()
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(start + 0.5), trigger_soon()))
+
+        # A single tick, right after the trigger instead of waiting for the 10 seconds tick size
+        self.assertEqual(1, len(recorder.ticks))
+        self.assertLess(recorder.ticks[0] - start, 0.4)
+
+        clock.remove_tick_triggers()
+        pubsub.trigger_event(OrderBookEvent.TopOfBookChanged, None)
+        self.assertEqual(0, len(pubsub.get_listeners(OrderBookEvent.TopOfBookChanged)))
+
+    def test_event_driven_run_respects_min_tick_interval(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=10, min_tick_interval=0.3)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+
+        async def trigger_repeatedly():
+            for _ in range(10):
+                clock.trigger_tick()
+                await asyncio.sleep(0.05)
+
+        with clock:
+            start = time.time()
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(start + 0.5), trigger_repeatedly()))
+
+        # The triggers are coalesced into ticks at least 0.3 seconds apart
+        self.assertEqual(2, len(recorder.ticks))
+        self.assertGreaterEqual(recorder.ticks[0] - start, 0.3)
+        self.assertGreaterEqual(recorder.ticks[1] - recorder.ticks[0], 0.3)
+
+    def test_profile_ticks_records_durations_per_iterator(self):
+        recorder = TickRecorder()
+        self.clock_backtest.add_iterator(recorder)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 5 * self.tick_size)
+        self.assertEqual({}, self.clock_backtest.tick_durations)
+
+        self.clock_backtest.profile_ticks = True
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 10 * self.tick_size)
+
+        stats = self.clock_backtest.tick_durations[recorder]
+        self.assertEqual(5, stats.ticks)
+        self.assertEqual(10, len(recorder.ticks))
+        self.assertGreaterEqual(stats.max_duration, stats.average_duration)
+        self.assertGreaterEqual(stats.total_duration, stats.max_duration)
+
+        self.clock_backtest.reset_tick_durations()
+        self.assertEqual({}, self.clock_backtest.tick_durations)
@@ -0,0 +1,113 @@
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.event.order_fill_store import OrderFillStore
+
+
+class OrderFillStoreTests(TestCase):
+
+    def fill(self, timestamp: float, trade_type: TradeType = TradeType.BUY, trading_pair: str = "COINALPHA-HBOT",
+             price: str = "100", amount: str = "1", trade_fee=None) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=f"OID{timestamp}",
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=trade_fee or AddedToCostTradeFee(percent=Decimal("0.001")),
+            exchange_trade_id=f"TID{timestamp}",
+        )
+
+    def test_older_fills_spilled_beyond_recent_capacity(self):
+        store = OrderFillStore(recent_capacity=2)
+
+        for timestamp in range(1, 6):
+            store.append(self.fill(timestamp))
+
+        self.assertEqual(5, len(store))
+        self.assertEqual(3, store.spilled_count)
+        self.assertEqual([4, 5], [event.timestamp for event in store.recent_events])
+
+    def test_trades_rebuilt_from_spilled_fills(self):
+        store = OrderFillStore(recent_capacity=1)
+        fee = DeductedFromReturnsTradeFee(percent=Decimal("0.002"),
+                                          percent_token="BNB",
+                                          flat_fees=[TokenAmount("HBOT", Decimal("0.5")),
+                                                     TokenAmount("ETH", Decimal("1"))])
+        store.append(self.fill(1, TradeType.SELL, price="99.5", amount="0.25", trade_fee=fee))
+        store.append(self.fill(2))
+
+        trades = list(store.iter_trades("binance"))
+
+        self.assertEqual(2, len(trades))
+        spilled_trade = trades[0]
+        self.assertEqual("COINALPHA-HBOT", spilled_trade.trading_pair)
+        self.assertEqual(TradeType.SELL, spilled_trade.side)
+        self.assertEqual(Decimal("99.5"), spilled_trade.price)
+        self.assertEqual(Decimal("0.25"), spilled_trade.amount)
+        self.assertEqual(OrderType.LIMIT, spilled_trade.order_type)
+        self.assertEqual("binance", spilled_trade.market)
+        self.assertEqual(1, spilled_trade.timestamp)
+        self.assertEqual(fee, spilled_trade.trade_fee)
+        self.assertEqual(2, trades[1].timestamp)
+
+    def test_spilled_fills_keep_exact_decimal_values(self):
+        store = OrderFillStore(recent_capacity=0)
+        fee = AddedToCostTradeFee(percent=Decimal("0.00075"),
+                                  flat_fees=[TokenAmount("HBOT", Decimal("1E+300"))])
+        store.append(self.fill(1, price="12345.123456789012345", amount="0.000000012345678901", trade_fee=fee))
+        store.append(self.fill(2, TradeType.SELL, price="98765432109876543210.5", amount="3"))
+
+        trades = list(store.iter_trades("binance"))
+
+        self.assertEqual(Decimal("12345.123456789012345"), trades[0].price)
+        self.assertEqual(Decimal("0.000000012345678901"), trades[0].amount)
+        self.assertEqual(fee, trades[0].trade_fee)
+        self.assertEqual(Decimal("98765432109876543210.5"), trades[1].price)
+        expected = {"COINALPHA": Decimal("0.000000012345678901") - Decimal("3"),
+                    "HBOT": (Decimal("3") * Decimal("98765432109876543210.5")
+                             - Decimal("12345.123456789012345") * Decimal("0.000000012345678901"))}
+        self.assertEqual(expected, store.filled_balances())
+        self.assertEqual({"COINALPHA": Decimal("-3"), "HBOT": Decimal("3") * Decimal("98765432109876543210.5")},
+                         store.filled_balances(starting_timestamp=1))
+
+    def test_spill_file_grows_past_initial_capacity(self):
+        store = OrderFillStore(recent_capacity=0)
+        fills = OrderFillStore.INITIAL_SPILL_CAPACITY * 2 + 1
+
+        for timestamp in range(fills):
+            store.append(self.fill(timestamp, price=str(timestamp)))
+
+        self.assertEqual(fills, store.spilled_count)
+        self.assertEqual([Decimal(timestamp) for timestamp in range(fills)],
+                         [trade.price for trade in store.iter_trades("binance")])
+
+    def test_filled_balances(self):
+        store = OrderFillStore(recent_capacity=2)
+        store.append(self.fill(1, TradeType.BUY, amount="2"))
+        store.append(self.fill(2, TradeType.SELL, price="110", amount="1"))
+        store.append(self.fill(3, TradeType.BUY, trading_pair="ETH-HBOT", price="10", amount="3"))
+        store.append(self.fill(4, TradeType.SELL, amount="0.5"))
+
+        self.assertEqual({"COINALPHA": Decimal("0.5"), "HBOT": Decimal("-70"), "ETH": Decimal("3")},
+                         store.filled_balances())
+        self.assertEqual({"COINALPHA": Decimal("-1.5"), "HBOT": Decimal("130"), "ETH": Decimal("3")},
+                         store.filled_balances(starting_timestamp=1))
+        self.assertEqual({"COINALPHA": Decimal("-0.5"), "HBOT": Decimal("50")},
+                         store.filled_balances(starting_timestamp=3))
+
+    def test_clear(self):
+        store = OrderFillStore(recent_capacity=1)
+        store.append(self.fill(1))
+        store.append(self.fill(2))
+
+        store.clear()
+
+        self.assertEqual(0, len(store))
+        self.assertEqual([], list(store.iter_trades("binance")))
+        self.assertEqual({}, store.filled_balances())
@@ -3,6 +3,7 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
@@ -89,6 +90,77 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_listener_added_after_trigger_receives_next_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(2, len(self.listener_zero.event_log))
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+    def test_removed_listener_does_not_receive_events(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self.listener_zero.event_log))
+
+    def test_listener_removed_before_trigger_receives_no_events(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(0, len(self.listener_zero.event_log))
+        self.assertEqual([], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listener_added_twice_receives_events_once(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self.listener_zero.event_log))
+
+    def test_listener_removing_itself_while_event_is_triggered(self):
+        pubsub = self.pubsub
+
+        class SelfRemovingListener(EventListener):
+            def __init__(self):
+                super().__init__()
+                self.calls = 0
+
+            def __call__(self, arg):
+                self.calls += 1
+                pubsub.remove_listener(MockEventType.EVENT_ZERO, self)
+
+        self_removing_listener = SelfRemovingListener()
+        self.pubsub.add_listener(self.event_tag_zero, self_removing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, self_removing_listener.calls)
+        self.assertEqual(2, len(self.listener_zero.event_log))
+
+    def test_lapsed_listener_remove_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(2, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
 
 if __name__ == "__main__":
     unittest.main()
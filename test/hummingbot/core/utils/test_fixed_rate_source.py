@@ -22,5 +22,15 @@ class FixedRateSourceTests(TestCase):
 
         self.assertEqual(rate_source.get_pair_rate("USDT-BTC"), Decimal(1) / Decimal(40000))
 
+    def test_get_rate_after_rates_change(self):
+        rate_source = FixedRateSource()
+        rate_source.add_rate("BTC-USDT", Decimal(40000))
+        self.assertIsNone(rate_source.get_pair_rate("BTC-EUR"))
+
+        rate_source.add_rate("EUR-USDT", Decimal(2))
+        rate_source.add_rate("BTC-USDT", Decimal(30000))
+
+        self.assertEqual(rate_source.get_pair_rate("BTC-EUR"), Decimal(15000))
+
     def test_string_representation(self):
         self.assertEqual(str(FixedRateSource()), "fixed rates")
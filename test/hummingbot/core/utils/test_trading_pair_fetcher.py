@@ -1,5 +1,6 @@
 import asyncio
 import json
+import tempfile
 import unittest
 from decimal import Decimal
 from typing import Any, Awaitable, Dict
@@ -13,7 +14,7 @@ from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.settings import ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
-from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher, TradingPairsCache
 
 
 class TestTradingPairFetcher(unittest.TestCase):
@@ -88,6 +89,64 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"mockConnector": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetched_trading_pairs_are_cached(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        failing_connector = AsyncMock()
+        failing_connector.all_trading_pairs.return_value = []
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+            "mock_exchange_2": self.MockConnectorSetting(name="mock_exchange_2", connector=failing_connector),
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = f"{temp_dir}/trading_pairs_cache.json"
+            client_config_map = ClientConfigAdapter(ClientConfigMap())
+            save_patch = patch.object(TradingPairsCache, "save", autospec=True, side_effect=TradingPairsCache.save)
+            with save_patch as save_mock:
+                trading_pair_fetcher = TradingPairFetcher(client_config_map,
+                                                          trading_pairs_cache=TradingPairsCache(cache_path))
+                self.async_run_with_timeout(trading_pair_fetcher._fetch_task, 1.0)
+
+            cache = TradingPairsCache(cache_path)
+            self.assertEqual(["MOCK-HBOT"], cache.get("mock_exchange_1"))
+            self.assertIsNone(cache.get("mock_exchange_2"))
+            self.assertEqual(1, save_mock.call_count)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_cached_trading_pairs_are_used_without_instantiating_connectors(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["LIVE-HBOT"]
+        cached_connector_setting = self.MockConnectorSetting(name="mock_exchange_1", connector=connector)
+        cached_connector_setting.non_trading_connector_instance_with_default_configuration = MagicMock()
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": cached_connector_setting,
+            "mock_exchange_2": self.MockConnectorSetting(name="mock_exchange_2", connector=connector),
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = TradingPairsCache(f"{temp_dir}/trading_pairs_cache.json")
+            cache.set("mock_exchange_1", ["CACHED-HBOT"])
+            cache.save()
+            client_config_map = ClientConfigAdapter(ClientConfigMap())
+            trading_pair_fetcher = TradingPairFetcher(client_config_map,
+                                                      trading_pairs_cache=TradingPairsCache(cache.path))
+            self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+            self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual({"mock_exchange_1": ["CACHED-HBOT"], "mock_exchange_2": ["LIVE-HBOT"]},
+                         trading_pair_fetcher.trading_pairs)
+        cached_connector_setting.non_trading_connector_instance_with_default_configuration.assert_not_called()
+
+    def test_expired_cached_trading_pairs_are_ignored(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = TradingPairsCache(f"{temp_dir}/trading_pairs_cache.json", ttl=-1)
+            cache.set("mock_exchange_1", ["CACHED-HBOT"])
+
+            self.assertIsNone(cache.get("mock_exchange_1"))
+            self.assertIsNone(cache.get("mock_exchange_2"))
+
     @aioresponses()
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.get_perp_markets")
@@ -0,0 +1,44 @@
+import json
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.core.web_assistant.connections import json_decoder
+from hummingbot.core.web_assistant.connections.json_decoder import (
+    decode_json,
+    get_default_json_decoder,
+    stdlib_json_decoder,
+)
+
+
+class JSONDecoderTests(unittest.TestCase):
+
+    def test_default_decoder_decodes_text_and_bytes(self):
+        decoder = get_default_json_decoder()
+        document = '{"price": "0.1", "amount": 0.1, "ids": [1, 2], "ok": true, "none": null}'
+
+        self.assertEqual(json.loads(document), decoder(document))
+        self.assertEqual(json.loads(document), decoder(document.encode()))
+
+    def test_default_decoder_parses_floats_exactly(self):
+        decoder = get_default_json_decoder()
+
+        for number in ["0.1", "19375.27", "0.00000123", "123456789.123456789"]:
+            self.assertEqual(float(Decimal(number)), decoder(f"[{number}]")[0])
+
+    def test_stdlib_decoder_used_when_no_fast_decoder_available(self):
+        with patch.object(json_decoder, "orjson", None), \
+                patch.object(json_decoder, "_ujson_supports_precise_float", return_value=False):
+            self.assertIs(stdlib_json_decoder, get_default_json_decoder())
+
+    def test_decode_json_falls_back_to_stdlib_decoder(self):
+        def failing_decoder(_):
+            raise OverflowError("Value is too big")
+
+        self.assertEqual({"id": 2 ** 70}, decode_json('{"id": %d}' % 2 ** 70, failing_decoder))
+
+    def test_decode_json_raises_on_invalid_document(self):
+        with self.assertRaises(ValueError):
+            decode_json("pong", get_default_json_decoder())
+        with self.assertRaises(ValueError):
+            decode_json("pong", stdlib_json_decoder)
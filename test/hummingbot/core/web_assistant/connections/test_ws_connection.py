@@ -121,6 +121,52 @@ class WSConnectionTest(unittest.TestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_raw(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        message = json.dumps({"one": 1})
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message=message)
+
+        response = self.async_run_with_timeout(self.ws_connection.receive(raw=True))
+
+        self.assertEqual(message, response.data)
+        self.assertNotEqual(0, self.ws_connection.last_recv_time)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_uses_json_decoder(self, ws_connect_mock):
+        decoded_messages = []
+
+        def decoder(data):
+            decoded_messages.append(data)
+            return json.loads(data)
+
+        ws_connection = WSConnection(self.client_session, json_decoder=decoder)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        message = json.dumps({"one": 1})
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message=message)
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+
+        self.assertEqual({"one": 1}, response.data)
+        self.assertEqual([message], decoded_messages)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_plain_text_and_binary_messages_not_decoded(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=b"\x01\x02", message_type=aiohttp.WSMsgType.BINARY
+        )
+
+        text_response = self.async_run_with_timeout(self.ws_connection.receive())
+        binary_response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual("pong", text_response.data)
+        self.assertEqual(b"\x01\x02", binary_response.data)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
@@ -1,8 +1,9 @@
 import asyncio
 import json
 import unittest
+from copy import copy
 from typing import Awaitable, Optional
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 from aioresponses import aioresponses
@@ -100,3 +101,117 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_does_not_copy_requests_with_copy_on_write_processors(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class PreProcessor(RESTPreProcessorBase):
+            copy_on_write = True
+
+            async def pre_process(self, request: RESTRequest) -> RESTRequest:
+                return request
+
+        class AuthDummy(AuthBase):
+            copy_on_write = True
+
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request = copy(request)
+                request.params = {**request.params, "signature": "sig"}
+                request.headers = {**request.headers, "authenticated": "true"}
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                return request
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection, throttler=AsyncThrottler(rate_limits=[]), rest_pre_processors=[PreProcessor()], auth=AuthDummy()
+        )
+        headers = {"Content-Type": "application/json"}
+        req = RESTRequest(
+            method=RESTMethod.POST, url=url, params={"one": 1}, headers=headers, is_auth_required=True
+        )
+
+        with patch("hummingbot.core.web_assistant.rest_assistant.deepcopy") as deepcopy_mock:
+            self.async_run_with_timeout(assistant.call(req))
+
+        deepcopy_mock.assert_not_called()
+        self.assertEqual({"one": 1, "signature": "sig"}, call_request.params)
+        self.assertEqual({"Content-Type": "application/json", "authenticated": "true"}, call_request.headers)
+        self.assertEqual({"one": 1}, req.params)
+        self.assertEqual({"Content-Type": "application/json"}, req.headers)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_copies_requests_for_auth_modifying_them(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "sig"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                return request
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        req = RESTRequest(method=RESTMethod.GET, url=url, params={"one": 1}, headers={}, is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual({"one": 1, "signature": "sig"}, call_request.params)
+        self.assertEqual({"Content-Type": "application/x-www-form-urlencoded"}, call_request.headers)
+        self.assertEqual({"one": 1}, req.params)
+        self.assertEqual({}, req.headers)
+
+    def test_execute_request_gives_each_request_its_own_static_headers(self):
+        class AuthDummy(AuthBase):
+            copy_on_write = True
+
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                # Wrongly modifies the headers in place
+                request.headers["authenticated"] = "true"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                return request
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        response = MagicMock(status=200, json=AsyncMock(return_value={}))
+        call_requests = []
+
+        async def register_request_and_return(request: RESTRequest):
+            call_requests.append(request)
+            return response
+
+        with patch.object(connection, "call", side_effect=register_request_and_return):
+            self.async_run_with_timeout(assistant.execute_request(
+                url="https://www.test.com/url", throttler_limit_id="limit_id", is_auth_required=True))
+            self.async_run_with_timeout(assistant.execute_request(
+                url="https://www.test.com/url", throttler_limit_id="limit_id"))
+
+        self.assertEqual({"Content-Type": "application/x-www-form-urlencoded", "authenticated": "true"},
+                         call_requests[0].headers)
+        self.assertEqual({"Content-Type": "application/x-www-form-urlencoded"}, call_requests[1].headers)
+        self.assertEqual({"Content-Type": "application/x-www-form-urlencoded"},
+                         RESTAssistant._STATIC_HEADERS[RESTMethod.GET])
+        with self.assertRaises(TypeError):
+            RESTAssistant._STATIC_HEADERS[RESTMethod.GET]["authenticated"] = "true"
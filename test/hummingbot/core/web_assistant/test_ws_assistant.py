@@ -69,8 +69,7 @@ class WSAssistantTest(unittest.TestCase):
 
         sent_request = sent_requests[0]
 
-        self.assertNotEqual(id(request), id(sent_request))  # has been cloned
-        self.assertEqual(request, sent_request)
+        self.assertIs(request, sent_request)  # nothing can modify it, so it is not cloned
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
     def test_send_pre_processes(self, send_mock):
@@ -93,6 +92,7 @@ class WSAssistantTest(unittest.TestCase):
         expected = {"one": 1, "two": 2}
 
         self.assertEqual(expected, sent_request.payload)
+        self.assertEqual({"one": 1}, request.payload)  # cloned before being pre-processed
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
     def test_subscribe(self, send_mock):
@@ -107,8 +107,7 @@ class WSAssistantTest(unittest.TestCase):
 
         sent_request = sent_requests[0]
 
-        self.assertNotEqual(id(request), id(sent_request))  # has been cloned
-        self.assertEqual(request, sent_request)
+        self.assertIs(request, sent_request)  # nothing can modify it, so it is not cloned
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
     def test_ws_assistant_authenticates(self, send_mock):
@@ -200,3 +199,26 @@ class WSAssistantTest(unittest.TestCase):
 
         with self.assertRaises(StopAsyncIteration):
             self.async_run_with_timeout(iter_messages_iterator.__anext__())
+
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
+    def test_send_does_not_clone_requests_for_copy_on_write_auth(self, send_mock):
+        class Auth(AuthBase):
+            copy_on_write = True
+
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                pass
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                return WSJSONRequest({**request.payload, "authenticated": True}, is_auth_required=True)
+
+        ws_assistant = WSAssistant(connection=self.ws_connection, auth=Auth())
+        sent_requests = []
+        send_mock.side_effect = lambda r: sent_requests.append(r)
+        auth_req = WSJSONRequest({"one": 1}, is_auth_required=True)
+
+        with patch("hummingbot.core.web_assistant.ws_assistant.deepcopy") as deepcopy_mock:
+            self.async_run_with_timeout(ws_assistant.send(auth_req))
+
+        deepcopy_mock.assert_not_called()
+        self.assertEqual({"one": 1, "authenticated": True}, sent_requests[0].payload)
+        self.assertEqual({"one": 1}, auth_req.payload)
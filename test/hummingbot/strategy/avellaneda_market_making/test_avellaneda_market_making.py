@@ -503,6 +503,21 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
                 OrderType.LIMIT
             ))
 
+    def test_trading_intensity_created_with_configured_fit_options(self):
+        config_settings = self.get_default_map()
+        config_settings["trading_intensity_fit_method"] = "log_linear"
+        config_settings["trading_intensity_refit_interval"] = "10"
+        strategy = AvellanedaMarketMakingStrategy()
+        strategy.init_params(
+            config_map=ClientConfigAdapter(AvellanedaMarketMakingConfigMap(**config_settings)),
+            market_info=self.market_info,
+        )
+
+        strategy.get_config_map_indicators()
+
+        self.assertEqual("log_linear", strategy.trading_intensity.fit_method)
+        self.assertEqual(10, strategy.trading_intensity.refit_interval)
+
     def test_all_markets_ready(self):
         self.assertTrue(self.strategy.all_markets_ready())
 
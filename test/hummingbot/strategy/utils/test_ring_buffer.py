@@ -107,3 +107,51 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_numpy_view_is_contiguous_and_read_only(self):
+        buffer = RingBuffer(4)
+
+        for i in range(6):
+            buffer.add_value(i)
+
+        view = buffer.get_as_numpy_view()
+        self.assertTrue(np.array_equal(view, np.array([2, 3, 4, 5])))
+        self.assertTrue(view.flags.c_contiguous)
+        self.assertFalse(view.flags.writeable)
+        self.assertEqual(4, buffer.size)
+
+    def test_window_longer_than_int16_range(self):
+        length = 40000
+        buffer = RingBuffer(length)
+
+        for i in range(length + 5):
+            buffer.add_value(i)
+
+        self.assertEqual(5, buffer.get_as_numpy_array()[0])
+        self.assertEqual(length + 4, buffer.get_last_value())
+
+    def test_running_statistics_match_numpy(self):
+        np.random.seed(3141592653)
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 5 + 7)
+
+        for sample in samples:
+            self.buffer.add_value(sample)
+            data = self.buffer.get_as_numpy_array()
+            self.assertAlmostEqual(np.sum(data), self.buffer.sum_value, 6)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.mean(data), self.buffer.mean_value, 8)
+                self.assertAlmostEqual(np.var(data), self.buffer.variance, 6)
+                self.assertAlmostEqual(np.std(data), self.buffer.std_dev, 6)
+
+    def test_statistics_with_non_finite_values(self):
+        buffer = RingBuffer(3)
+        for value in [1, np.nan, 2]:
+            buffer.add_value(value)
+        self.assertTrue(np.isnan(buffer.mean_value))
+
+        buffer.add_value(3)
+        self.assertTrue(np.isnan(buffer.mean_value))
+
+        buffer.add_value(4)
+        self.assertEqual(3, buffer.mean_value)
+        self.assertEqual(9, buffer.sum_value)
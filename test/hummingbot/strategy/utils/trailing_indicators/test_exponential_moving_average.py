@@ -0,0 +1,30 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+    BUFFER_LENGTH = 20
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_matches_pandas_exponentially_weighted_mean_of_window(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 3 + 5)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for sample in samples:
+            indicator.add_sample(sample)
+            window = indicator._sampling_buffer.get_as_numpy_array()
+            expected = pd.Series(window).ewm(span=self.BUFFER_LENGTH, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, 6)
+
+    def test_processing_length_must_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, 2)
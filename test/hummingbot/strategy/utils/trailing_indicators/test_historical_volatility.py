@@ -66,3 +66,16 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_incremental_volatility_matches_full_window_calculation(self):
+        returns = np.random.normal(0, 0.01, 256)
+        samples = [100]
+        for r in returns:
+            samples.append(samples[-1] * np.exp(r))
+        indicator = HistoricalVolatilityIndicator(30, 1)
+
+        for sample in samples[1:]:
+            indicator.add_sample(sample)
+            window = indicator._sampling_buffer.get_as_numpy_array()
+            expected = np.sqrt(np.nan_to_num(np.var(np.diff(np.log(window))))) if window.size > 1 else 0
+            self.assertAlmostEqual(expected, indicator.current_value, 8)
@@ -20,3 +20,13 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_incremental_volatility_matches_full_window_calculation(self):
+        samples = np.random.normal(100, 10, 257)
+        indicator = InstantVolatilityIndicator(30, 1)
+
+        for sample in samples:
+            indicator.add_sample(sample)
+            window = indicator._sampling_buffer.get_as_numpy_array()
+            expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected, indicator.current_value, 6)
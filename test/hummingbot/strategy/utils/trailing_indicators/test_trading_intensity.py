@@ -259,3 +259,93 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_calculate_trading_intensity_deterministic_log_linear_fit(self):
+        last_price = 1
+        trade_price_levels = [2, 3, 4, 5]
+        a = 2
+        b = 0.1
+        timestamp = self.start_timestamp
+
+        trading_intensity_indicator = TradingIntensityIndicator(
+            OrderBook(), self.price_delegate, 1, fit_method="log_linear")
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+
+        timestamp += 1
+
+        for p in trade_price_levels:
+            new_trade = OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=p,
+                amount=a * np.exp(-b * (p - last_price)),
+                type=TradeType.SELL,
+            )
+            trading_intensity_indicator.register_trade(new_trade)
+
+        trading_intensity_indicator.calculate(timestamp)
+        alpha, kappa = trading_intensity_indicator.current_value
+
+        self.assertAlmostEqual(a, alpha, 10)
+        self.assertAlmostEqual(b, kappa, 10)
+
+    def test_invalid_fit_method_raises(self):
+        with self.assertRaises(ValueError):
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_method="unknown")
+
+    def test_trades_matched_with_latest_quote_before_them_and_older_samples_dropped(self):
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2, fit_method="log_linear")
+        indicator.last_quotes = [{"timestamp": timestamp + 1, "price": 99}, {"timestamp": timestamp, "price": 98}]
+
+        for trade_timestamp, price in [(timestamp + 1, 100), (timestamp + 2, 101), (timestamp + 2, 102)]:
+            indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                         timestamp=trade_timestamp,
+                                                         price=price,
+                                                         amount=1,
+                                                         type=TradeType.BUY))
+        indicator.calculate(timestamp + 2)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        # Only the quote matched with the latest trades and the quotes after it are kept
+        self.assertEqual([timestamp + 2, timestamp + 1], [quote["timestamp"] for quote in indicator.last_quotes])
+        self.assertNotEqual((0, 0), indicator.current_value)
+
+        indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                     timestamp=timestamp + 3,
+                                                     price=103,
+                                                     amount=1,
+                                                     type=TradeType.BUY))
+        indicator.calculate(timestamp + 3)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertEqual([timestamp + 3, timestamp + 2], [quote["timestamp"] for quote in indicator.last_quotes])
+
+    def test_refit_throttled_by_refit_interval(self):
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1,
+                                              fit_method="log_linear", refit_interval=10)
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+
+        for price, amount in [(2, 2), (3, 1)]:
+            indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                         timestamp=timestamp + 1,
+                                                         price=price,
+                                                         amount=amount,
+                                                         type=TradeType.SELL))
+        indicator.calculate(timestamp + 1)
+        first_value = indicator.current_value
+
+        for price, amount in [(2, 1), (3, 2)]:
+            indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                         timestamp=timestamp + 2,
+                                                         price=price,
+                                                         amount=amount,
+                                                         type=TradeType.SELL))
+        indicator.calculate(timestamp + 2)
+
+        self.assertEqual(first_value, indicator.current_value)
+
+        indicator.calculate(timestamp + 11)
+
+        self.assertNotEqual(first_value, indicator.current_value)